@@ -0,0 +1,28 @@
+"""
+Shared Rich console
+"""
+
+import os
+import sys
+
+_console = None
+
+
+def _is_plain_output() -> bool:
+    """True when output goes to a pipe or CI log rather than a person"""
+    return not sys.stdout.isatty() or bool(
+        os.environ.get("NO_COLOR") or os.environ.get("CI")
+    )
+
+
+def get_console():
+    """Return the shared Console, creating it on first use"""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        # Markup is still parsed so tags are stripped, but plain output skips
+        # the syntax highlighter and colour handling
+        plain = _is_plain_output()
+        _console = Console(highlight=not plain, no_color=plain)
+    return _console
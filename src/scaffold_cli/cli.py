@@ -2,51 +2,73 @@
 Main CLI entry point
 """
 
+import sys
 import typer
-from rich.console import Console
-from rich.table import Table
+from functools import lru_cache
 from typing import Optional
-from rich.panel import Panel
-import sys
-import platform
 from pathlib import Path
 
-from .core.orchestrator import ProjectOrchestrator
-from .core.project_types import PROJECTS
-from .validators.dependencies import DependencyValidator
-from .commands.init import InitCommand
+from ._console import get_console
 
 app = typer.Typer(
     name="scaffold",
-    help="""
-    🚀 Scaffold CLI - Modern Project Generator
-    
-    Quickly create production-ready projects with best practices built-in.
-    Supports React, Vue, Next.js, Django, FastAPI, Express, and more!
-    
-    Examples:
-    
-      $ scaffold new my-app
-      $ scaffold new my-fullstack --monorepo
-      $ scaffold list
-      $ scaffold info
-    
-    Documentation: https://github.com/Njau-dev/scaffold-cli#readme
-    """,
+    help="🚀 Scaffold CLI - Modern Project Generator",
+    epilog=(
+        "[bold]Examples:[/bold]\n\n"
+        "  $ scaffold new my-app\n\n"
+        "  $ scaffold new my-fullstack --monorepo\n\n"
+        "  $ scaffold list\n\n"
+        "  $ scaffold info\n\n"
+        "Documentation: https://github.com/Njau-dev/scaffold-cli#readme"
+    ),
     add_completion=False,
     rich_markup_mode="rich",
     no_args_is_help=True,
 )
-console = Console()
 
 # Version
 __version__ = "0.1.0"
 
+COMMANDS = ("new", "init", "info", "list", "version")
+
+
+def _sniff_subcommand() -> Optional[str]:
+    """
+    Peek at argv to find the subcommand being invoked
+
+    Returns None when every command must be registered (help, no args,
+    or when the app is not running as the `scaffold` executable).
+    """
+    if not Path(sys.argv[0]).name.startswith("scaffold"):
+        return None
+    if len(sys.argv) >= 2 and sys.argv[1] in COMMANDS:
+        return sys.argv[1]
+    return None
+
+
+_INVOKED = _sniff_subcommand()
 
-@app.command()
+
+def _command(*args, **kwargs):
+    """Register a command only if it can be the one being invoked"""
+
+    def decorator(func):
+        if _INVOKED in (None, func.__name__):
+            return app.command(*args, **kwargs)(func)
+        return func
+
+    return decorator
+
+
+@_command()
 def new(
     name: Optional[str] = typer.Argument(None, help="Project name"),
     monorepo: bool = typer.Option(False, "--monorepo", "-m", help="Create as monorepo"),
+    use_cargo: bool = typer.Option(
+        False,
+        "--use-cargo",
+        help="Run `cargo new` for Rust templates instead of the bundled skeleton",
+    ),
 ):
     """
     Create a new project
@@ -57,7 +79,10 @@ def new(
 
         scaffold new my-fullstack --monorepo
     """
-    orchestrator = ProjectOrchestrator()
+    from .core.orchestrator import ProjectOrchestrator
+
+    console = get_console()
+    orchestrator = ProjectOrchestrator(use_cargo=use_cargo)
     success = orchestrator.create_project(name=name, monorepo=monorepo)
 
     if not success:
@@ -66,7 +91,7 @@ def new(
     console.print("\n[green]✨ Ready to build something awesome![/green]")
 
 
-@app.command()
+@_command()
 def init(
     path: Optional[str] = typer.Argument(
         None, help="Project directory (defaults to current)"
@@ -88,6 +113,9 @@ def init(
 
         scaffold init ./my-project       # Initialize specific project
     """
+    from .commands.init import InitCommand
+
+    console = get_console()
     project_path = Path(path) if path else Path.cwd()
 
     if not project_path.exists():
@@ -101,33 +129,10 @@ def init(
         raise typer.Exit(1)
 
 
-@app.command()
-def info():
-    """Show detailed CLI information"""
-
-    # Header
-    console.print()
-    console.print(
-        Panel.fit(
-            f"[bold cyan]Scaffold CLI[/bold cyan] [dim]v{__version__}[/dim]\n"
-            "[dim]A modern project scaffolding tool for developers[/dim]",
-            border_style="cyan",
-        )
-    )
-
-    # Features
-    console.print("\n[bold]✨ Features:[/bold]")
-    console.print("  • 🎨 Interactive project setup with arrow-key navigation")
-    console.print(
-        "  • 📦 Multiple tech stacks (React, Vue, Next.js, Django, FastAPI, Express)"
-    )
-    console.print("  • 🗂️  Full-stack monorepo support")
-    console.print("  • ✅ Automatic dependency validation")
-    console.print("  • 🔧 Git repository initialization")
-    console.print("  • 🚀 Zero configuration required")
-
-    # Supported Technologies
-    console.print("\n[bold]🛠️  Supported Technologies:[/bold]")
+@lru_cache(maxsize=1)
+def _supported_tech_table():
+    """Build the static supported-technologies table shown by info"""
+    from rich.table import Table
 
     table = Table(show_header=True, header_style="bold cyan", box=None)
     table.add_column("Category", style="cyan", no_wrap=True)
@@ -138,89 +143,151 @@ def info():
     table.add_row("Frameworks", "Django")
     table.add_row("Monorepo", "Any frontend + backend combination")
 
-    console.print(table)
+    return table
 
-    # Quick Start
-    console.print("\n[bold]🚀 Quick Start:[/bold]")
-    console.print(
-        "  [cyan]scaffold new[/cyan] [dim]<project-name>[/dim]          Create a new project"
-    )
-    console.print(
-        "  [cyan]scaffold new[/cyan] [dim]<project-name>[/dim] [yellow]--monorepo[/yellow]  Create a monorepo"
-    )
-    console.print(
-        "  [cyan]scaffold list[/cyan]                        List all templates"
+
+@lru_cache(maxsize=None)
+def _category_rows(category: str) -> str:
+    """Format the template rows for one category shown by list"""
+    from .core.project_types import PROJECTS
+
+    projects = PROJECTS[category]
+    max_name = max(len("Template") - 2, *(len(p.name) for p in projects))
+    max_display = max(len("Name"), *(len(p.display_name) for p in projects))
+
+    rows = [
+        f"  [bold]{'Template'.ljust(max_name + 2)}  {'Name'.ljust(max_display)}"
+        "  Requirements[/bold]"
+    ]
+    for p in projects:
+        rows.append(
+            f"  [cyan]→ {p.name.ljust(max_name)}[/cyan]"
+            f"  {p.display_name.ljust(max_display)}"
+            f"  [dim]{', '.join(p.requires)}[/dim]"
+        )
+
+    return "\n".join(rows)
+
+
+@lru_cache(maxsize=1)
+def _system_info() -> str:
+    """Build the system information text shown by version"""
+    import platform
+
+    return f"""[dim]Python: {sys.version.split()[0]}
+Platform: {platform.system()} {platform.release()}
+Architecture: {platform.machine()}[/dim]"""
+
+
+@_command()
+def info():
+    """Show detailed CLI information"""
+    from rich.console import Group
+    from rich.panel import Panel
+
+    console = get_console()
+
+    # Header
+    header = Panel.fit(
+        f"[bold cyan]Scaffold CLI[/bold cyan] [dim]v{__version__}[/dim]\n"
+        "[dim]A modern project scaffolding tool for developers[/dim]",
+        border_style="cyan",
     )
 
-    # More Commands
-    console.print("\n[bold]📚 More Commands:[/bold]")
-    console.print("  [cyan]scaffold --help[/cyan]     Show detailed help")
-    console.print("  [cyan]scaffold version[/cyan]    Show version")
+    # Features
+    features = "\n".join(
+        [
+            "\n[bold]✨ Features:[/bold]",
+            "  • 🎨 Interactive project setup with arrow-key navigation",
+            "  • 📦 Multiple tech stacks (React, Vue, Next.js, Django, FastAPI, Express)",
+            "  • 🗂️  Full-stack monorepo support",
+            "  • ✅ Automatic dependency validation",
+            "  • 🔧 Git repository initialization",
+            "  • 🚀 Zero configuration required",
+            "\n[bold]🛠️  Supported Technologies:[/bold]",
+        ]
+    )
 
-    # Links
-    console.print("\n[bold]🔗 Links:[/bold]")
-    console.print("  GitHub: [blue]https://github.com/Njau-dev/scaffold-cli[/blue]")
-    console.print(
-        "  Issues: [blue]https://github.com/Njau-dev/scaffold-cli/issues[/blue]"
+    # Quick Start, More Commands, Links
+    footer = "\n".join(
+        [
+            "\n[bold]🚀 Quick Start:[/bold]",
+            "  [cyan]scaffold new[/cyan] [dim]<project-name>[/dim]          Create a new project",
+            "  [cyan]scaffold new[/cyan] [dim]<project-name>[/dim] [yellow]--monorepo[/yellow]  Create a monorepo",
+            "  [cyan]scaffold list[/cyan]                        List all templates",
+            "\n[bold]📚 More Commands:[/bold]",
+            "  [cyan]scaffold --help[/cyan]     Show detailed help",
+            "  [cyan]scaffold version[/cyan]    Show version",
+            "\n[bold]🔗 Links:[/bold]",
+            "  GitHub: [blue]https://github.com/Njau-dev/scaffold-cli[/blue]",
+            "  Issues: [blue]https://github.com/Njau-dev/scaffold-cli/issues[/blue]",
+            "",
+        ]
     )
 
-    console.print()
+    # Render everything, then write it out in one go
+    with console.capture() as capture:
+        console.print()
+        console.print(header)
+        console.print(Group(features, _supported_tech_table(), footer))
+    sys.stdout.write(capture.get())
 
 
-@app.command()
+@_command()
 def list():
     """List all available project templates"""
+    from rich.panel import Panel
 
-    console.print()
-    console.print(
-        Panel.fit(
-            "[bold cyan]📋 Available Project Templates[/bold cyan]\n"
-            "[dim]Use 'scaffold new' to create a project with any template[/dim]",
-            border_style="cyan",
-        )
+    from .core.project_types import PROJECTS
+
+    console = get_console()
+    header = Panel.fit(
+        "[bold cyan]📋 Available Project Templates[/bold cyan]\n"
+        "[dim]Use 'scaffold new' to create a project with any template[/dim]",
+        border_style="cyan",
     )
 
     total_templates = 0
+    lines = []
 
     for category, projects in PROJECTS.items():
-        console.print(f"\n[bold cyan]{'─' * 60}[/bold cyan]")
-        console.print(f"[bold white]{category.upper()}[/bold white]\n")
-
-        table = Table(show_header=True, header_style="bold", box=None, padding=(0, 2))
-        table.add_column("Template", style="cyan", no_wrap=True)
-        table.add_column("Name", style="white")
-        table.add_column("Requirements", style="dim")
-
-        for project in projects:
-            table.add_row(
-                f"→ {project.name}", project.display_name, ", ".join(project.requires)
-            )
-            total_templates += 1
-
-        console.print(table)
-
-    console.print(f"\n[dim]Total: {total_templates} templates available[/dim]")
-    console.print("\n[bold]Examples:[/bold]")
-    console.print(
+        lines.append(f"\n[bold cyan]{'─' * 60}[/bold cyan]")
+        lines.append(f"[bold white]{category.upper()}[/bold white]\n")
+        lines.append(_category_rows(category))
+        total_templates += len(projects)
+
+    lines.append(f"\n[dim]Total: {total_templates} templates available[/dim]")
+    lines.append("\n[bold]Examples:[/bold]")
+    lines.append(
         "  [cyan]scaffold new my-app[/cyan]              [dim]# Create a single project[/dim]"
     )
-    console.print(
+    lines.append(
         "  [cyan]scaffold new my-app --monorepo[/cyan]   [dim]# Create a monorepo[/dim]"
     )
-    console.print()
+    lines.append("")
+
+    # Render everything, then write it out in one go
+    with console.capture() as capture:
+        console.print()
+        console.print(header)
+        console.print("\n".join(lines))
+    sys.stdout.write(capture.get())
 
 
-@app.command()
+@_command()
 def version():
     """Show version and system information"""
+    from rich.panel import Panel
+
+    from .validators.dependencies import DependencyValidator
+
+    console = get_console()
 
     # Version info
     version_info = f"[bold cyan]Scaffold CLI[/bold cyan] [white]v{__version__}[/white]"
 
     # System info
-    system_info = f"""[dim]Python: {sys.version.split()[0]}
-Platform: {platform.system()} {platform.release()}
-Architecture: {platform.machine()}[/dim]"""
+    system_info = _system_info()
 
     console.print()
     console.print(
@@ -232,7 +299,7 @@ Architecture: {platform.machine()}[/dim]"""
     validator = DependencyValidator()
 
     tools_to_check = ["node", "npm", "python3", "git"]
-    all_valid, results = validator.validate(tools_to_check)
+    all_valid, results = validator.validate(tools_to_check, need_versions=True)
 
     for tool in tools_to_check:
         if tool in results and results[tool]["available"]:
@@ -244,12 +311,6 @@ Architecture: {platform.machine()}[/dim]"""
     console.print()
 
 
-@app.command()
-def test():
-    """Test command"""
-    console.print("Test command")
-
-
 @app.callback()
 def main():
     """
@@ -2,20 +2,36 @@
 Scaffold init command - initialize existing projects
 """
 
+import os
+from functools import cached_property
 from pathlib import Path
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-import questionary
 
-from ..detectors.project_detector import ProjectDetector
-from ..generators.env_generator import EnvGenerator
-from ..generators.docker_generator import DockerGenerator
-from ..validators.dependencies import DependencyValidator
-from ..utils.command_runner import CommandRunner
-from ..utils.git import GitManager
+from .._console import get_console
+from ..utils.lazy import lazy_attrs
 
-console = Console()
+__getattr__, _load = lazy_attrs(
+    __name__,
+    {
+        "ProjectDetector": "..detectors.project_detector",
+        "EnvGenerator": "..generators.env_generator",
+        "DockerGenerator": "..generators.docker_generator",
+        "DependencyValidator": "..validators.dependencies",
+        "CommandRunner": "..utils.command_runner",
+        "GitManager": "..utils.git",
+    },
+)
+
+_questionary = None
+
+
+def _q():
+    """Import questionary on first prompt and reuse it afterwards"""
+    global _questionary
+    if _questionary is None:
+        import questionary
+
+        _questionary = questionary
+    return _questionary
 
 
 class InitCommand:
@@ -23,16 +39,35 @@ class InitCommand:
 
     def __init__(self, project_path: Path = None):
         self.project_path = project_path or Path.cwd()
-        self.detector = ProjectDetector(self.project_path)
-        self.validator = DependencyValidator()
-        self.runner = CommandRunner()
-        self.git_manager = GitManager()
+        self.console = get_console()
+
+    @cached_property
+    def detector(self):
+        """Project detector, created on first use"""
+        return _load("ProjectDetector")(self.project_path)
+
+    @cached_property
+    def validator(self):
+        """Dependency validator, created on first use"""
+        return _load("DependencyValidator")()
+
+    @cached_property
+    def runner(self):
+        """Command runner, created on first use"""
+        return _load("CommandRunner")()
+
+    @cached_property
+    def git_manager(self):
+        """Git manager, created on first use"""
+        return _load("GitManager")()
 
     def run(self):
         """Main initialization workflow"""
+        from rich.panel import Panel
+
         # Welcome
-        console.print()
-        console.print(
+        self.console.print()
+        self.console.print(
             Panel.fit(
                 "[bold cyan]🔍 Scaffold Init[/bold cyan]\n"
                 "[dim]Analyze and set up your development environment[/dim]",
@@ -41,12 +76,12 @@ class InitCommand:
         )
 
         # Step 1: Detect project
-        console.print("\n[yellow]→ Analyzing project...[/yellow]")
+        self.console.print("\n[yellow]→ Analyzing project...[/yellow]")
         project = self.detector.detect()
 
         if project.type == "unknown":
-            console.print("[red]✗ Could not detect project type[/red]")
-            console.print(
+            self.console.print("[red]✗ Could not detect project type[/red]")
+            self.console.print(
                 "[dim]This directory doesn't appear to be a recognized project[/dim]"
             )
             return False
@@ -54,44 +89,39 @@ class InitCommand:
         # Show detection results
         self._display_project_info(project)
 
-        # Step 2: Validate dependencies
-        console.print("\n[yellow]→ Checking system dependencies...[/yellow]")
-        self._check_system_dependencies(project)
+        # Step 2: Choose which setup steps to run
+        selected = self._select_steps(project)
 
-        # Step 3: Install project dependencies
-        if not project.dependencies_installed:
-            if questionary.confirm(
-                "\n📦 Install project dependencies?", default=True
-            ).ask():
-                self._install_dependencies(project)
+        # Step 3: Validate the tools the selected steps need
+        self._check_system_dependencies(project, selected)
 
-        # Step 4: Initialize git if needed
-        if not project.has_git:
-            if questionary.confirm(
-                "\n🔧 Initialize git repository?", default=True
-            ).ask():
-                self.git_manager.init_repository(
-                    self.project_path, f"Initial commit - {project.type} project"
-                )
+        # Step 4: Install project dependencies
+        if "deps" in selected:
+            self._install_dependencies(project)
+
+        # Step 5: Initialize git if needed
+        if "git" in selected:
+            self.git_manager.init_repository(
+                self.project_path, f"Initial commit - {project.type} project"
+            )
 
-        # Step 5: Environment setup
-        if questionary.confirm(
-            "\n🔧 Set up environment configuration?", default=True
-        ).ask():
+        # Step 6: Environment setup
+        if "env" in selected:
             self._setup_environment(project)
 
-        # Step 6: Docker setup
-        if questionary.confirm("\n🐳 Set up Docker?", default=True).ask():
+        # Step 7: Docker setup
+        if "docker" in selected:
             self._setup_docker(project)
 
-        # Step 7: Show summary
+        # Step 8: Show summary
         self._show_summary(project)
 
         return True
 
     def _display_project_info(self, project):
         """Display detected project information"""
-        console.print("\n[green]✓ Project detected[/green]\n")
+        from rich.console import Group
+        from rich.table import Table
 
         table = Table(show_header=False, box=None, padding=(0, 2))
         table.add_column("Property", style="cyan")
@@ -141,35 +171,71 @@ class InitCommand:
             ),
         )
 
-        console.print(table)
+        self.console.print(Group("\n[green]✓ Project detected[/green]\n", table))
+
+    def _select_steps(self, project) -> set:
+        """Ask once which setup steps to run"""
+        questionary = _q()
+        choices = []
+
+        if not project.dependencies_installed:
+            choices.append(
+                questionary.Choice(
+                    "📦 Install project dependencies", value="deps", checked=True
+                )
+            )
+
+        if not project.has_git:
+            choices.append(
+                questionary.Choice(
+                    "🔧 Initialize git repository", value="git", checked=True
+                )
+            )
+
+        choices.append(
+            questionary.Choice(
+                "🔧 Set up environment configuration", value="env", checked=True
+            )
+        )
+        choices.append(
+            questionary.Choice("🐳 Set up Docker", value="docker", checked=True)
+        )
+
+        selected = questionary.checkbox("\nSelect steps to run:", choices=choices).ask()
+        return set(selected or ())
 
-    def _check_system_dependencies(self, project):
-        """Check required system dependencies"""
+    def _check_system_dependencies(self, project, selected):
+        """Check the system dependencies needed by the selected steps"""
         required_tools = []
 
         # Determine required tools
-        if project.package_manager in ["npm", "yarn", "pnpm"]:
-            required_tools.extend(["node", "npm"])
-        elif project.package_manager == "pip":
-            required_tools.extend(["python3", "pip"])
+        if "deps" in selected:
+            if project.package_manager in ["npm", "yarn", "pnpm"]:
+                required_tools.extend(["node", "npm"])
+            elif project.package_manager == "pip":
+                required_tools.extend(["python3", "pip"])
 
-        if not project.has_git:
+        if "git" in selected:
             required_tools.append("git")
 
+        if not required_tools:
+            return
+
         # Validate
+        self.console.print("\n[yellow]→ Checking system dependencies...[/yellow]")
         all_valid, results = self.validator.validate(required_tools)
         self.validator.display_results(results, show_all=True)
 
         if not all_valid:
-            console.print("\n[yellow]⚠ Some dependencies are missing[/yellow]")
+            self.console.print("\n[yellow]⚠ Some dependencies are missing[/yellow]")
             self.validator.show_installation_hints(results)
 
-            if not questionary.confirm("Continue anyway?", default=False).ask():
+            if not _q().confirm("Continue anyway?", default=False).ask():
                 raise SystemExit(1)
 
     def _install_dependencies(self, project):
         """Install project dependencies"""
-        console.print("\n[cyan]→ Installing dependencies...[/cyan]")
+        self.console.print("\n[cyan]→ Installing dependencies...[/cyan]")
 
         success = False
         pm = project.package_manager
@@ -210,43 +276,49 @@ class InitCommand:
                 show_output=False,
             )
         else:
-            console.print(
+            self.console.print(
                 f"[yellow]⚠ Unknown package manager: {project.package_manager}[/yellow]"
             )
             success = False
 
         if success:
-            console.print("[green]✓ Dependencies installed successfully[/green]")
+            self.console.print("[green]✓ Dependencies installed successfully[/green]")
         else:
-            console.print("[yellow]⚠ Some dependencies failed to install[/yellow]")
+            self.console.print("[yellow]⚠ Some dependencies failed to install[/yellow]")
 
     def _setup_environment(self, project):
         """Interactive environment setup"""
-        env_gen = EnvGenerator(self.project_path, project.type, project.name)
+        env_gen = _load("EnvGenerator")(self.project_path, project.type, project.name)
 
         if env_gen.interactive_setup():
             env_gen.generate_files()
 
             summary = env_gen.get_summary()
-            console.print(f"\n[green]✓ Environment configured[/green]")
-            console.print(
+            self.console.print(f"\n[green]✓ Environment configured[/green]")
+            self.console.print(
                 f"[dim]  → {summary['total_vars']} variables configured[/dim]"
             )
             if summary["categories"]:
-                console.print(
+                self.console.print(
                     f"[dim]  → Services: {', '.join(summary['categories'])}[/dim]"
                 )
 
     def _setup_docker(self, project):
         """Set up Docker configuration"""
-        docker_gen = DockerGenerator(self.project_path, project.type, project.name)
+        docker_gen = _load("DockerGenerator")(
+            self.project_path, project.type, project.name
+        )
 
         # Ask about docker-compose vs just Dockerfile
         try:
-            setup_type = questionary.select(
-                "What would you like to set up?",
-                choices=["Dockerfile only", "Docker Compose (recommended)", "Both"],
-            ).ask()
+            setup_type = (
+                _q()
+                .select(
+                    "What would you like to set up?",
+                    choices=["Dockerfile only", "Docker Compose (recommended)", "Both"],
+                )
+                .ask()
+            )
         except Exception:
             setup_type = None
 
@@ -260,70 +332,80 @@ class InitCommand:
                 docker_gen.generate_nginx_config()
 
         if setup_type in ["Docker Compose (recommended)", "Both"]:
-            with_db = questionary.confirm(
-                "Include database in docker-compose?", default=False
-            ).ask()
+            with_db = (
+                _q().confirm("Include database in docker-compose?", default=False).ask()
+            )
             docker_gen.generate_docker_compose(with_database=with_db)
 
     def _show_summary(self, project):
         """Show initialization summary and next steps"""
-        console.print("\n" + "=" * 70)
-        console.print("[bold green]✨ Initialization Complete![/bold green]")
-        console.print("=" * 70)
+        # One directory listing answers every "was this file created?" check
+        with os.scandir(self.project_path) as entries:
+            present = {entry.name for entry in entries}
+        has_env_example = ".env.example" in present
+        has_dockerfile = "Dockerfile" in present
+
+        lines = [
+            "\n" + "=" * 70,
+            "[bold green]✨ Initialization Complete![/bold green]",
+            "=" * 70,
+        ]
 
         # What was set up
-        console.print("\n[bold]🎉 What was set up:[/bold]")
+        lines.append("\n[bold]🎉 What was set up:[/bold]")
 
         if not project.dependencies_installed:
-            console.print("  [green]✓[/green] Project dependencies installed")
+            lines.append("  [green]✓[/green] Project dependencies installed")
 
         if not project.has_git:
-            console.print("  [green]✓[/green] Git repository initialized")
+            lines.append("  [green]✓[/green] Git repository initialized")
 
-        if (self.project_path / ".env.example").exists():
-            console.print("  [green]✓[/green] Environment configuration created")
+        if has_env_example:
+            lines.append("  [green]✓[/green] Environment configuration created")
 
-        if (self.project_path / "Dockerfile").exists():
-            console.print("  [green]✓[/green] Docker configuration added")
+        if has_dockerfile:
+            lines.append("  [green]✓[/green] Docker configuration added")
 
         # Next steps
-        console.print("\n[bold]🚀 Next Steps:[/bold]")
+        lines.append("\n[bold]🚀 Next Steps:[/bold]")
 
         step = 1
 
         # Environment setup
-        if (self.project_path / ".env.example").exists():
-            console.print(f"\n  [bold cyan]{step}. Configure environment:[/bold cyan]")
-            console.print("     cp .env.example .env")
-            console.print("     # Edit .env with your actual values")
+        if has_env_example:
+            lines.append(f"\n  [bold cyan]{step}. Configure environment:[/bold cyan]")
+            lines.append("     cp .env.example .env")
+            lines.append("     # Edit .env with your actual values")
             step += 1
 
         # Start development
-        console.print(f"\n  [bold cyan]{step}. Start development:[/bold cyan]")
+        lines.append(f"\n  [bold cyan]{step}. Start development:[/bold cyan]")
         if project.package_manager == "npm":
-            console.print("     npm run dev")
+            lines.append("     npm run dev")
         elif project.package_manager == "pip":
             if project.type == "django":
-                console.print("     source venv/bin/activate")
-                console.print("     python manage.py runserver")
+                lines.append("     source venv/bin/activate")
+                lines.append("     python manage.py runserver")
             elif project.type == "fastapi":
-                console.print("     source venv/bin/activate")
-                console.print("     uvicorn main:app --reload")
+                lines.append("     source venv/bin/activate")
+                lines.append("     uvicorn main:app --reload")
         step += 1
 
         # Docker instructions
-        if (self.project_path / "Dockerfile").exists():
-            console.print(f"\n  [bold cyan]{step}. Or use Docker:[/bold cyan]")
+        if has_dockerfile:
+            lines.append(f"\n  [bold cyan]{step}. Or use Docker:[/bold cyan]")
 
-            if (self.project_path / "docker-compose.yml").exists():
-                console.print("     docker-compose up")
+            if "docker-compose.yml" in present:
+                lines.append("     docker-compose up")
             else:
-                console.print("     docker build -t {} .".format(project.name))
-                console.print("     docker run -p 8000:8000 {}".format(project.name))
+                lines.append("     docker build -t {} .".format(project.name))
+                lines.append("     docker run -p 8000:8000 {}".format(project.name))
 
         # Resources
-        console.print("\n[bold]📚 Resources:[/bold]")
-        console.print("  [cyan]scaffold --help[/cyan]     Show all commands")
-        console.print("  [cyan]scaffold list[/cyan]      View available templates")
+        lines.append("\n[bold]📚 Resources:[/bold]")
+        lines.append("  [cyan]scaffold --help[/cyan]     Show all commands")
+        lines.append("  [cyan]scaffold list[/cyan]      View available templates")
+
+        lines.append("\n[dim]Happy coding! 🎉[/dim]\n")
 
-        console.print("\n[dim]Happy coding! 🎉[/dim]\n")
+        self.console.print("\n".join(lines))
@@ -2,139 +2,146 @@
 Project installation logic
 """
 
-import subprocess
+import os
+import shutil
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
-from rich.console import Console
+from typing import Dict, List, Optional, Tuple
+from rich.text import Text
 
+from .._console import get_console
 from .project_types import ProjectConfig
-from ..utils.command_runner import CommandRunner
+from ..utils.command_runner import COMMAND_TIMEOUT, CommandRunner, _prepare
 
-console = Console()
+console = get_console()
+runner = CommandRunner()
 
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
 
-class Installer:
-    """Handles actual project creation"""
 
-    def __init__(self):
-        self.console = console
-        self.runner = CommandRunner()
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
 
-    def install(
-        self,
-        config: ProjectConfig,
-        project_name: str,
-        parent_dir: Optional[Path] = None,
-        skip_post_install: bool = False,
-    ) -> bool:
-        """
-        Install a project based on its configuration
 
-        Args:
-            config: Project configuration
-            project_name: Name of the project to create
-            parent_dir: Parent directory (defaults to current directory)
-            skip_post_install: Skip post-installation steps
+@lru_cache(maxsize=1)
+def _io_pool():
+    """Thread pool shared by template writes, created on first use"""
+    from concurrent.futures import ThreadPoolExecutor
 
-        Returns:
-            True if installation succeeded
-        """
-        if parent_dir is None:
-            parent_dir = Path.cwd()
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="scaffold-io")
 
-        project_path = parent_dir / project_name
 
-        # Handle custom installers
-        if config.command.startswith("custom:"):
-            return self._handle_custom_install(config, project_path)
+def _write_file(path: Path, data: bytes):
+    """Write one file with a single writev where available"""
+    fd = os.open(path, _WRITE_FLAGS, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            if hasattr(os, "writev"):
+                written = os.writev(fd, [view])
+            else:
+                written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
 
-        # Run the main installation command
-        console.print(
-            f"\n[bold cyan]📦 Creating {config.display_name} project...[/bold cyan]"
-        )
 
-        # Format the command with project name
-        command = config.command.format(name=project_name)
+def _write_files(project_path: Path, files: Dict[str, bytes]):
+    """
+    Write a batch of template files below project_path
 
-        # For interactive tools, show output. Otherwise use spinner.
-        success = self.runner.run(
-            command=command,
-            cwd=parent_dir,
-            description=f"Installing {config.display_name}",
-            show_output=config.interactive,
-        )
+    The directory tree is created up front with one os.makedirs per leaf
+    directory. The files have no ordering between them, so batches of more
+    than one are written concurrently on a small shared thread pool.
+    """
+    payloads = [(project_path / rel, content) for rel, content in files.items()]
 
-        if not success:
-            console.print(f"[red]✗ Failed to create project[/red]")
-            return False
+    dirs = {path.parent for path, _ in payloads}
+    for directory in dirs:
+        if not any(directory in other.parents for other in dirs):
+            os.makedirs(directory, exist_ok=True)
 
-        # Run post-install commands (unless skipped)
-        if config.post_install and not skip_post_install:
-            return self._run_post_install(config, project_path)
+    if len(payloads) < 2:
+        for path, data in payloads:
+            _write_file(path, data)
+        return
 
-        return True
+    # Consume the results so the first write error is raised here
+    for _ in _io_pool().map(lambda payload: _write_file(*payload), payloads):
+        pass
 
-    def _run_post_install(self, config: ProjectConfig, project_path: Path) -> bool:
-        """Run post-installation commands"""
-        console.print(f"\n[yellow]⚙️  Running post-install steps...[/yellow]")
 
-        for cmd in config.post_install:
-            # Change to project directory for post-install commands
-            success = self.runner.run(
-                command=cmd,
-                cwd=project_path,
-                description=f"Running: {cmd}",
-                show_output=False,
+@lru_cache(maxsize=None)
+def _load_skeleton(skeleton: str) -> Tuple[Tuple[str, Optional[bytes]], ...]:
+    """
+    Index a bundled skeleton from the data directory once
+
+    Only .tmpl files are read into memory; static files are listed with None
+    and copied straight from disk.
+    """
+    root = DATA_DIR / skeleton
+    return tuple(
+        sorted(
+            (
+                path.relative_to(root).as_posix(),
+                path.read_bytes() if path.suffix == ".tmpl" else None,
             )
+            for path in root.rglob("*")
+            if path.is_file()
+        )
+    )
 
-            if not success:
-                console.print(f"[yellow]⚠ Post-install step failed: {cmd}[/yellow]")
-                console.print("[dim]You may need to run this manually[/dim]")
-                # Don't fail the whole installation for post-install failures
 
-        return True
+def _render_skeleton(skeleton: str, substitutions: Dict[str, str]) -> Dict[str, bytes]:
+    """
+    Render the .tmpl files of a bundled skeleton as {relative path: content}
 
-    def _handle_custom_install(self, config: ProjectConfig, project_path: Path) -> bool:
-        """Handle custom installation types"""
-        custom_type = config.command.split(":")[1]
-
-        handlers = {
-            "fastapi": self._create_fastapi_project,
-            "flask": self._create_flask_project,
-            "django-drf": self._create_django_drf_project,
-            "express-ts": self._create_express_ts_project,
-            "go-gin": self._create_go_gin_project,
-            "go-fiber": self._create_go_fiber_project,
-            "go-echo": self._create_go_echo_project,
-            "rust-axum": self._create_rust_axum_project,
-            "rust-actix": self._create_rust_actix_project,
-            "python-cli-typer": self._create_python_cli_typer,
-            "python-cli-click": self._create_python_cli_click,
-            "node-cli": self._create_node_cli,
-            "node-cli-ts": self._create_node_cli_ts,
-            "go-cli-cobra": self._create_go_cli_cobra,
-            "rust-cli-clap": self._create_rust_cli_clap,
-        }
+    {{KEY}} placeholders are replaced and the .tmpl suffix is dropped.
+    """
+    files = {}
+    for rel, data in _load_skeleton(skeleton):
+        if data is None:
+            continue
+        for key, value in substitutions.items():
+            data = data.replace(b"{{%s}}" % key.encode(), value.encode())
+        files[rel.removesuffix(".tmpl")] = data
+    return files
 
-        handler = handlers.get(custom_type)
-        if handler:
-            return handler(project_path)
 
-        console.print(f"[red]Unknown custom installer: {custom_type}[/red]")
-        return False
+def _copy_skeleton(skeleton: str, project_path: Path, rendered: Dict[str, bytes]):
+    """
+    Materialize a bundled skeleton below project_path
+
+    Rendered files are written in one batch. Static files are copied with
+    shutil.copyfile, which lets the kernel copy them without a round trip
+    through userspace where supported.
+    """
+    _write_files(project_path, rendered)
 
-    def _create_fastapi_project(self, project_path: Path) -> bool:
-        """Create a minimal FastAPI project"""
-        console.print(f"\n[bold cyan]📦 Creating FastAPI project...[/bold cyan]")
+    root = DATA_DIR / skeleton
+    for rel, data in _load_skeleton(skeleton):
+        if data is not None or rel in rendered:
+            continue
+        dest = project_path / rel
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(root / rel, dest)
 
-        try:
-            # Create project structure
-            project_path.mkdir(parents=True, exist_ok=True)
 
-            # Create main.py
-            main_py = project_path / "main.py"
-            main_py.write_text(
-                '''"""
+@lru_cache(maxsize=None)
+def _styled(markup: str) -> Text:
+    """Parse a console markup string once and reuse the styled Text"""
+    return Text.from_markup(markup)
+
+
+def _append_cargo_deps(cargo_toml: Path, deps: bytes):
+    """Append dependency lines to a Cargo.toml ending in its [dependencies] table"""
+    with open(cargo_toml, "ab") as f:
+        f.write(deps)
+
+
+# Template bodies, encoded once at import. {{NAME}} is the project name.
+
+_FASTAPI_MAIN_PY = b'''"""
 FastAPI application
 """
 from fastapi import FastAPI
@@ -153,21 +160,13 @@ async def health():
     """Health check endpoint"""
     return {"status": "healthy"}
 '''
-            )
 
-            # Create requirements.txt
-            requirements = project_path / "requirements.txt"
-            requirements.write_text(
-                """fastapi==0.104.1
+_FASTAPI_REQUIREMENTS_TXT = b"""fastapi==0.104.1
 uvicorn[standard]==0.24.0
 pydantic==2.5.0
 """
-            )
 
-            # Create README.md
-            readme = project_path / "README.md"
-            readme.write_text(
-                f"""# {project_path.name}
+_FASTAPI_README_TMPL = b"""# {{NAME}}
 
 FastAPI project created with Scaffold CLI.
 
@@ -196,12 +195,8 @@ API Docs: http://127.0.0.1:8000/docs
 - `GET /` - Root endpoint
 - `GET /health` - Health check
 """
-            )
 
-            # Create .gitignore
-            gitignore = project_path / ".gitignore"
-            gitignore.write_text(
-                """__pycache__/
+_FASTAPI_GITIGNORE = b"""__pycache__/
 *.py[cod]
 *$py.class
 venv/
@@ -211,23 +206,8 @@ venv/
 .coverage
 *.log
 """
-            )
-
-            console.print(f"[green]✓ FastAPI project created successfully[/green]")
-            return True
 
-        except Exception as e:
-            console.print(f"[red]✗ Error creating FastAPI project: {e}[/red]")
-            return False
-
-    def _create_flask_project(self, project_path: Path) -> bool:
-        """Create Flask project"""
-        console.print(f"\n[bold cyan]📦 Creating Flask project...[/bold cyan]")
-        try:
-            project_path.mkdir(parents=True, exist_ok=True)
-
-            (project_path / "app.py").write_text(
-                """from flask import Flask, jsonify
+_FLASK_APP_PY = b"""from flask import Flask, jsonify
 
     app = Flask(__name__)
 
@@ -242,16 +222,12 @@ venv/
     if __name__ == '__main__':
         app.run(debug=True, host='0.0.0.0', port=5000)
     """
-            )
 
-            (project_path / "requirements.txt").write_text(
-                """Flask==3.0.0
+_FLASK_REQUIREMENTS_TXT = b"""Flask==3.0.0
     python-dotenv==1.0.0
     """
-            )
 
-            (project_path / "README.md").write_text(
-                f"""# {project_path.name}
+_FLASK_README_TMPL = b"""# {{NAME}}
 
     Flask API created with Scaffold CLI.
 
@@ -268,32 +244,14 @@ venv/
     ```
     Visit: http://127.0.0.1:5000
     """
-            )
-
-            console.print(f"[green]✓ Flask project created[/green]")
-            return True
-        except Exception as e:
-            console.print(f"[red]✗ Error: {e}[/red]")
-            return False
 
-    def _create_django_drf_project(self, project_path: Path) -> bool:
-        """Create Django REST Framework project"""
-        console.print(
-            f"\n[bold cyan]📦 Creating Django REST Framework project...[/bold cyan]"
-        )
-        try:
-            project_path.mkdir(parents=True, exist_ok=True)
-
-            (project_path / "requirements.txt").write_text(
-                """Django==5.0.0
+_DJANGO_DRF_REQUIREMENTS_TXT = b"""Django==5.0.0
     djangorestframework==3.14.0
     django-cors-headers==4.3.1
     python-dotenv==1.0.0
     """
-            )
 
-            (project_path / "README.md").write_text(
-                f"""# {project_path.name}
+_DJANGO_DRF_README_TMPL = b"""# {{NAME}}
 
     Django REST Framework project.
 
@@ -308,48 +266,26 @@ venv/
     python manage.py runserver
     ```
     """
-            )
 
-            console.print(f"[green]✓ Django DRF project created[/green]")
-            console.print(f"[yellow]→ Run setup commands from README[/yellow]")
-            return True
-        except Exception as e:
-            console.print(f"[red]✗ Error: {e}[/red]")
-            return False
-
-    def _create_express_ts_project(self, project_path: Path) -> bool:
-        """Create Express TypeScript project"""
-        console.print(
-            f"\n[bold cyan]📦 Creating Express + TypeScript project...[/bold cyan]"
-        )
-        try:
-            project_path.mkdir(parents=True, exist_ok=True)
-
-            (project_path / "package.json").write_text(
-                f"""{{"name": "{project_path.name}",
+_EXPRESS_TS_PACKAGE_JSON_TMPL = b"""{"name": "{{NAME}}",
     "version": "1.0.0",
-    "scripts": {{
+    "scripts": {
         "dev": "ts-node-dev src/index.ts",
         "build": "tsc",
         "start": "node dist/index.js"
-    }},
-    "dependencies": {{
+    },
+    "dependencies": {
         "express": "^4.18.2"
-    }},
-    "devDependencies": {{
+    },
+    "devDependencies": {
         "@types/express": "^4.17.21",
         "@types/node": "^20.0.0",
         "ts-node-dev": "^2.0.0",
         "typescript": "^5.3.0"
-    }}
-    }}"""
-            )
-
-            src_dir = project_path / "src"
-            src_dir.mkdir()
+    }
+    }"""
 
-            (src_dir / "index.ts").write_text(
-                """import express from 'express';
+_EXPRESS_TS_INDEX_TS = b"""import express from 'express';
 
     const app = express();
     app.use(express.json());
@@ -367,10 +303,8 @@ venv/
     console.log(`Server running on http://localhost:${PORT}`);
     });
     """
-            )
 
-            (project_path / "tsconfig.json").write_text(
-                """{
+_EXPRESS_TS_TSCONFIG_JSON = b"""{
     "compilerOptions": {
         "target": "ES2020",
         "module": "commonjs",
@@ -380,22 +314,8 @@ venv/
         "esModuleInterop": true
     }
     }"""
-            )
-
-            console.print(f"[green]✓ Express TypeScript project created[/green]")
-            return True
-        except Exception as e:
-            console.print(f"[red]✗ Error: {e}[/red]")
-            return False
-
-    def _create_go_gin_project(self, project_path: Path) -> bool:
-        """Create Go Gin project"""
-        console.print(f"\n[bold cyan]📦 Creating Go (Gin) project...[/bold cyan]")
-        try:
-            project_path.mkdir(parents=True, exist_ok=True)
 
-            (project_path / "main.go").write_text(
-                """package main
+_GO_GIN_MAIN_GO = b"""package main
 
     import (
         "github.com/gin-gonic/gin"
@@ -416,19 +336,15 @@ venv/
         r.Run(":8080")
     }
     """
-            )
 
-            (project_path / "go.mod").write_text(
-                f"""module {project_path.name}
+_GO_GIN_GO_MOD_TMPL = b"""module {{NAME}}
 
     go 1.21
 
     require github.com/gin-gonic/gin v1.9.1
     """
-            )
 
-            (project_path / "README.md").write_text(
-                f"""# {project_path.name}
+_GO_GIN_README_TMPL = b"""# {{NAME}}
 
     Go Gin API.
 
@@ -443,22 +359,8 @@ venv/
     ```
     Visit: http://localhost:8080
     """
-            )
 
-            console.print(f"[green]✓ Go Gin project created[/green]")
-            return True
-        except Exception as e:
-            console.print(f"[red]✗ Error: {e}[/red]")
-            return False
-
-    def _create_go_fiber_project(self, project_path: Path) -> bool:
-        """Create Go Fiber project"""
-        console.print(f"\n[bold cyan]📦 Creating Go (Fiber) project...[/bold cyan]")
-        try:
-            project_path.mkdir(parents=True, exist_ok=True)
-
-            (project_path / "main.go").write_text(
-                """package main
+_GO_FIBER_MAIN_GO = b"""package main
 
     import (
         "github.com/gofiber/fiber/v2"
@@ -479,31 +381,15 @@ venv/
         log.Fatal(app.Listen(":8080"))
     }
     """
-            )
 
-            (project_path / "go.mod").write_text(
-                f"""module {project_path.name}
+_GO_FIBER_GO_MOD_TMPL = b"""module {{NAME}}
 
     go 1.21
 
     require github.com/gofiber/fiber/v2 v2.51.0
     """
-            )
 
-            console.print(f"[green]✓ Go Fiber project created[/green]")
-            return True
-        except Exception as e:
-            console.print(f"[red]✗ Error: {e}[/red]")
-            return False
-
-    def _create_go_echo_project(self, project_path: Path) -> bool:
-        """Create Go Echo project"""
-        console.print(f"\n[bold cyan]📦 Creating Go (Echo) project...[/bold cyan]")
-        try:
-            project_path.mkdir(parents=True, exist_ok=True)
-
-            (project_path / "main.go").write_text(
-                """package main
+_GO_ECHO_MAIN_GO = b"""package main
 
     import (
         "github.com/labstack/echo/v4"
@@ -524,44 +410,15 @@ venv/
         e.Start(":8080")
     }
     """
-            )
 
-            (project_path / "go.mod").write_text(
-                f"""module {project_path.name}
+_GO_ECHO_GO_MOD_TMPL = b"""module {{NAME}}
 
     go 1.21
 
     require github.com/labstack/echo/v4 v4.11.4
     """
-            )
 
-            console.print(f"[green]✓ Go Echo project created[/green]")
-            return True
-        except Exception as e:
-            console.print(f"[red]✗ Error: {e}[/red]")
-            return False
-
-    def _create_rust_axum_project(self, project_path: Path) -> bool:
-        """Create Rust Axum project"""
-        console.print(f"\n[bold cyan]📦 Creating Rust (Axum) project...[/bold cyan]")
-        try:
-
-            result = subprocess.run(
-                ["cargo", "new", project_path.name, "--bin"],
-                cwd=project_path.parent,
-                capture_output=True,
-            )
-            if result.returncode != 0:
-                console.print(f"[red]✗ Cargo init failed[/red]")
-                return False
-
-            cargo_toml = project_path / "Cargo.toml"
-            content = cargo_toml.read_text()
-            content += '\n[dependencies]\naxum = "0.7"\ntokio = { version = "1", features = ["full"] }\nserde = { version = "1.0", features = ["derive"] }\nserde_json = "1.0"\n'
-            cargo_toml.write_text(content)
-
-            (project_path / "src" / "main.rs").write_text(
-                """use axum::{routing::get, Json, Router};
+_RUST_AXUM_MAIN_RS = b"""use axum::{routing::get, Json, Router};
     use serde::{Deserialize, Serialize};
 
     #[derive(Serialize, Deserialize)]
@@ -589,37 +446,8 @@ venv/
         axum::serve(listener, app).await.unwrap();
     }
     """
-            )
-
-            console.print(f"[green]✓ Rust Axum project created[/green]")
-            return True
-        except Exception as e:
-            console.print(f"[red]✗ Error: {e}[/red]")
-            return False
-
-    def _create_rust_actix_project(self, project_path: Path) -> bool:
-        """Create Rust Actix-web project"""
-        console.print(
-            f"\n[bold cyan]📦 Creating Rust (Actix-web) project...[/bold cyan]"
-        )
-        try:
-
-            result = subprocess.run(
-                ["cargo", "new", project_path.name, "--bin"],
-                cwd=project_path.parent,
-                capture_output=True,
-            )
-            if result.returncode != 0:
-                console.print(f"[red]✗ Cargo init failed[/red]")
-                return False
-
-            cargo_toml = project_path / "Cargo.toml"
-            content = cargo_toml.read_text()
-            content += '\n[dependencies]\nactix-web = "4"\nserde = { version = "1.0", features = ["derive"] }\n'
-            cargo_toml.write_text(content)
 
-            (project_path / "src" / "main.rs").write_text(
-                """use actix_web::{get, web, App, HttpServer, Responder};
+_RUST_ACTIX_MAIN_RS = b"""use actix_web::{get, web, App, HttpServer, Responder};
     use serde::{Deserialize, Serialize};
 
     #[derive(Serialize, Deserialize)]
@@ -647,24 +475,8 @@ venv/
             .await
     }
     """
-            )
 
-            console.print(f"[green]✓ Rust Actix-web project created[/green]")
-            return True
-        except Exception as e:
-            console.print(f"[red]✗ Error: {e}[/red]")
-            return False
-
-    # CLI APP INSTALLERS
-
-    def _create_python_cli_typer(self, project_path: Path) -> bool:
-        """Create Python CLI with Typer"""
-        console.print(f"\n[bold cyan]📦 Creating Python CLI (Typer)...[/bold cyan]")
-        try:
-            project_path.mkdir(parents=True, exist_ok=True)
-
-            (project_path / "cli.py").write_text(
-                '''import typer
+_PYTHON_CLI_TYPER_CLI_PY = b'''import typer
     from rich.console import Console
 
     app = typer.Typer()
@@ -683,16 +495,12 @@ venv/
     if __name__ == "__main__":
         app()
     '''
-            )
 
-            (project_path / "requirements.txt").write_text(
-                """typer[all]==0.12.0
+_PYTHON_CLI_TYPER_REQUIREMENTS_TXT = b"""typer[all]==0.12.0
     rich==13.7.0
     """
-            )
 
-            (project_path / "README.md").write_text(
-                f"""# {project_path.name}
+_PYTHON_CLI_TYPER_README_TMPL = b"""# {{NAME}}
 
     Python CLI app using Typer.
 
@@ -709,22 +517,8 @@ venv/
     python cli.py goodbye
     ```
     """
-            )
-
-            console.print(f"[green]✓ Python CLI (Typer) created[/green]")
-            return True
-        except Exception as e:
-            console.print(f"[red]✗ Error: {e}[/red]")
-            return False
-
-    def _create_python_cli_click(self, project_path: Path) -> bool:
-        """Create Python CLI with Click"""
-        console.print(f"\n[bold cyan]📦 Creating Python CLI (Click)...[/bold cyan]")
-        try:
-            project_path.mkdir(parents=True, exist_ok=True)
 
-            (project_path / "cli.py").write_text(
-                '''import click
+_PYTHON_CLI_CLICK_CLI_PY = b'''import click
 
     @click.group()
     def cli():
@@ -746,40 +540,22 @@ venv/
     if __name__ == '__main__':
         cli()
     '''
-            )
 
-            (project_path / "requirements.txt").write_text(
-                """click==8.1.7
+_PYTHON_CLI_CLICK_REQUIREMENTS_TXT = b"""click==8.1.7
     """
-            )
-
-            console.print(f"[green]✓ Python CLI (Click) created[/green]")
-            return True
-        except Exception as e:
-            console.print(f"[red]✗ Error: {e}[/red]")
-            return False
-
-    def _create_node_cli(self, project_path: Path) -> bool:
-        """Create Node.js CLI"""
-        console.print(f"\n[bold cyan]📦 Creating Node.js CLI...[/bold cyan]")
-        try:
-            project_path.mkdir(parents=True, exist_ok=True)
 
-            (project_path / "package.json").write_text(
-                f"""{{"name": "{project_path.name}",
+_NODE_CLI_PACKAGE_JSON_TMPL = b"""{"name": "{{NAME}}",
     "version": "1.0.0",
-    "bin": {{
-        "{project_path.name}": "./cli.js"
-    }},
-    "dependencies": {{
+    "bin": {
+        "{{NAME}}": "./cli.js"
+    },
+    "dependencies": {
         "commander": "^11.1.0",
         "chalk": "^4.1.2"
-    }}
-    }}"""
-            )
+    }
+    }"""
 
-            (project_path / "cli.js").write_text(
-                """#!/usr/bin/env node
+_NODE_CLI_CLI_JS = b"""#!/usr/bin/env node
     const { program } = require('commander');
     const chalk = require('chalk');
 
@@ -806,49 +582,28 @@ venv/
 
     program.parse();
     """
-            )
-
-            console.print(f"[green]✓ Node.js CLI created[/green]")
-            return True
-        except Exception as e:
-            console.print(f"[red]✗ Error: {e}[/red]")
-            return False
 
-    def _create_node_cli_ts(self, project_path: Path) -> bool:
-        """Create Node.js CLI with TypeScript"""
-        console.print(
-            f"\n[bold cyan]📦 Creating Node.js CLI (TypeScript)...[/bold cyan]"
-        )
-        try:
-            project_path.mkdir(parents=True, exist_ok=True)
-
-            (project_path / "package.json").write_text(
-                f"""{{"name": "{project_path.name}",
+_NODE_CLI_TS_PACKAGE_JSON_TMPL = b"""{"name": "{{NAME}}",
     "version": "1.0.0",
-    "bin": {{
-        "{project_path.name}": "./dist/cli.js"
-    }},
-    "scripts": {{
+    "bin": {
+        "{{NAME}}": "./dist/cli.js"
+    },
+    "scripts": {
         "build": "tsc",
         "dev": "ts-node src/cli.ts"
-    }},
-    "dependencies": {{
+    },
+    "dependencies": {
         "commander": "^11.1.0",
         "chalk": "^4.1.2"
-    }},
-    "devDependencies": {{
+    },
+    "devDependencies": {
         "@types/node": "^20.0.0",
         "ts-node": "^10.9.2",
         "typescript": "^5.3.0"
-    }}
-    }}"""
-            )
-
-            src_dir = project_path / "src"
-            src_dir.mkdir()
+    }
+    }"""
 
-            (src_dir / "cli.ts").write_text(
-                """#!/usr/bin/env node
+_NODE_CLI_TS_CLI_TS = b"""#!/usr/bin/env node
     import { program } from 'commander';
     import chalk from 'chalk';
 
@@ -867,10 +622,8 @@ venv/
 
     program.parse();
     """
-            )
 
-            (project_path / "tsconfig.json").write_text(
-                """{
+_NODE_CLI_TS_TSCONFIG_JSON = b"""{
     "compilerOptions": {
         "target": "ES2020",
         "module": "commonjs",
@@ -879,22 +632,8 @@ venv/
         "strict": true
     }
     }"""
-            )
 
-            console.print(f"[green]✓ Node.js CLI (TypeScript) created[/green]")
-            return True
-        except Exception as e:
-            console.print(f"[red]✗ Error: {e}[/red]")
-            return False
-
-    def _create_go_cli_cobra(self, project_path: Path) -> bool:
-        """Create Go CLI with Cobra"""
-        console.print(f"\n[bold cyan]📦 Creating Go CLI (Cobra)...[/bold cyan]")
-        try:
-            project_path.mkdir(parents=True, exist_ok=True)
-
-            (project_path / "main.go").write_text(
-                """package main
+_GO_CLI_COBRA_MAIN_GO = b"""package main
 
     import (
         "fmt"
@@ -927,46 +666,15 @@ venv/
         }
     }
     """
-            )
 
-            (project_path / "go.mod").write_text(
-                f"""module {project_path.name}
+_GO_CLI_COBRA_GO_MOD_TMPL = b"""module {{NAME}}
 
     go 1.21
 
     require github.com/spf13/cobra v1.8.0
     """
-            )
 
-            console.print(f"[green]✓ Go CLI (Cobra) created[/green]")
-            return True
-        except Exception as e:
-            console.print(f"[red]✗ Error: {e}[/red]")
-            return False
-
-    def _create_rust_cli_clap(self, project_path: Path) -> bool:
-        """Create Rust CLI with Clap"""
-        console.print(f"\n[bold cyan]📦 Creating Rust CLI (Clap)...[/bold cyan]")
-        try:
-
-            result = subprocess.run(
-                ["cargo", "new", project_path.name, "--bin"],
-                cwd=project_path.parent,
-                capture_output=True,
-            )
-            if result.returncode != 0:
-                console.print(f"[red]✗ Cargo init failed[/red]")
-                return False
-
-            cargo_toml = project_path / "Cargo.toml"
-            content = cargo_toml.read_text()
-            content += (
-                '\n[dependencies]\nclap = { version = "4.4", features = ["derive"] }\n'
-            )
-            cargo_toml.write_text(content)
-
-            (project_path / "src" / "main.rs").write_text(
-                """use clap::{Parser, Subcommand};
+_RUST_CLI_CLAP_MAIN_RS = b"""use clap::{Parser, Subcommand};
 
     #[derive(Parser)]
     #[command(name = "mycli")]
@@ -996,10 +704,404 @@ venv/
         }
     }
     """
+
+_RUST_AXUM_DEPENDENCIES = b"""axum = "0.7"
+tokio = { version = "1", features = ["full"] }
+serde = { version = "1.0", features = ["derive"] }
+serde_json = "1.0"
+"""
+
+_RUST_ACTIX_DEPENDENCIES = b"""actix-web = "4"
+serde = { version = "1.0", features = ["derive"] }
+"""
+
+_RUST_CLI_CLAP_DEPENDENCIES = b"""clap = { version = "4.4", features = ["derive"] }
+"""
+
+
+@dataclass(frozen=True)
+class TemplateSpec:
+    """Everything needed to lay down one built-in template"""
+
+    label: str
+    done: str
+    files: Dict[str, bytes] = field(default_factory=dict)
+    # Files whose {{NAME}} placeholders are replaced with the project name
+    templates: Dict[str, bytes] = field(default_factory=dict)
+    # Set for Rust templates: extra [dependencies] lines for Cargo.toml
+    cargo_dependencies: Optional[bytes] = None
+    note: Optional[str] = None
+
+
+# custom:<type> command -> template to create
+_TEMPLATE_SPECS = {
+    "fastapi": TemplateSpec(
+        label="FastAPI project",
+        done="FastAPI project created successfully",
+        files={
+            "main.py": _FASTAPI_MAIN_PY,
+            "requirements.txt": _FASTAPI_REQUIREMENTS_TXT,
+            ".gitignore": _FASTAPI_GITIGNORE,
+        },
+        templates={"README.md": _FASTAPI_README_TMPL},
+    ),
+    "flask": TemplateSpec(
+        label="Flask project",
+        done="Flask project created",
+        files={"app.py": _FLASK_APP_PY, "requirements.txt": _FLASK_REQUIREMENTS_TXT},
+        templates={"README.md": _FLASK_README_TMPL},
+    ),
+    "django-drf": TemplateSpec(
+        label="Django REST Framework project",
+        done="Django DRF project created",
+        files={"requirements.txt": _DJANGO_DRF_REQUIREMENTS_TXT},
+        templates={"README.md": _DJANGO_DRF_README_TMPL},
+        note="Run setup commands from README",
+    ),
+    "express-ts": TemplateSpec(
+        label="Express + TypeScript project",
+        done="Express TypeScript project created",
+        files={
+            "src/index.ts": _EXPRESS_TS_INDEX_TS,
+            "tsconfig.json": _EXPRESS_TS_TSCONFIG_JSON,
+        },
+        templates={"package.json": _EXPRESS_TS_PACKAGE_JSON_TMPL},
+    ),
+    "go-gin": TemplateSpec(
+        label="Go (Gin) project",
+        done="Go Gin project created",
+        files={"main.go": _GO_GIN_MAIN_GO},
+        templates={"go.mod": _GO_GIN_GO_MOD_TMPL, "README.md": _GO_GIN_README_TMPL},
+    ),
+    "go-fiber": TemplateSpec(
+        label="Go (Fiber) project",
+        done="Go Fiber project created",
+        files={"main.go": _GO_FIBER_MAIN_GO},
+        templates={"go.mod": _GO_FIBER_GO_MOD_TMPL},
+    ),
+    "go-echo": TemplateSpec(
+        label="Go (Echo) project",
+        done="Go Echo project created",
+        files={"main.go": _GO_ECHO_MAIN_GO},
+        templates={"go.mod": _GO_ECHO_GO_MOD_TMPL},
+    ),
+    "rust-axum": TemplateSpec(
+        label="Rust (Axum) project",
+        done="Rust Axum project created",
+        files={"src/main.rs": _RUST_AXUM_MAIN_RS},
+        cargo_dependencies=_RUST_AXUM_DEPENDENCIES,
+    ),
+    "rust-actix": TemplateSpec(
+        label="Rust (Actix-web) project",
+        done="Rust Actix-web project created",
+        files={"src/main.rs": _RUST_ACTIX_MAIN_RS},
+        cargo_dependencies=_RUST_ACTIX_DEPENDENCIES,
+    ),
+    "python-cli-typer": TemplateSpec(
+        label="Python CLI (Typer)",
+        done="Python CLI (Typer) created",
+        files={
+            "cli.py": _PYTHON_CLI_TYPER_CLI_PY,
+            "requirements.txt": _PYTHON_CLI_TYPER_REQUIREMENTS_TXT,
+        },
+        templates={"README.md": _PYTHON_CLI_TYPER_README_TMPL},
+    ),
+    "python-cli-click": TemplateSpec(
+        label="Python CLI (Click)",
+        done="Python CLI (Click) created",
+        files={
+            "cli.py": _PYTHON_CLI_CLICK_CLI_PY,
+            "requirements.txt": _PYTHON_CLI_CLICK_REQUIREMENTS_TXT,
+        },
+    ),
+    "node-cli": TemplateSpec(
+        label="Node.js CLI",
+        done="Node.js CLI created",
+        files={"cli.js": _NODE_CLI_CLI_JS},
+        templates={"package.json": _NODE_CLI_PACKAGE_JSON_TMPL},
+    ),
+    "node-cli-ts": TemplateSpec(
+        label="Node.js CLI (TypeScript)",
+        done="Node.js CLI (TypeScript) created",
+        files={
+            "src/cli.ts": _NODE_CLI_TS_CLI_TS,
+            "tsconfig.json": _NODE_CLI_TS_TSCONFIG_JSON,
+        },
+        templates={"package.json": _NODE_CLI_TS_PACKAGE_JSON_TMPL},
+    ),
+    "go-cli-cobra": TemplateSpec(
+        label="Go CLI (Cobra)",
+        done="Go CLI (Cobra) created",
+        files={"main.go": _GO_CLI_COBRA_MAIN_GO},
+        templates={"go.mod": _GO_CLI_COBRA_GO_MOD_TMPL},
+    ),
+    "rust-cli-clap": TemplateSpec(
+        label="Rust CLI (Clap)",
+        done="Rust CLI (Clap) created",
+        files={"src/main.rs": _RUST_CLI_CLAP_MAIN_RS},
+        cargo_dependencies=_RUST_CLI_CLAP_DEPENDENCIES,
+    ),
+}
+
+
+class Installer:
+    """Handles actual project creation"""
+
+    def __init__(self, use_cargo: bool = False):
+        self.console = console
+        self.runner = runner
+        self.use_cargo = use_cargo
+
+    def install(
+        self,
+        config: ProjectConfig,
+        project_name: str,
+        parent_dir: Optional[Path] = None,
+        skip_post_install: bool = False,
+    ) -> bool:
+        """
+        Install a project based on its configuration
+
+        Args:
+            config: Project configuration
+            project_name: Name of the project to create
+            parent_dir: Parent directory (defaults to current directory)
+            skip_post_install: Skip post-installation steps
+
+        Returns:
+            True if installation succeeded
+        """
+        if parent_dir is None:
+            parent_dir = Path.cwd()
+
+        project_path = parent_dir / project_name
+
+        # Handle custom installers
+        if config.custom_type:
+            return self._handle_custom_install(config, project_path)
+
+        # Run the main installation command
+        console.print(
+            _styled(
+                f"\n[bold cyan]📦 Creating {config.display_name} project...[/bold cyan]"
             )
+        )
+
+        # Format the command with project name
+        if config.needs_name_format:
+            command = config.command.format(name=project_name)
+        else:
+            command = config.command
+
+        # For interactive tools, show output. Otherwise use spinner.
+        success = self.runner.run(
+            command=command,
+            cwd=parent_dir,
+            description=f"Installing {config.display_name}",
+            show_output=config.interactive,
+        )
 
-            console.print(f"[green]✓ Rust CLI (Clap) created[/green]")
+        if not success:
+            console.print(f"[red]✗ Failed to create project[/red]")
+            return False
+
+        # Run post-install commands (unless skipped)
+        if config.has_post_install and not skip_post_install:
+            return self._run_post_install(config, project_path)
+
+        return True
+
+    def install_many(
+        self,
+        projects: List[Tuple[ProjectConfig, str]],
+        parent_dir: Optional[Path] = None,
+        skip_post_install: bool = False,
+    ) -> Dict[str, bool]:
+        """
+        Install several independent projects, concurrently when possible
+
+        Interactive installers need the terminal to themselves, so any
+        interactive config makes the batch run one project at a time.
+
+        Returns:
+            Mapping of project name to whether its installation succeeded
+        """
+        if len(projects) < 2 or any(config.interactive for config, _ in projects):
+            return {
+                name: self.install(config, name, parent_dir, skip_post_install)
+                for config, name in projects
+            }
+
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        with ThreadPoolExecutor(max_workers=min(8, len(projects))) as executor:
+            futures = {
+                executor.submit(
+                    self.install, config, name, parent_dir, skip_post_install
+                ): name
+                for config, name in projects
+            }
+            return {
+                futures[future]: future.result() for future in as_completed(futures)
+            }
+
+    def _run_post_install(self, config: ProjectConfig, project_path: Path) -> bool:
+        """Run post-installation commands"""
+        console.print(f"\n[yellow]⚙️  Running post-install steps...[/yellow]")
+
+        if config.post_install_parallel and len(config.post_install) > 1:
+            return self._run_post_install_parallel(config, project_path)
+
+        for cmd in config.post_install:
+            # Change to project directory for post-install commands
+            success = self.runner.run(
+                command=cmd,
+                cwd=project_path,
+                description=f"Running: {cmd}",
+                show_output=False,
+            )
+
+            if not success:
+                console.print(f"[yellow]⚠ Post-install step failed: {cmd}[/yellow]")
+                console.print("[dim]You may need to run this manually[/dim]")
+                # Don't fail the whole installation for post-install failures
+
+        return True
+
+    def _run_post_install_parallel(
+        self, config: ProjectConfig, project_path: Path
+    ) -> bool:
+        """Run independent post-installation commands concurrently"""
+        import asyncio
+
+        results = asyncio.run(
+            self._run_post_install_async(config.post_install, project_path)
+        )
+
+        # Output is buffered per command so concurrent children don't interleave
+        for cmd, returncode, output in results:
+            if returncode == 0:
+                console.print(f"[green]✓ Running: {cmd}[/green]")
+                continue
+
+            console.print(f"[yellow]⚠ Post-install step failed: {cmd}[/yellow]")
+            if output:
+                console.print(
+                    output.decode(errors="replace")[:500], style="dim", markup=False
+                )
+            console.print("[dim]You may need to run this manually[/dim]")
+
+        # Don't fail the whole installation for post-install failures
+        return True
+
+    async def _run_post_install_async(
+        self, commands: List[str], project_path: Path
+    ) -> List[Tuple[str, Optional[int], bytes]]:
+        """
+        Launch every command at once and collect (cmd, returncode, output)
+
+        Like CommandRunner, plain commands are exec'd without a shell and each
+        one is killed after COMMAND_TIMEOUT seconds, reported as a failure.
+        """
+        import asyncio
+
+        async def run_one(cmd: str):
+            args, shell = _prepare(cmd)
+            pipes = {
+                "cwd": project_path,
+                "stdout": asyncio.subprocess.PIPE,
+                "stderr": asyncio.subprocess.STDOUT,
+            }
+            try:
+                if shell:
+                    process = await asyncio.create_subprocess_shell(args, **pipes)
+                else:
+                    process = await asyncio.create_subprocess_exec(*args, **pipes)
+            except OSError as e:
+                return cmd, None, str(e).encode()
+
+            try:
+                output, _ = await asyncio.wait_for(
+                    process.communicate(), timeout=COMMAND_TIMEOUT
+                )
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                return cmd, None, f"Timed out after {COMMAND_TIMEOUT}s".encode()
+            return cmd, process.returncode, output
+
+        return await asyncio.gather(*(run_one(cmd) for cmd in commands))
+
+    def _handle_custom_install(self, config: ProjectConfig, project_path: Path) -> bool:
+        """Handle custom installation types"""
+        spec = _TEMPLATE_SPECS.get(config.custom_type)
+        if spec:
+            return self._render_spec(spec, project_path)
+
+        console.print(f"[red]Unknown custom installer: {config.custom_type}[/red]")
+        return False
+
+    def _render_spec(self, spec: TemplateSpec, project_path: Path) -> bool:
+        """Create a built-in template project from its spec"""
+        console.print(_styled(f"\n[bold cyan]📦 Creating {spec.label}...[/bold cyan]"))
+        try:
+            files = dict(spec.files)
+            if spec.templates:
+                name = project_path.name.encode()
+                for rel, data in spec.templates.items():
+                    files[rel] = data.replace(b"{{NAME}}", name)
+
+            if spec.cargo_dependencies is not None:
+                if not self._create_cargo_project(
+                    project_path, spec.cargo_dependencies, files
+                ):
+                    return False
+            else:
+                _write_files(project_path, files)
+
+            console.print(_styled(f"[green]✓ {spec.done}[/green]"))
+            if spec.note:
+                console.print(f"[yellow]→ {spec.note}[/yellow]")
             return True
         except Exception as e:
             console.print(f"[red]✗ Error: {e}[/red]")
             return False
+
+    def _create_cargo_project(
+        self, project_path: Path, dependencies: bytes, files: Dict[str, bytes]
+    ) -> bool:
+        """
+        Create a binary crate with the given dependencies and source files
+
+        By default the crate is synthesized from the bundled skeleton and
+        written in one batch; with use_cargo it comes from `cargo new`.
+        """
+        if not self.use_cargo:
+            rendered = _render_skeleton("rust_skeleton", {"NAME": project_path.name})
+            rendered["Cargo.toml"] += dependencies
+            rendered.update(files)
+            _copy_skeleton("rust_skeleton", project_path, rendered)
+            return True
+
+        import subprocess
+
+        result = subprocess.run(
+            ["cargo", "new", project_path.name, "--bin"],
+            cwd=project_path.parent,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            close_fds=False,
+        )
+        if result.returncode != 0:
+            console.print(f"[red]✗ Cargo init failed[/red]")
+            if result.stderr:
+                console.print(
+                    result.stderr.decode(errors="replace")[-500:],
+                    style="dim",
+                    markup=False,
+                )
+            return False
+
+        _append_cargo_deps(project_path / "Cargo.toml", dependencies)
+        _write_files(project_path, files)
+        return True
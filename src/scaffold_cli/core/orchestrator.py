@@ -2,40 +2,270 @@
 Main orchestration logic for project creation
 """
 
+import os
+import stat
+import time
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Optional
-from rich.console import Console
-from rich.panel import Panel
-import questionary
+from typing import Dict, Optional, Tuple
 
+from .._console import get_console
 from .project_types import (
     ProjectConfig,
+    get_project_by_display_name,
     get_project_by_name,
     get_project_categories,
-    get_projects_by_category,
+    get_project_display_names,
 )
-from .installer import Installer
-from ..validators.dependencies import DependencyValidator
-from ..utils.git import GitManager
 from .quick_templates import get_template_choices, get_template_from_choice
-from ..generators.docker_generator import DockerGenerator
-from ..generators.env_generator import EnvGenerator
+from ..utils.lazy import lazy_attrs
+
+__getattr__, _load = lazy_attrs(
+    __name__,
+    {
+        "Installer": ".installer",
+        "DependencyValidator": "..validators.dependencies",
+        "GitManager": "..utils.git",
+        "DockerGenerator": "..generators.docker_generator",
+        "EnvGenerator": "..generators.env_generator",
+    },
+)
+
+# Tools most project types need, probed in the background during prompts
+PREFETCH_TOOLS = ("node", "npm", "python3")
+
+_questionary = None
+
+
+def _q():
+    """Import questionary on first prompt and reuse it afterwards"""
+    global _questionary
+    if _questionary is None:
+        import questionary
+
+        _questionary = questionary
+    return _questionary
+
+
+@lru_cache(maxsize=1)
+def _select_style():
+    """Arrow-key prompt style shared by every select"""
+    from questionary import Style
+
+    return Style(
+        [
+            ("selected", "fg:cyan bold"),
+            ("pointer", "fg:cyan bold"),
+            ("highlighted", "fg:cyan"),
+        ]
+    )
+
+
+@lru_cache(maxsize=1)
+def _category_choices() -> Tuple[str, ...]:
+    """Capitalized category names offered by the project type prompt"""
+    return tuple(cat.capitalize() for cat in get_project_categories())
+
+
+# Monorepo README, encoded once at import and filled with bytes %-formatting
+_MONOREPO_README_TMPL = """# %(name)b
 
+Monorepo created with Scaffold CLI.
 
-console = Console()
+## Structure
+
+```
+%(name)b/
+├── web/     # %(frontend)b
+└── api/     # %(api)b
+```
+
+## Getting Started
+
+### Frontend (web/)
+
+```bash
+cd web
+npm install
+npm run dev
+```
+
+### Backend (api/)
+
+```bash
+cd api
+# Follow setup instructions in api/README.md
+```
+
+## Development
+
+Run both services concurrently for full-stack development.
+
+### Frontend
+- Default port: 5173 (Vite) or 3000 (Next.js)
+
+### Backend
+- Configure API URL in frontend as needed
+
+## Scripts
+
+You can add npm scripts to the root `package.json` to manage both services:
+
+```json
+{
+  "scripts": {
+    "dev:web": "cd web && npm run dev",
+    "dev:api": "cd api && <start command>",
+    "install:all": "cd web && npm install && cd ../api && <install>"
+  }
+}
+```
+""".encode()
+
+
+# Single-project success screen, as Rich markup with {name} placeholders
+_SUCCESS_HEADER = "\n".join(
+    [
+        "\n" + "=" * 70,
+        "[bold green]✨ Success![/bold green] Project created: [cyan]{name}[/cyan]",
+        "=" * 70,
+        "\n[bold]📁 Project Structure:[/bold]",
+        "  {name}/",
+    ]
+)
+
+_NAVIGATE_STEP = [
+    "\n[bold]🚀 Next Steps:[/bold]",
+    "\n  [bold cyan]1. Navigate to your project:[/bold cyan]",
+    "     cd {name}",
+]
+
+_NODE_STEPS = [
+    "  ├── package.json",
+    "  ├── src/",
+    "  └── ...",
+    *_NAVIGATE_STEP,
+    "\n  [bold cyan]2. Install dependencies:[/bold cyan]",
+    "     npm install",
+    "\n  [bold cyan]3. Start development server:[/bold cyan]",
+    "     npm run dev",
+]
+
+_VENV_STEP = [
+    "\n  [bold cyan]2. Set up virtual environment:[/bold cyan]",
+    "     python3 -m venv venv",
+    "     source venv/bin/activate  [dim]# On Windows: venv\\Scripts\\activate[/dim]",
+]
+
+_PYTHON_STRUCTURE = ["  ├── main.py", "  ├── requirements.txt", "  └── ..."]
+
+# Structure and next steps for each kind of project
+NEXT_STEPS_TEMPLATES: Dict[str, str] = {
+    "node": "\n".join(
+        [*_NODE_STEPS, "\n  [dim]→ Your app will be at: http://localhost:5173[/dim]"]
+    ),
+    "nextjs": "\n".join(
+        [
+            *_NODE_STEPS,
+            "\n  [dim]→ Your Next.js app will be at: http://localhost:3000[/dim]",
+        ]
+    ),
+    "django": "\n".join(
+        [
+            "  ├── manage.py",
+            "  ├── {name}/",
+            "  └── ...",
+            *_NAVIGATE_STEP,
+            *_VENV_STEP,
+            "\n  [bold cyan]3. Install dependencies & migrate:[/bold cyan]",
+            "     pip install django",
+            "     python manage.py migrate",
+            "\n  [bold cyan]4. Start development server:[/bold cyan]",
+            "     python manage.py runserver",
+            "\n  [dim]→ Your Django app will be at: http://127.0.0.1:8000[/dim]",
+        ]
+    ),
+    "fastapi": "\n".join(
+        [
+            *_PYTHON_STRUCTURE,
+            *_NAVIGATE_STEP,
+            *_VENV_STEP,
+            "\n  [bold cyan]3. Install dependencies:[/bold cyan]",
+            "     pip install -r requirements.txt",
+            "\n  [bold cyan]4. Start development server:[/bold cyan]",
+            "     uvicorn main:app --reload",
+            "\n  [dim]→ Your API will be at: http://127.0.0.1:8000[/dim]",
+            "  [dim]→ API docs at: http://127.0.0.1:8000/docs[/dim]",
+        ]
+    ),
+    "python": "\n".join([*_PYTHON_STRUCTURE, *_NAVIGATE_STEP, *_VENV_STEP]),
+    "other": "\n".join(_NAVIGATE_STEP),
+}
+
+_SUCCESS_FOOTER = "\n".join(
+    [
+        "\n[bold]🔧 Git Repository:[/bold]",
+        "  [green]✓[/green] Repository initialized with first commit",
+        "  [green]✓[/green] Default branch set to 'master'",
+        "\n  [bold cyan]To push to a remote repository:[/bold cyan]",
+        "     git remote add origin <repository-url>",
+        "     git push -u origin master",
+        "\n  [dim]Example with GitHub:[/dim]",
+        "     [dim]git remote add origin git@github.com:username/{name}.git[/dim]",
+        "     [dim]git push -u origin master[/dim]",
+        "\n[bold]📚 Resources:[/bold]",
+        "  [cyan]scaffold --help[/cyan]           Show all commands",
+        "  [cyan]scaffold list[/cyan]             View available templates",
+        "\n[dim]Happy coding! 🎉[/dim]\n",
+    ]
+)
+
+
+def _next_steps_kind(config: ProjectConfig) -> str:
+    """Pick the NEXT_STEPS_TEMPLATES entry for a project"""
+    if "node" in config.requires:
+        return "nextjs" if config.name == "nextjs" else "node"
+    if "python3" in config.requires:
+        return config.name if config.name in ("django", "fastapi") else "python"
+    return "other"
+
+
+def _ensure_dir(path: Path):
+    """Create path if missing, with a single stat when it already exists"""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        os.makedirs(path)
+        return
+    if not stat.S_ISDIR(st.st_mode):
+        raise NotADirectoryError(path)
 
 
 class ProjectOrchestrator:
     """Handles the project creation workflow"""
 
-    def __init__(self):
-        self.console = console
-        self.validator = DependencyValidator()
-        self.installer = Installer()
-        self.git_manager = GitManager()
+    def __init__(self, use_cargo: bool = False):
+        self.console = get_console()
+        self.use_cargo = use_cargo
+
+    @cached_property
+    def validator(self):
+        """Dependency validator, created on first use"""
+        return _load("DependencyValidator")()
+
+    @cached_property
+    def installer(self):
+        """Project installer, created on first use"""
+        return _load("Installer")(use_cargo=self.use_cargo)
+
+    @cached_property
+    def git_manager(self):
+        """Git manager, created on first use"""
+        return _load("GitManager")()
 
     def create_project(self, name: Optional[str] = None, monorepo: bool = False):
         """Main entry point for project creation"""
+        from rich.panel import Panel
 
         # Welcome message
         self.console.print(
@@ -48,44 +278,56 @@ class ProjectOrchestrator:
 
         # Get project name
         if not name:
-            name = questionary.text(
-                "📦 Project name:",
-                validate=lambda text: len(text) > 0 or "Project name cannot be empty",
-            ).ask()
+            name = (
+                _q()
+                .text(
+                    "📦 Project name:",
+                    validate=lambda text: len(text) > 0
+                    or "Project name cannot be empty",
+                )
+                .ask()
+            )
 
             if name is None:  # User pressed Ctrl+C
                 self.console.print("\n[yellow]Cancelled[/yellow]")
                 return False
 
+        # Resolve the target once; every creation flow builds into it
+        project_path = Path.cwd() / name
+
         # Check if directory already exists
-        if Path(name).exists():
+        if os.path.lexists(project_path):
+            st = os.stat(project_path, follow_symlinks=False)
+            modified = time.strftime("%Y-%m-%d %H:%M", time.localtime(st.st_mtime))
             self.console.print(f"[red]✗ Directory '{name}' already exists![/red]")
-            overwrite = questionary.confirm("Overwrite?", default=False).ask()
+            self.console.print(f"[dim]  Last modified {modified}[/dim]")
+            overwrite = _q().confirm("Overwrite?", default=False).ask()
 
             if not overwrite:
                 self.console.print("[yellow]Cancelled[/yellow]")
                 return False
 
+        # Probe the common toolchains while the user picks a project
+        self.validator.prefetch(PREFETCH_TOOLS)
+
         # NEW: Ask for project type (includes Quick Templates and Monorepo)
-        project_type_choice = questionary.select(
-            "Select project type:",
-            choices=[
-                "Quick Templates (recommended presets)",
-                "Frontend",
-                "API",
-                "Framework",
-                "Monorepo",
-                "Mobile",
-                "CLI",
-            ],
-            style=questionary.Style(
-                [
-                    ("selected", "fg:cyan bold"),
-                    ("pointer", "fg:cyan bold"),
-                    ("highlighted", "fg:cyan"),
-                ]
-            ),
-        ).ask()
+        project_type_choice = (
+            _q()
+            .select(
+                "Select project type:",
+                choices=[
+                    "Quick Templates (recommended presets)",
+                    "Frontend",
+                    "API",
+                    "Framework",
+                    "Monorepo",
+                    "Mobile",
+                    "CLI",
+                ],
+                style=_select_style(),
+            )
+            .ask()
+        )
 
         if project_type_choice is None:
             self.console.print("\n[yellow]Cancelled[/yellow]")
@@ -93,9 +335,9 @@ class ProjectOrchestrator:
 
         # Handle based on selection
         if project_type_choice == "Quick Templates (recommended presets)":
-            return self._create_from_quick_template(name)
+            return self._create_from_quick_template(name, project_path)
         elif project_type_choice == "Monorepo":
-            return self._create_monorepo(name)
+            return self._create_monorepo(name, project_path)
         else:
             # Map display name to category
             category_map = {
@@ -106,28 +348,26 @@ class ProjectOrchestrator:
                 "CLI": "cli",
             }
             category = category_map.get(project_type_choice)
-            return self._create_single_project(name, category)
+            return self._create_single_project(name, project_path, category)
 
-    def _create_from_quick_template(self, name: str) -> bool:
+    def _create_from_quick_template(self, name: str, project_path: Path) -> bool:
         """Create project from a quick template"""
 
         self.console.print("\n[bold cyan]→ Quick Templates[/bold cyan]")
         self.console.print("[dim]Pre-configured setups for common use cases[/dim]\n")
 
         # Get template choices
-        choices = get_template_choices()
-
-        selected_choice = questionary.select(
-            "Select a template:",
-            choices=choices,
-            style=questionary.Style(
-                [
-                    ("selected", "fg:cyan bold"),
-                    ("pointer", "fg:cyan bold"),
-                    ("highlighted", "fg:cyan"),
-                ]
-            ),
-        ).ask()
+        choices = list(get_template_choices())
+
+        selected_choice = (
+            _q()
+            .select(
+                "Select a template:",
+                choices=choices,
+                style=_select_style(),
+            )
+            .ask()
+        )
 
         if selected_choice is None:
             self.console.print("\n[yellow]Cancelled[/yellow]")
@@ -142,7 +382,7 @@ class ProjectOrchestrator:
 
         # Handle full-stack templates (monorepo)
         if template.category == "fullstack":
-            return self._create_fullstack_from_template(name, template)
+            return self._create_fullstack_from_template(name, project_path, template)
 
         # Get project config
         project_config = get_project_by_name(template.base_project)
@@ -163,20 +403,20 @@ class ProjectOrchestrator:
         if not success:
             return False
 
-        project_path = Path.cwd() / name
-
         # Optional: Environment setup
         if template.setup_env:
-            if questionary.confirm(
-                "\n🔧 Set up environment configuration?", default=True
-            ).ask():
+            if (
+                _q()
+                .confirm("\n🔧 Set up environment configuration?", default=True)
+                .ask()
+            ):
                 self._setup_template_environment(
                     project_path, name, project_config.language, template
                 )
 
         # Optional: Docker setup
         if template.setup_docker:
-            if questionary.confirm("\n🐳 Set up Docker?", default=True).ask():
+            if _q().confirm("\n🐳 Set up Docker?", default=True).ask():
                 self._setup_template_docker(project_path, project_config.language, name)
 
         # Initialize git
@@ -189,7 +429,9 @@ class ProjectOrchestrator:
 
         return True
 
-    def _create_fullstack_from_template(self, name: str, template) -> bool:
+    def _create_fullstack_from_template(
+        self, name: str, project_root: Path, template
+    ) -> bool:
         """Create a full-stack project from template"""
         self.console.print(f"\n[bold cyan]→ Creating {template.name}...[/bold cyan]")
 
@@ -212,44 +454,42 @@ class ProjectOrchestrator:
             return False
 
         # Validate dependencies
-        all_deps = list(set(frontend_config.requires + backend_config.requires))
+        all_deps = list(
+            dict.fromkeys((*frontend_config.requires, *backend_config.requires))
+        )
         if not self.validator.validate_and_report(all_deps):
             return False
 
         # Create monorepo structure
         self.console.print(f"\n[bold yellow]📦 Creating monorepo: {name}[/bold yellow]")
 
-        project_root = Path.cwd() / name
-        project_root.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(project_root)
 
-        # Install frontend
-        self.console.print("\n[cyan]→ Setting up frontend (web/)...[/cyan]")
-        frontend_success = self.installer.install(
-            frontend_config, "web", parent_dir=project_root, skip_post_install=True
+        # Install frontend and backend; they run side by side unless either
+        # installer needs the terminal
+        self.console.print(
+            "\n[cyan]→ Setting up frontend (web/) and backend (api/)...[/cyan]"
+        )
+        results = self.installer.install_many(
+            [(frontend_config, "web"), (backend_config, "api")],
+            parent_dir=project_root,
+            skip_post_install=True,
         )
 
-        if not frontend_success:
+        if not results["web"]:
             self.console.print("[red]✗ Frontend installation failed[/red]")
             return False
 
-        # Install backend
-        self.console.print("\n[cyan]→ Setting up backend (api/)...[/cyan]")
-        backend_success = self.installer.install(
-            backend_config, "api", parent_dir=project_root, skip_post_install=True
-        )
-
-        if not backend_success:
+        if not results["api"]:
             self.console.print("[red]✗ Backend installation failed[/red]")
             return False
 
         # Environment setup
-        if questionary.confirm(
-            "\n🔧 Set up environment configuration?", default=True
-        ).ask():
+        if _q().confirm("\n🔧 Set up environment configuration?", default=True).ask():
             self._setup_monorepo_environment(project_root, name, template)
 
         # Docker setup
-        if questionary.confirm("\n🐳 Set up Docker?", default=True).ask():
+        if _q().confirm("\n🐳 Set up Docker?", default=True).ask():
             self._setup_monorepo_docker(project_root, name, template)
 
         # Create root README
@@ -280,7 +520,7 @@ class ProjectOrchestrator:
         }
         project_type = type_map.get(language, "react")
 
-        env_gen = EnvGenerator(project_path, project_type, name)
+        env_gen = _load("EnvGenerator")(project_path, project_type, name)
 
         # Add base variables
         env_gen._add_base_variables()
@@ -291,14 +531,18 @@ class ProjectOrchestrator:
                 f"\n[bold]Recommended services for {template.name}:[/bold]"
             )
             if "database" in template.recommended_services:
-                if questionary.confirm("🗄️  Configure database?", default=True).ask():
-                    db_type = questionary.select(
-                        "Select database:",
-                        choices=["PostgreSQL", "MySQL", "MongoDB", "SQLite"],
-                    ).ask()
+                if _q().confirm("🗄️  Configure database?", default=True).ask():
+                    db_type = (
+                        _q()
+                        .select(
+                            "Select database:",
+                            choices=list(env_gen.DB_CHOICES),
+                        )
+                        .ask()
+                    )
                     if db_type:
                         env_gen._add_service_vars(
-                            "database", db_type.lower().replace("sql", "")
+                            "database", env_gen.DB_CHOICES[db_type]
                         )
 
         # Generate files
@@ -319,15 +563,15 @@ class ProjectOrchestrator:
         }
         project_type = type_map.get(language, "react")
 
-        docker_gen = DockerGenerator(project_path, project_type, name)
+        docker_gen = _load("DockerGenerator")(project_path, project_type, name)
 
         # Generate Dockerfile
         docker_gen.generate_dockerfile()
 
         # Ask about docker-compose
-        with_db = questionary.confirm(
-            "Include database in docker-compose?", default=False
-        ).ask()
+        with_db = (
+            _q().confirm("Include database in docker-compose?", default=False).ask()
+        )
 
         docker_gen.generate_docker_compose(with_database=with_db)
 
@@ -335,23 +579,23 @@ class ProjectOrchestrator:
         """Set up environment for monorepo"""
 
         # Frontend env
-        web_env = EnvGenerator(project_root / "web", "react", f"{name}-web")
+        web_env = _load("EnvGenerator")(project_root / "web", "react", f"{name}-web")
         web_env._add_base_variables()
         web_env.generate_files()
 
         # Backend env
-        api_env = EnvGenerator(project_root / "api", "fastapi", f"{name}-api")
+        api_env = _load("EnvGenerator")(project_root / "api", "fastapi", f"{name}-api")
         api_env._add_base_variables()
 
         # Configure services
-        if questionary.confirm("🗄️  Configure database?", default=True).ask():
-            db_type = questionary.select(
-                "Select database:", choices=["PostgreSQL", "MySQL", "MongoDB"]
-            ).ask()
+        if _q().confirm("🗄️  Configure database?", default=True).ask():
+            db_type = (
+                _q()
+                .select("Select database:", choices=["PostgreSQL", "MySQL", "MongoDB"])
+                .ask()
+            )
             if db_type:
-                api_env._add_service_vars(
-                    "database", db_type.lower().replace("sql", "")
-                )
+                api_env._add_service_vars("database", api_env.DB_CHOICES[db_type])
 
         api_env.generate_files()
 
@@ -359,36 +603,39 @@ class ProjectOrchestrator:
         """Set up Docker for monorepo"""
 
         # Frontend Dockerfile
-        web_docker = DockerGenerator(project_root / "web", "nextjs", f"{name}-web")
+        web_docker = _load("DockerGenerator")(
+            project_root / "web", "nextjs", f"{name}-web"
+        )
         web_docker.generate_dockerfile()
 
         # Backend Dockerfile
-        api_docker = DockerGenerator(project_root / "api", "fastapi", f"{name}-api")
+        api_docker = _load("DockerGenerator")(
+            project_root / "api", "fastapi", f"{name}-api"
+        )
         api_docker.generate_dockerfile()
 
         # Root docker-compose
-        root_docker = DockerGenerator(project_root, "monorepo", name)
+        root_docker = _load("DockerGenerator")(project_root, "monorepo", name)
         root_docker.generate_docker_compose(with_database=True)
 
-    def _create_single_project(self, name: str, category: str = None) -> bool:
+    def _create_single_project(
+        self, name: str, project_path: Path, category: str = None
+    ) -> bool:
         """Create a single project"""
 
         self.console.print("\n[bold cyan]→ Single Project Setup[/bold cyan]")
 
         if category is None:
             # Step 1: Choose category with arrow keys
-            categories = get_project_categories()
-            category = questionary.select(
-                "📂 Select project type:",
-                choices=[cat.capitalize() for cat in categories],
-                style=questionary.Style(
-                    [
-                        ("selected", "fg:cyan bold"),
-                        ("pointer", "fg:cyan bold"),
-                        ("highlighted", "fg:cyan"),
-                    ]
-                ),
-            ).ask()
+            category = (
+                _q()
+                .select(
+                    "📂 Select project type:",
+                    choices=list(_category_choices()),
+                    style=_select_style(),
+                )
+                .ask()
+            )
 
             if category is None:  # User pressed Ctrl+C
                 self.console.print("\n[yellow]Cancelled[/yellow]")
@@ -397,29 +644,22 @@ class ProjectOrchestrator:
             category = category.lower()
 
         # Step 2: Choose specific stack with arrow keys
-        projects = get_projects_by_category(category)
-        project_choices = [project.display_name for project in projects]
-
-        selected_display_name = questionary.select(
-            f"Select {category}:",
-            choices=project_choices,
-            style=questionary.Style(
-                [
-                    ("selected", "fg:cyan bold"),
-                    ("pointer", "fg:cyan bold"),
-                    ("highlighted", "fg:cyan"),
-                ]
-            ),
-        ).ask()
+        selected_display_name = (
+            _q()
+            .select(
+                f"Select {category}:",
+                choices=list(get_project_display_names(category)),
+                style=_select_style(),
+            )
+            .ask()
+        )
 
         if selected_display_name is None:  # User pressed Ctrl+C
             self.console.print("\n[yellow]Cancelled[/yellow]")
             return False
 
         # Find the project config
-        project_config = next(
-            p for p in projects if p.display_name == selected_display_name
-        )
+        project_config = get_project_by_display_name(category, selected_display_name)
 
         # Step 3: Validate dependencies
         if not self.validator.validate_and_report(project_config.requires):
@@ -432,7 +672,6 @@ class ProjectOrchestrator:
             return False
 
         # Step 5: Initialize git
-        project_path = Path.cwd() / name
         self.git_manager.init_repository(
             project_path, f"Initial commit - {project_config.display_name} project"
         )
@@ -442,98 +681,82 @@ class ProjectOrchestrator:
 
         return True
 
-    def _create_monorepo(self, name: str) -> bool:
+    def _create_monorepo(self, name: str, project_root: Path) -> bool:
         """Create a monorepo project"""
 
         self.console.print("\n[bold cyan]→ Monorepo Setup[/bold cyan]")
         self.console.print("[dim]Select frontend and backend technologies[/dim]")
 
         # Choose frontend with arrow keys
-        frontend_projects = get_projects_by_category("frontend")
-        frontend_choices = [project.display_name for project in frontend_projects]
-
-        selected_frontend = questionary.select(
-            "🎨 Select frontend:",
-            choices=frontend_choices,
-            style=questionary.Style(
-                [
-                    ("selected", "fg:cyan bold"),
-                    ("pointer", "fg:cyan bold"),
-                    ("highlighted", "fg:cyan"),
-                ]
-            ),
-        ).ask()
+        selected_frontend = (
+            _q()
+            .select(
+                "🎨 Select frontend:",
+                choices=list(get_project_display_names("frontend")),
+                style=_select_style(),
+            )
+            .ask()
+        )
 
         if selected_frontend is None:  # User pressed Ctrl+C
             self.console.print("\n[yellow]Cancelled[/yellow]")
             return False
 
-        frontend_config = next(
-            p for p in frontend_projects if p.display_name == selected_frontend
-        )
+        frontend_config = get_project_by_display_name("frontend", selected_frontend)
 
         # Choose backend with arrow keys
-        api_projects = get_projects_by_category("api")
-        api_choices = [project.display_name for project in api_projects]
-
-        selected_api = questionary.select(
-            "⚙️  Select backend API:",
-            choices=api_choices,
-            style=questionary.Style(
-                [
-                    ("selected", "fg:cyan bold"),
-                    ("pointer", "fg:cyan bold"),
-                    ("highlighted", "fg:cyan"),
-                ]
-            ),
-        ).ask()
+
+        selected_api = (
+            _q()
+            .select(
+                "⚙️  Select backend API:",
+                choices=list(get_project_display_names("api")),
+                style=_select_style(),
+            )
+            .ask()
+        )
 
         if selected_api is None:  # User pressed Ctrl+C
             self.console.print("\n[yellow]Cancelled[/yellow]")
             return False
 
-        api_config = next(p for p in api_projects if p.display_name == selected_api)
+        api_config = get_project_by_display_name("api", selected_api)
 
         # Validate all dependencies
-        all_deps = list(set(frontend_config.requires + api_config.requires))
+        all_deps = list(
+            dict.fromkeys((*frontend_config.requires, *api_config.requires))
+        )
         if not self.validator.validate_and_report(all_deps):
             return False
 
         # Create monorepo structure
         self.console.print(f"\n[bold yellow]📦 Creating monorepo: {name}[/bold yellow]")
 
-        project_root = Path.cwd() / name
-        project_root.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(project_root)
 
-        # Install frontend
-        self.console.print("\n[cyan]→ Setting up frontend (web/)...[/cyan]")
-        frontend_success = self.installer.install(
-            frontend_config,
-            "web",
+        # The root README only depends on the chosen stacks, so write it before
+        # the long-running installs
+        self._create_monorepo_readme(project_root, frontend_config, api_config)
+
+        # Install frontend and backend; they run side by side unless either
+        # installer needs the terminal
+        self.console.print(
+            "\n[cyan]→ Setting up frontend (web/) and backend (api/)...[/cyan]"
+        )
+        results = self.installer.install_many(
+            [(frontend_config, "web"), (api_config, "api")],
             parent_dir=project_root,
-            skip_post_install=True,  # Skip npm install in monorepo
+            skip_post_install=True,  # Skip post-install in monorepo
         )
 
-        if not frontend_success:
+        if not results["web"]:
             self.console.print("[red]✗ Frontend installation failed[/red]")
             return False
 
-        # Install backend
-        self.console.print("\n[cyan]→ Setting up backend (api/)...[/cyan]")
-        api_success = self.installer.install(
-            api_config,
-            "api",
-            parent_dir=project_root,
-            skip_post_install=True,  # Skip post-install in monorepo
-        )
-
-        if not api_success:
+        if not results["api"]:
             self.console.print("[red]✗ Backend installation failed[/red]")
             return False
 
-        # Create root README
-        self._create_monorepo_readme(project_root, frontend_config, api_config)
-
         # Initialize git for the monorepo
         self.git_manager.init_repository(
             project_root, "Initial commit - Monorepo with frontend and backend"
@@ -546,220 +769,69 @@ class ProjectOrchestrator:
 
     def _show_success_message(self, name: str, config: ProjectConfig):
         """Display success message for single project"""
-
-        self.console.print("\n" + "=" * 70)
-        self.console.print(
-            f"[bold green]✨ Success![/bold green] Project created: [cyan]{name}[/cyan]"
-        )
-        self.console.print("=" * 70)
-
-        self.console.print(f"\n[bold]📁 Project Structure:[/bold]")
-        self.console.print(f"  {name}/")
-        if "node" in config.requires:
-            self.console.print("  ├── package.json")
-            self.console.print("  ├── src/")
-            self.console.print("  └── ...")
-        elif "python3" in config.requires:
-            if config.name == "django":
-                self.console.print("  ├── manage.py")
-                self.console.print("  ├── {name}/")
-                self.console.print("  └── ...")
-            else:
-                self.console.print("  ├── main.py")
-                self.console.print("  ├── requirements.txt")
-                self.console.print("  └── ...")
-
-        # Next steps
-        self.console.print(f"\n[bold]🚀 Next Steps:[/bold]")
-        self.console.print(f"\n  [bold cyan]1. Navigate to your project:[/bold cyan]")
-        self.console.print(f"     cd {name}")
-
-        # Project-specific instructions
-        if "node" in config.requires:
-            self.console.print(f"\n  [bold cyan]2. Install dependencies:[/bold cyan]")
-            self.console.print(f"     npm install")
-            self.console.print(
-                f"\n  [bold cyan]3. Start development server:[/bold cyan]"
-            )
-            self.console.print(f"     npm run dev")
-
-            if config.name == "nextjs":
-                self.console.print(
-                    f"\n  [dim]→ Your Next.js app will be at: http://localhost:3000[/dim]"
-                )
-            else:
-                self.console.print(
-                    f"\n  [dim]→ Your app will be at: http://localhost:5173[/dim]"
-                )
-
-        elif "python3" in config.requires:
-            self.console.print(
-                f"\n  [bold cyan]2. Set up virtual environment:[/bold cyan]"
+        message = "\n".join(
+            (
+                _SUCCESS_HEADER,
+                NEXT_STEPS_TEMPLATES[_next_steps_kind(config)],
+                _SUCCESS_FOOTER,
             )
-            self.console.print(f"     python3 -m venv venv")
-            self.console.print(
-                f"     source venv/bin/activate  [dim]# On Windows: venv\\Scripts\\activate[/dim]"
-            )
-
-            if config.name == "django":
-                self.console.print(
-                    f"\n  [bold cyan]3. Install dependencies & migrate:[/bold cyan]"
-                )
-                self.console.print(f"     pip install django")
-                self.console.print(f"     python manage.py migrate")
-                self.console.print(
-                    f"\n  [bold cyan]4. Start development server:[/bold cyan]"
-                )
-                self.console.print(f"     python manage.py runserver")
-                self.console.print(
-                    f"\n  [dim]→ Your Django app will be at: http://127.0.0.1:8000[/dim]"
-                )
-            elif config.name == "fastapi":
-                self.console.print(
-                    f"\n  [bold cyan]3. Install dependencies:[/bold cyan]"
-                )
-                self.console.print(f"     pip install -r requirements.txt")
-                self.console.print(
-                    f"\n  [bold cyan]4. Start development server:[/bold cyan]"
-                )
-                self.console.print(f"     uvicorn main:app --reload")
-                self.console.print(
-                    f"\n  [dim]→ Your API will be at: http://127.0.0.1:8000[/dim]"
-                )
-                self.console.print(
-                    f"  [dim]→ API docs at: http://127.0.0.1:8000/docs[/dim]"
-                )
-
-        # Git instructions
-        self.console.print(f"\n[bold]🔧 Git Repository:[/bold]")
-        self.console.print(
-            f"  [green]✓[/green] Repository initialized with first commit"
-        )
-        self.console.print(f"  [green]✓[/green] Default branch set to 'master'")
-
-        self.console.print(
-            f"\n  [bold cyan]To push to a remote repository:[/bold cyan]"
         )
-        self.console.print(f"     git remote add origin <repository-url>")
-        self.console.print(f"     git push -u origin master")
-
-        self.console.print(f"\n  [dim]Example with GitHub:[/dim]")
-        self.console.print(
-            f"     [dim]git remote add origin git@github.com:username/{name}.git[/dim]"
-        )
-        self.console.print(f"     [dim]git push -u origin master[/dim]")
-
-        # Footer
-        self.console.print(f"\n[bold]📚 Resources:[/bold]")
-        self.console.print(
-            f"  [cyan]scaffold --help[/cyan]           Show all commands"
-        )
-        self.console.print(
-            f"  [cyan]scaffold list[/cyan]             View available templates"
-        )
-        self.console.print(f"\n[dim]Happy coding! 🎉[/dim]\n")
+        self.console.print(message.format(name=name))
 
     def _show_monorepo_success(
         self, name: str, frontend: ProjectConfig, api: ProjectConfig
     ):
         """Display success message for monorepo"""
-        self.console.print("\n" + "=" * 60)
-        self.console.print(
-            f"[bold green]✨ Success![/bold green] Created monorepo: {name}"
-        )
-        self.console.print("=" * 60)
+        lines = []
 
-        self.console.print(f"\n[bold]Structure:[/bold]")
-        self.console.print(f"  {name}/")
-        self.console.print(f"  ├── web/     ({frontend.display_name})")
-        self.console.print(f"  ├── api/     ({api.display_name})")
-        self.console.print(f"  └── README.md")
+        lines.append("\n" + "=" * 60)
+        lines.append(f"[bold green]✨ Success![/bold green] Created monorepo: {name}")
+        lines.append("=" * 60)
 
-        self.console.print(f"\n[bold]Next steps:[/bold]")
-        self.console.print(f"  cd {name}")
+        lines.append(f"\n[bold]Structure:[/bold]")
+        lines.append(f"  {name}/")
+        lines.append(f"  ├── web/     ({frontend.display_name})")
+        lines.append(f"  ├── api/     ({api.display_name})")
+        lines.append(f"  └── README.md")
 
-        self.console.print(
-            f"\n  [bold cyan]# Install frontend dependencies[/bold cyan]"
-        )
-        self.console.print(f"  cd web && npm install")
+        lines.append(f"\n[bold]Next steps:[/bold]")
+        lines.append(f"  cd {name}")
 
-        self.console.print(f"\n  [bold cyan]# Start frontend dev server[/bold cyan]")
-        self.console.print(f"  npm run dev")
+        lines.append(f"\n  [bold cyan]# Install frontend dependencies[/bold cyan]")
+        lines.append(f"  cd web && npm install")
 
-        self.console.print(
+        lines.append(f"\n  [bold cyan]# Start frontend dev server[/bold cyan]")
+        lines.append(f"  npm run dev")
+
+        lines.append(
             f"\n  [bold cyan]# Setup backend (in another terminal)[/bold cyan]"
         )
-        self.console.print(f"  cd ../api")
+        lines.append(f"  cd ../api")
         if "python3" in api.requires:
-            self.console.print(f"  python3 -m venv venv")
-            self.console.print(f"  source venv/bin/activate")
-            self.console.print(f"  pip install -r requirements.txt")
+            lines.append(f"  python3 -m venv venv")
+            lines.append(f"  source venv/bin/activate")
+            lines.append(f"  pip install -r requirements.txt")
         elif "node" in api.requires:
-            self.console.print(f"  npm install")
+            lines.append(f"  npm install")
+
+        lines.append(f"\n[bold]Git:[/bold]")
+        lines.append(f"  ✓ Repository initialized")
+        lines.append(f"  ✓ Initial commit created")
 
-        self.console.print(f"\n[bold]Git:[/bold]")
-        self.console.print(f"  ✓ Repository initialized")
-        self.console.print(f"  ✓ Initial commit created")
+        lines.append(f"\n[dim]See README.md for detailed instructions[/dim]\n")
 
-        self.console.print(f"\n[dim]See README.md for detailed instructions[/dim]\n")
+        self.console.print("\n".join(lines))
 
     def _create_monorepo_readme(
         self, project_root: Path, frontend: ProjectConfig, api: ProjectConfig
     ):
         """Create README for monorepo"""
-        readme_content = f"""# {project_root.name}
-
-Monorepo created with Scaffold CLI.
-
-## Structure
-
-```
-{project_root.name}/
-├── web/     # {frontend.display_name}
-└── api/     # {api.display_name}
-```
-
-## Getting Started
-
-### Frontend (web/)
-
-```bash
-cd web
-npm install
-npm run dev
-```
-
-### Backend (api/)
-
-```bash
-cd api
-# Follow setup instructions in api/README.md
-```
-
-## Development
-
-Run both services concurrently for full-stack development.
-
-### Frontend
-- Default port: 5173 (Vite) or 3000 (Next.js)
-
-### Backend
-- Configure API URL in frontend as needed
-
-## Scripts
-
-You can add npm scripts to the root `package.json` to manage both services:
-
-```json
-{{
-  "scripts": {{
-    "dev:web": "cd web && npm run dev",
-    "dev:api": "cd api && <start command>",
-    "install:all": "cd web && npm install && cd ../api && <install>"
-  }}
-}}
-```
-"""
-
         readme_path = project_root / "README.md"
-        readme_path.write_text(readme_content)
+        readme_path.write_bytes(
+            _MONOREPO_README_TMPL
+            % {
+                b"name": project_root.name.encode(),
+                b"frontend": frontend.display_name.encode(),
+                b"api": api.display_name.encode(),
+            }
+        )
@@ -3,10 +3,10 @@ Quick template definitions - pre-configured project setups
 """
 
 from dataclasses import dataclass
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class QuickTemplate:
     """Pre-configured template with specific settings"""
 
@@ -20,11 +20,13 @@ class QuickTemplate:
     # Optional configurations
     setup_env: bool = False
     setup_docker: bool = False
-    recommended_services: List[str] = None  # ['database', 'email', etc]
+    recommended_services: Tuple[str, ...] = ()  # ('database', 'email', etc)
 
     def __post_init__(self):
-        if self.recommended_services is None:
-            self.recommended_services = []
+        # Frozen, so the normalized value goes through object.__setattr__
+        object.__setattr__(
+            self, "recommended_services", tuple(self.recommended_services or ())
+        )
 
 
 # Quick template registry
@@ -84,7 +86,7 @@ QUICK_TEMPLATES = {
         emoji="⚡",
         setup_env=True,
         setup_docker=True,
-        recommended_services=["database"],
+        recommended_services=("database",),
     ),
     "django-rest": QuickTemplate(
         key="django-rest",
@@ -95,7 +97,7 @@ QUICK_TEMPLATES = {
         emoji="🎸",
         setup_env=True,
         setup_docker=True,
-        recommended_services=["database"],
+        recommended_services=("database",),
     ),
     "express-ts": QuickTemplate(
         key="express-ts",
@@ -126,7 +128,7 @@ QUICK_TEMPLATES = {
         emoji="🌶️",
         setup_env=True,
         setup_docker=False,
-        recommended_services=["database"],
+        recommended_services=("database",),
     ),
     # ============================================
     # FULL-STACK TEMPLATES (for monorepo)
@@ -140,7 +142,7 @@ QUICK_TEMPLATES = {
         emoji="🔥",
         setup_env=True,
         setup_docker=True,
-        recommended_services=["database"],
+        recommended_services=("database",),
     ),
     "pern-stack": QuickTemplate(
         key="pern-stack",
@@ -151,7 +153,7 @@ QUICK_TEMPLATES = {
         emoji="🐘",
         setup_env=True,
         setup_docker=True,
-        recommended_services=["database"],
+        recommended_services=("database",),
     ),
     "nextjs-fastapi": QuickTemplate(
         key="nextjs-fastapi",
@@ -162,10 +164,26 @@ QUICK_TEMPLATES = {
         emoji="⚡",
         setup_env=True,
         setup_docker=True,
-        recommended_services=["database"],
+        recommended_services=("database",),
     ),
 }
 
+# Templates grouped by category, built once from the registry above
+_TEMPLATES_BY_CATEGORY: Dict[str, List[QuickTemplate]] = {
+    "frontend": [],
+    "backend": [],
+    "fullstack": [],
+}
+for _template in QUICK_TEMPLATES.values():
+    if _template.category in _TEMPLATES_BY_CATEGORY:
+        _TEMPLATES_BY_CATEGORY[_template.category].append(_template)
+del _template
+
+# Interactive choice strings ("emoji name") mapped back to their templates
+_CHOICE_TO_TEMPLATE: Dict[str, QuickTemplate] = {
+    f"{t.emoji} {t.name}": t for t in QUICK_TEMPLATES.values()
+}
+
 
 def get_quick_template(key: str) -> Optional[QuickTemplate]:
     """Get a quick template by key"""
@@ -173,14 +191,11 @@ def get_quick_template(key: str) -> Optional[QuickTemplate]:
 
 
 def get_templates_by_category() -> Dict[str, List[QuickTemplate]]:
-    """Group templates by category"""
-    categories = {"frontend": [], "backend": [], "fullstack": []}
+    """Group templates by category
 
-    for template in QUICK_TEMPLATES.values():
-        if template.category in categories:
-            categories[template.category].append(template)
-
-    return categories
+    The mapping is shared between callers and must be treated as read-only.
+    """
+    return _TEMPLATES_BY_CATEGORY
 
 
 def list_all_templates() -> List[QuickTemplate]:
@@ -188,13 +203,14 @@ def list_all_templates() -> List[QuickTemplate]:
     return list(QUICK_TEMPLATES.values())
 
 
-def get_template_choices() -> List[str]:
-    """Get formatted template choices for interactive prompts"""
-    templates = list_all_templates()
+def _build_template_choices() -> Tuple[str, ...]:
+    """Format template choices, grouped under category headers"""
     choices = []
 
     current_category = None
-    for template in sorted(templates, key=lambda t: (t.category, t.name)):
+    for template in sorted(
+        QUICK_TEMPLATES.values(), key=lambda t: (t.category, t.name)
+    ):
         # Add category header
         if template.category != current_category:
             category_name = template.category.capitalize()
@@ -205,7 +221,15 @@ def get_template_choices() -> List[str]:
         choice = f"{template.emoji} {template.name}"
         choices.append(choice)
 
-    return choices
+    return tuple(choices)
+
+
+_TEMPLATE_CHOICES = _build_template_choices()
+
+
+def get_template_choices() -> Tuple[str, ...]:
+    """Get formatted template choices for interactive prompts"""
+    return _TEMPLATE_CHOICES
 
 
 def get_template_from_choice(choice: str) -> Optional[QuickTemplate]:
@@ -214,9 +238,4 @@ def get_template_from_choice(choice: str) -> Optional[QuickTemplate]:
     if "─────" in choice:
         return None
 
-    # Extract template name from "emoji name" format
-    for template in QUICK_TEMPLATES.values():
-        if template.name in choice:
-            return template
-
-    return None
+    return _CHOICE_TO_TEMPLATE.get(choice)
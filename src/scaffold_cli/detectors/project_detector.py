@@ -2,13 +2,51 @@
 Project type detection - analyzes existing projects
 """
 
+from functools import cached_property
 from pathlib import Path
-from typing import Optional, Dict, List
-from dataclasses import dataclass
-import json
-from rich.console import Console
-
-console = Console()
+import os
+from typing import Optional, Dict, List, Tuple
+from dataclasses import dataclass, field
+import re
+from .._console import get_console
+
+# orjson parses package.json several times faster when it is installed
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+console = get_console()
+
+# Node dependencies reported as frameworks, in display order
+_NODE_FRAMEWORKS = {
+    "react": "React",
+    "next": "Next.js",
+    "vue": "Vue",
+    "express": "Express.js",
+    "tailwindcss": "Tailwind CSS",
+    "typescript": "TypeScript",
+    "vite": "Vite",
+}
+
+# Dependencies that decide a Node project's type, highest priority first
+_NODE_TYPE_PRIORITY = (
+    ("next", "nextjs"),
+    ("react", "react"),
+    ("react-dom", "react"),
+    ("vue", "vue"),
+    ("express", "express"),
+)
+
+# Python requirements reported as frameworks, in display order
+_PY_FRAMEWORKS = {
+    "django": "Django",
+    "fastapi": "FastAPI",
+    "flask": "Flask",
+}
+
+# Distribution name at the start of a requirements.txt line
+_REQUIREMENT_NAME = re.compile(r"[a-z0-9][a-z0-9._-]*")
 
 
 @dataclass
@@ -25,27 +63,105 @@ class DetectedProject:
     dependencies_installed: bool = False
     python_version: Optional[str] = None
     node_version: Optional[str] = None
-    frameworks: List[str] = None
-
-    def __post_init__(self):
-        if self.frameworks is None:
-            self.frameworks = []
+    frameworks: List[str] = field(default_factory=list)
 
 
 class ProjectDetector:
     """Detects project type and configuration"""
 
-    def __init__(self, project_path: Path = None):
+    def __init__(self, project_path: Path = None, debug: bool = False):
         self.project_path = project_path or Path.cwd()
+        self.debug = debug
+        # Top-level entry names, snapshotted by detect()
+        self._entries: Optional[frozenset] = None
+
+    def _scan_entries(self) -> frozenset:
+        """Read the names in the project directory with a single scandir"""
+        try:
+            with os.scandir(self.project_path) as it:
+                return frozenset(entry.name for entry in it)
+        except OSError:
+            return frozenset()
+
+    def _has(self, name: str) -> bool:
+        """Check whether a top-level file or directory exists"""
+        if self._entries is None:
+            return (self.project_path / name).exists()
+        return name in self._entries
+
+    @cached_property
+    def _package_json(self) -> Optional[Dict]:
+        """
+        Parsed package.json, read once per detector
+
+        None when the file is missing; an empty dict when it cannot be parsed.
+        """
+        if not self._has("package.json"):
+            return None
+        try:
+            data = _json_loads((self.project_path / "package.json").read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    @cached_property
+    def _requirements(self) -> Optional[frozenset]:
+        """
+        Package names listed in requirements.txt, read once per detector
+
+        Comments, options such as -r/-e, version specifiers, extras and
+        markers are dropped. None when there is no requirements.txt.
+        """
+        if not self._has("requirements.txt"):
+            return None
+
+        names = set()
+        content = (self.project_path / "requirements.txt").read_text().lower()
+        for line in content.splitlines():
+            match = _REQUIREMENT_NAME.match(line.strip())
+            if match:
+                names.add(match.group().replace("_", "-"))
+        return frozenset(names)
+
+    @cached_property
+    def _node_analysis(self) -> Optional[Tuple[str, Tuple[str, ...]]]:
+        """
+        Project type and frameworks from package.json, worked out in one pass
+
+        None when there is no package.json.
+        """
+        data = self._package_json
+        if data is None:
+            return None
+
+        try:
+            deps = {
+                **data.get("dependencies", {}),
+                **data.get("devDependencies", {}),
+            }
+        except TypeError:  # dependency sections that are not objects
+            return "nodejs", ()
+
+        present = deps.keys() & (_NODE_FRAMEWORKS.keys() | {"react-dom"})
+        project_type = next(
+            (kind for dep, kind in _NODE_TYPE_PRIORITY if dep in present), "nodejs"
+        )
+        frameworks = tuple(
+            name for dep, name in _NODE_FRAMEWORKS.items() if dep in present
+        )
+        return project_type, frameworks
 
     def detect(self) -> DetectedProject:
         """Analyze the project and detect its type"""
         project_name = self.project_path.name
+        self._entries = self._scan_entries()
 
         # Check for common markers
-        has_git = (self.project_path / ".git").exists()
-        has_env = (self.project_path / ".env").exists()
-        has_docker = (self.project_path / "Dockerfile").exists()
+        has_git = self._has(".git")
+        has_env = self._has(".env")
+        has_docker = self._has("Dockerfile")
 
         # Detect project type
         project_type = self._detect_type()
@@ -54,10 +170,12 @@ class ProjectDetector:
         deps_installed = self._check_dependencies_installed()
 
         # Debug detected information
-        console.print(f"Detected project type: {project_type}")
-        console.print(f"Detected package manager: {package_manager}")
-        console.print(f"Detected frameworks: {frameworks}")
-        console.print(f"Dependencies installed: {deps_installed}")
+        if self.debug:
+            console.print(
+                f"[dim]type={project_type} pm={package_manager} "
+                f"fw={frameworks} deps={deps_installed}[/dim]",
+                highlight=False,
+            )
 
         return DetectedProject(
             type=project_type,
@@ -74,55 +192,31 @@ class ProjectDetector:
     def _detect_type(self) -> str:
         """Detect the primary project type"""
         # Check for Node.js projects
-        package_json = self.project_path / "package.json"
-        if package_json.exists():
-            try:
-                with open(package_json) as f:
-                    data = json.load(f)
-                    deps = {
-                        **data.get("dependencies", {}),
-                        **data.get("devDependencies", {}),
-                    }
-
-                    # Check for specific frameworks
-                    if "next" in deps:
-                        return "nextjs"
-                    elif "react" in deps or "react-dom" in deps:
-                        return "react"
-                    elif "vue" in deps:
-                        return "vue"
-                    elif "express" in deps:
-                        return "express"
-                    else:
-                        return "nodejs"
-            except:
-                return "nodejs"
+        if self._node_analysis is not None:
+            return self._node_analysis[0]
 
         # Check for Python projects
-        if (self.project_path / "manage.py").exists():
+        if self._has("manage.py"):
             return "django"
 
-        if (self.project_path / "main.py").exists():
+        if self._has("main.py"):
             # Check if it's FastAPI
-            req_file = self.project_path / "requirements.txt"
-            if req_file.exists():
-                content = req_file.read_text()
-                if "fastapi" in content.lower():
+            names = self._requirements
+            if names is not None:
+                if "fastapi" in names:
                     return "fastapi"
-                elif "flask" in content.lower():
+                elif "flask" in names:
                     return "flask"
             return "python"
 
-        if (self.project_path / "requirements.txt").exists():
+        if self._has("requirements.txt"):
             return "python"
 
-        if (self.project_path / "pyproject.toml").exists():
+        if self._has("pyproject.toml"):
             return "python"
 
         # Check for monorepo
-        web_dir = self.project_path / "web"
-        api_dir = self.project_path / "api"
-        if web_dir.exists() and api_dir.exists():
+        if self._has("web") and self._has("api"):
             return "monorepo"
 
         return "unknown"
@@ -130,113 +224,74 @@ class ProjectDetector:
     def _detect_package_manager(self) -> Optional[str]:
         """Detect which package manager is used"""
         # lockfile checks (keep existing order)
-        if (self.project_path / "package-lock.json").exists():
+        if self._has("package-lock.json"):
             return "npm"
-        elif (self.project_path / "yarn.lock").exists():
+        elif self._has("yarn.lock"):
             return "yarn"
-        elif (self.project_path / "pnpm-lock.yaml").exists():
+        elif self._has("pnpm-lock.yaml"):
             return "pnpm"
         # python checks (existing)
-        elif (self.project_path / "requirements.txt").exists() or (
-            self.project_path / "pyproject.toml"
-        ).exists():
+        elif self._has("requirements.txt") or self._has("pyproject.toml"):
             return "pip"
 
         # Fallback: if package.json exists, default to npm (or detect packageManager field)
-        package_json = self.project_path / "package.json"
-        if package_json.exists():
-            try:
-                data = json.loads(package_json.read_text())
-                pkg_mgr_field = data.get("packageManager")
-                if isinstance(pkg_mgr_field, str):
-                    # common format: "pnpm@8.0.0" or "yarn@1.22.0"
-                    for key in ("pnpm", "yarn", "npm"):
-                        if key in pkg_mgr_field:
-                            return key
-            except Exception:
-                pass
+        data = self._package_json
+        if data is not None:
+            pkg_mgr_field = data.get("packageManager")
+            if isinstance(pkg_mgr_field, str):
+                # common format: "pnpm@8.0.0" or "yarn@1.22.0"
+                for key in ("pnpm", "yarn", "npm"):
+                    if key in pkg_mgr_field:
+                        return key
             return "npm"
 
         return None
 
     def _detect_frameworks(self) -> List[str]:
         """Detect all frameworks and libraries used"""
-        frameworks = []
-
         # Check package.json
-        package_json = self.project_path / "package.json"
-        if package_json.exists():
-            try:
-                with open(package_json) as f:
-                    data = json.load(f)
-                    deps = {
-                        **data.get("dependencies", {}),
-                        **data.get("devDependencies", {}),
-                    }
-
-                    # Common frameworks
-                    framework_map = {
-                        "react": "React",
-                        "next": "Next.js",
-                        "vue": "Vue",
-                        "express": "Express.js",
-                        "tailwindcss": "Tailwind CSS",
-                        "typescript": "TypeScript",
-                        "vite": "Vite",
-                    }
-
-                    for key, name in framework_map.items():
-                        if key in deps:
-                            frameworks.append(name)
-            except:
-                pass
+        node_frameworks = ()
+        if self._node_analysis is not None:
+            node_frameworks = self._node_analysis[1]
 
         # Check requirements.txt
-        req_file = self.project_path / "requirements.txt"
-        if req_file.exists():
-            content = req_file.read_text().lower()
-            if "django" in content:
-                frameworks.append("Django")
-            if "fastapi" in content:
-                frameworks.append("FastAPI")
-            if "flask" in content:
-                frameworks.append("Flask")
-
-        return frameworks
+        python_frameworks = ()
+        names = self._requirements
+        if names is not None:
+            present = names & _PY_FRAMEWORKS.keys()
+            python_frameworks = tuple(
+                name for dep, name in _PY_FRAMEWORKS.items() if dep in present
+            )
+
+        return [*node_frameworks, *python_frameworks]
 
     def _check_dependencies_installed(self) -> bool:
         """Check if dependencies are installed"""
         # Check node_modules
-        if (self.project_path / "package.json").exists():
-            return (self.project_path / "node_modules").exists()
+        if self._has("package.json"):
+            return self._has("node_modules")
 
         # Check venv for Python
-        if (self.project_path / "requirements.txt").exists():
-            return (self.project_path / "venv").exists() or (
-                self.project_path / ".venv"
-            ).exists()
+        if self._has("requirements.txt"):
+            return self._has("venv") or self._has(".venv")
 
         return True  # Assume installed if we can't determine
 
     def get_missing_files(self) -> List[str]:
         """Get list of recommended files that are missing"""
-        missing = []
-
-        if not (self.project_path / ".gitignore").exists():
-            missing.append(".gitignore")
-
-        if not (self.project_path / ".env.example").exists():
-            missing.append(".env.example")
-
-        if not (self.project_path / "README.md").exists():
-            missing.append("README.md")
-
-        if not (self.project_path / "Dockerfile").exists():
-            missing.append("Dockerfile")
+        # Scanned afresh: files may have been added since detect() ran
+        entries = self._scan_entries()
+        missing = [
+            name
+            for name in (".gitignore", ".env.example", "README.md", "Dockerfile")
+            if name not in entries
+        ]
 
         # Check for CI/CD
-        github_dir = self.project_path / ".github" / "workflows"
-        if not github_dir.exists():
+        if (
+            ".github" not in entries
+            or not (self.project_path / ".github" / "workflows").exists()
+        ):
             missing.append(".github/workflows/")
 
         return missing
@@ -4,69 +4,11 @@ Docker configuration generation
 
 from pathlib import Path
 from typing import Optional
-from rich.console import Console
+from .._console import get_console
 
-console = Console()
+console = get_console()
 
-
-class DockerGenerator:
-    """Generates Docker configurations"""
-
-    def __init__(self, project_path: Path, project_type: str, project_name: str):
-        self.project_path = project_path
-        self.project_type = project_type
-        self.project_name = project_name
-
-    def generate_dockerfile(self) -> bool:
-        """Generate Dockerfile based on project type"""
-        try:
-            dockerfile_path = self.project_path / "Dockerfile"
-
-            if self.project_type in ["react", "nextjs", "vue", "nodejs"]:
-                content = self._generate_node_dockerfile()
-            elif self.project_type in ["django", "fastapi", "flask", "python"]:
-                content = self._generate_python_dockerfile()
-            else:
-                console.print(
-                    f"[yellow]⚠[/yellow] No Dockerfile template for {self.project_type}"
-                )
-                return False
-
-            dockerfile_path.write_text(content)
-            console.print(f"[green]✓[/green] Created Dockerfile")
-
-            # Also create .dockerignore
-            self._generate_dockerignore()
-
-            return True
-
-        except Exception as e:
-            console.print(f"[red]✗[/red] Failed to create Dockerfile: {e}")
-            return False
-
-    def generate_docker_compose(self, with_database: bool = False) -> bool:
-        """Generate docker-compose.yml"""
-        try:
-            compose_path = self.project_path / "docker-compose.yml"
-
-            if self.project_type == "monorepo":
-                content = self._generate_monorepo_compose(with_database)
-            else:
-                content = self._generate_single_compose(with_database)
-
-            compose_path.write_text(content)
-            console.print(f"[green]✓[/green] Created docker-compose.yml")
-
-            return True
-
-        except Exception as e:
-            console.print(f"[red]✗[/red] Failed to create docker-compose.yml: {e}")
-            return False
-
-    def _generate_node_dockerfile(self) -> str:
-        """Generate Dockerfile for Node.js projects"""
-        if self.project_type == "nextjs":
-            return f"""# Build stage
+_NEXTJS_DOCKERFILE = """# Build stage
 FROM node:20-alpine AS builder
 
 WORKDIR /app
@@ -97,8 +39,9 @@ EXPOSE 3000
 
 CMD ["node", "server.js"]
 """
-        else:  # React/Vue with Vite
-            return f"""# Build stage
+
+# React and Vue are built with Vite and served by nginx
+_VITE_DOCKERFILE = """# Build stage
 FROM node:20-alpine AS builder
 
 WORKDIR /app
@@ -127,10 +70,7 @@ EXPOSE 80
 CMD ["nginx", "-g", "daemon off;"]
 """
 
-    def _generate_python_dockerfile(self) -> str:
-        """Generate Dockerfile for Python projects"""
-        if self.project_type == "django":
-            return f"""FROM python:3.12-slim
+_DJANGO_DOCKERFILE_FMT = """FROM python:3.12-slim
 
 WORKDIR /app
 
@@ -147,10 +87,10 @@ RUN python manage.py collectstatic --noinput
 EXPOSE 8000
 
 # Run gunicorn
-CMD ["gunicorn", "--bind", "0.0.0.0:8000", "--workers", "4", "{self.project_name}.wsgi:application"]
+CMD ["gunicorn", "--bind", "0.0.0.0:8000", "--workers", "4", "{project_name}.wsgi:application"]
 """
-        elif self.project_type == "fastapi":
-            return """FROM python:3.12-slim
+
+_FASTAPI_DOCKERFILE = """FROM python:3.12-slim
 
 WORKDIR /app
 
@@ -166,8 +106,8 @@ EXPOSE 8000
 # Run uvicorn
 CMD ["uvicorn", "main:app", "--host", "0.0.0.0", "--port", "8000"]
 """
-        else:  # Generic Python
-            return """FROM python:3.12-slim
+
+_PYTHON_DOCKERFILE = """FROM python:3.12-slim
 
 WORKDIR /app
 
@@ -181,9 +121,7 @@ COPY . .
 CMD ["python", "main.py"]
 """
 
-    def _generate_dockerignore(self):
-        """Generate .dockerignore file"""
-        content = """# Dependencies
+_DOCKERIGNORE_CONTENT = """# Dependencies
 node_modules/
 npm-debug.log*
 yarn-debug.log*
@@ -226,8 +164,109 @@ Thumbs.db
 coverage/
 .pytest_cache/
 """
+
+_NGINX_CONF = r"""server {
+    listen 80;
+    server_name localhost;
+    root /usr/share/nginx/html;
+    index index.html;
+
+    location / {
+        try_files $uri $uri/ /index.html;
+    }
+
+    # Gzip compression
+    gzip on;
+    gzip_types text/plain text/css application/json application/javascript text/xml application/xml application/xml+rss text/javascript;
+
+    # Cache static assets
+    location ~* \.(jpg|jpeg|png|gif|ico|css|js)$ {
+        expires 1y;
+        add_header Cache-Control "public, immutable";
+    }
+}
+"""
+
+# Static files are encoded once and written as bytes
+_DOCKERIGNORE_BYTES = _DOCKERIGNORE_CONTENT.encode()
+_NGINX_CONF_BYTES = _NGINX_CONF.encode()
+
+# Dockerfile per project type; callables are filled in with the project name
+_DOCKERFILES = {
+    "nextjs": _NEXTJS_DOCKERFILE.encode(),
+    "react": _VITE_DOCKERFILE.encode(),
+    "vue": _VITE_DOCKERFILE.encode(),
+    "nodejs": _VITE_DOCKERFILE.encode(),
+    "django": lambda name: _DJANGO_DOCKERFILE_FMT.format(project_name=name).encode(),
+    "fastapi": _FASTAPI_DOCKERFILE.encode(),
+    "flask": _PYTHON_DOCKERFILE.encode(),
+    "python": _PYTHON_DOCKERFILE.encode(),
+}
+
+# Static sites served by nginx
+_NGINX_TYPES = frozenset({"react", "vue"})
+
+# Published port per project type in single-project compose files
+_COMPOSE_PORTS = {"react": "80:80", "vue": "80:80", "nextjs": "3000:3000"}
+
+
+class DockerGenerator:
+    """Generates Docker configurations"""
+
+    def __init__(self, project_path: Path, project_type: str, project_name: str):
+        self.project_path = project_path
+        self.project_type = project_type
+        self.project_name = project_name
+
+    def generate_dockerfile(self) -> bool:
+        """Generate Dockerfile based on project type"""
+        try:
+            dockerfile_path = self.project_path / "Dockerfile"
+
+            template = _DOCKERFILES.get(self.project_type)
+            if template is None:
+                console.print(
+                    f"[yellow]⚠[/yellow] No Dockerfile template for {self.project_type}"
+                )
+                return False
+
+            content = template(self.project_name) if callable(template) else template
+
+            dockerfile_path.write_bytes(content)
+            console.print(f"[green]✓[/green] Created Dockerfile")
+
+            # Also create .dockerignore
+            self._generate_dockerignore()
+
+            return True
+
+        except Exception as e:
+            console.print(f"[red]✗[/red] Failed to create Dockerfile: {e}")
+            return False
+
+    def generate_docker_compose(self, with_database: bool = False) -> bool:
+        """Generate docker-compose.yml"""
+        try:
+            compose_path = self.project_path / "docker-compose.yml"
+
+            if self.project_type == "monorepo":
+                content = self._generate_monorepo_compose(with_database)
+            else:
+                content = self._generate_single_compose(with_database)
+
+            compose_path.write_text(content)
+            console.print(f"[green]✓[/green] Created docker-compose.yml")
+
+            return True
+
+        except Exception as e:
+            console.print(f"[red]✗[/red] Failed to create docker-compose.yml: {e}")
+            return False
+
+    def _generate_dockerignore(self):
+        """Generate .dockerignore file"""
         dockerignore_path = self.project_path / ".dockerignore"
-        dockerignore_path.write_text(content)
+        dockerignore_path.write_bytes(_DOCKERIGNORE_BYTES)
         console.print(f"[green]✓[/green] Created .dockerignore")
 
     def _generate_single_compose(self, with_database: bool) -> str:
@@ -241,12 +280,9 @@ services:
     build: .
     ports:"""
 
-        if self.project_type in ["react", "vue"]:
-            compose += '\n      - "80:80"'
-        elif self.project_type == "nextjs":
-            compose += '\n      - "3000:3000"'
-        else:  # Python/Node APIs
-            compose += '\n      - "8000:8000"'
+        # Python/Node APIs default to 8000
+        port = _COMPOSE_PORTS.get(self.project_type, "8000:8000")
+        compose += f'\n      - "{port}"'
 
         compose += f"""
     env_file:
@@ -329,30 +365,9 @@ volumes:
 
     def generate_nginx_config(self):
         """Generate nginx.conf for React/Vue projects"""
-        if self.project_type not in ["react", "vue"]:
+        if self.project_type not in _NGINX_TYPES:
             return
 
-        nginx_config = """server {
-    listen 80;
-    server_name localhost;
-    root /usr/share/nginx/html;
-    index index.html;
-
-    location / {
-        try_files $uri $uri/ /index.html;
-    }
-
-    # Gzip compression
-    gzip on;
-    gzip_types text/plain text/css application/json application/javascript text/xml application/xml application/xml+rss text/javascript;
-
-    # Cache static assets
-    location ~* \.(jpg|jpeg|png|gif|ico|css|js)$ {
-        expires 1y;
-        add_header Cache-Control "public, immutable";
-    }
-}
-"""
         nginx_path = self.project_path / "nginx.conf"
-        nginx_path.write_text(nginx_config)
+        nginx_path.write_bytes(_NGINX_CONF_BYTES)
         console.print(f"[green]✓[/green] Created nginx.conf")
@@ -2,12 +2,47 @@
 Environment variable setup and generation
 """
 
+import io
+import os
 from pathlib import Path
-from typing import Dict, List, Optional
-from rich.console import Console
-import questionary
+from types import MappingProxyType
+from typing import Dict, List, Optional, Set, Tuple
+from .._console import get_console
 
-console = Console()
+console = get_console()
+
+# Header shared by .env and .env.example, filled with the project name
+_ENV_HEADER_TEMPLATE = (
+    "# Environment Configuration\n"
+    "# Project: {name}\n"
+    "# Generated by Scaffold CLI\n"
+    "\n"
+)
+
+_questionary = None
+
+
+def _q():
+    """Import questionary on first prompt and reuse it afterwards"""
+    global _questionary
+    if _questionary is None:
+        import questionary
+
+        _questionary = questionary
+    return _questionary
+
+
+def _classify_env_key(key: str) -> str:
+    """Pick the .env section a variable is listed under from its prefix"""
+    if key.startswith(("DATABASE", "DB_", "MONGO", "POSTGRES", "MYSQL")):
+        return "Database"
+    elif key.startswith(("EMAIL", "SENDGRID", "SMTP")):
+        return "Email"
+    elif key.startswith(("MPESA", "STRIPE")):
+        return "Payment"
+    elif key.startswith(("AWS", "S3")):
+        return "Storage"
+    return "Application"
 
 
 class EnvGenerator:
@@ -77,6 +112,50 @@ class EnvGenerator:
         },
     }
 
+    # Read-only variables per (category, service), shared with env_vars updates
+    SERVICES_FLAT = {
+        (category, service): MappingProxyType(variables)
+        for category, services in SERVICES.items()
+        for service, variables in services.items()
+    }
+
+    # Database choices offered in prompts, mapped to their SERVICES keys
+    DB_CHOICES = {
+        "PostgreSQL": "postgres",
+        "MySQL": "mysql",
+        "MongoDB": "mongodb",
+        "SQLite": "sqlite",
+    }
+
+    # Service prompts: category, checkbox label, select message and the
+    # provider choices mapped to their SERVICES keys
+    SERVICE_PROMPTS = (
+        (
+            "database",
+            "🗄️  Database",
+            "Select database:",
+            DB_CHOICES,
+        ),
+        (
+            "email",
+            "📧 Email",
+            "Select email provider:",
+            {"SMTP": "smtp", "SendGrid": "sendgrid"},
+        ),
+        (
+            "payment",
+            "💳 Payment",
+            "Select payment provider:",
+            {"M-Pesa": "mpesa", "Stripe": "stripe"},
+        ),
+        (
+            "storage",
+            "☁️  Storage",
+            "Select storage provider:",
+            {"AWS S3": "s3"},
+        ),
+    )
+
     # Base variables by project type
     BASE_VARS = {
         "react": {
@@ -111,6 +190,8 @@ class EnvGenerator:
         self.project_type = project_type
         self.project_name = project_name
         self.env_vars: Dict[str, str] = {}
+        # Service categories added so far, as shown in the summary
+        self._categories: Set[str] = set()
 
     def interactive_setup(self) -> bool:
         """Interactive environment setup"""
@@ -123,88 +204,89 @@ class EnvGenerator:
         self._add_base_variables()
 
         # Ask about services
-        if questionary.confirm(
-            "Would you like to configure additional services?", default=True
-        ).ask():
+        if (
+            _q()
+            .confirm("Would you like to configure additional services?", default=True)
+            .ask()
+        ):
             self._configure_services()
 
         return True
 
     def _add_base_variables(self):
         """Add base environment variables for the project type"""
-        base_vars = self.BASE_VARS.get(self.project_type, {})
-        for key, value in base_vars.items():
-            formatted_value = value.replace("{project_name}", self.project_name)
-            self.env_vars[key] = formatted_value
+        for key, templated, value in _BASE_VARS_COMPILED.get(self.project_type, ()):
+            if templated:
+                value = value.replace("{project_name}", self.project_name)
+            self.env_vars[key] = value
 
     def _configure_services(self):
         """Interactive service configuration"""
-        # Database
-        if questionary.confirm("🗄️  Configure database?", default=False).ask():
-            db_type = questionary.select(
-                "Select database:",
-                choices=["PostgreSQL", "MySQL", "MongoDB", "SQLite", "Skip"],
-            ).ask()
-
-            if db_type != "Skip":
-                db_key = db_type.lower().replace("sql", "")
-                if db_key in self.SERVICES["database"]:
-                    self._add_service_vars("database", db_key)
-
-        # Email
-        if questionary.confirm("📧 Configure email service?", default=False).ask():
-            email_type = questionary.select(
-                "Select email provider:", choices=["SMTP", "SendGrid", "Skip"]
-            ).ask()
-
-            if email_type != "Skip":
-                self._add_service_vars("email", email_type.lower())
-
-        # Payment
-        if questionary.confirm("💳 Configure payment gateway?", default=False).ask():
-            payment_type = questionary.select(
-                "Select payment provider:", choices=["M-Pesa", "Stripe", "Skip"]
-            ).ask()
-
-            if payment_type != "Skip":
-                payment_key = payment_type.lower().replace("-", "")
-                if payment_key in self.SERVICES["payment"]:
-                    self._add_service_vars("payment", payment_key)
-
-        # Storage
-        if questionary.confirm("☁️  Configure cloud storage?", default=False).ask():
-            storage_type = questionary.select(
-                "Select storage provider:", choices=["AWS S3", "Skip"]
-            ).ask()
-
-            if storage_type != "Skip":
-                self._add_service_vars("storage", "s3")
+        # Pick the services in one checkbox, then one provider per service;
+        # every question is asked first and the answers applied in one go
+        questions = [
+            {
+                "type": "checkbox",
+                "name": "services",
+                "message": "Select services to configure:",
+                "choices": [
+                    {"name": label, "value": category}
+                    for category, label, _, _ in self.SERVICE_PROMPTS
+                ],
+            }
+        ]
+        for category, _, select, providers in self.SERVICE_PROMPTS:
+            questions.append(
+                {
+                    "type": "select",
+                    "name": category,
+                    "message": select,
+                    "choices": list(providers),
+                    "when": lambda answers, c=category: c in answers["services"],
+                }
+            )
+
+        answers = _q().prompt(questions)
+
+        added = []
+        for category, _, _, providers in self.SERVICE_PROMPTS:
+            service = providers.get(answers.get(category))
+            if service:
+                self.env_vars.update(self.SERVICES_FLAT[(category, service)])
+                self._categories.add(category.capitalize())
+                added.append(f"[green]✓[/green] Added {service.upper()} configuration")
+
+        if added:
+            console.print("\n".join(added))
 
     def _add_service_vars(self, category: str, service: str):
         """Add service-specific variables"""
-        service_vars = self.SERVICES[category][service]
-        self.env_vars.update(service_vars)
+        self.env_vars.update(self.SERVICES_FLAT[(category, service)])
+        self._categories.add(category.capitalize())
         console.print(f"[green]✓[/green] Added {service.upper()} configuration")
 
     def generate_files(self) -> bool:
         """Generate .env and .env.example files"""
         try:
+            # Both files are rendered together from one sorted pass
+            env_content, example_content = self._format_both()
+
             # Generate .env.example with all variables
             example_path = self.project_path / ".env.example"
-            example_content = self._format_env_content(show_values=False)
             example_path.write_text(example_content)
             console.print(f"[green]✓[/green] Created .env.example")
 
             # Generate .env with actual values
             env_path = self.project_path / ".env"
-            if env_path.exists():
-                if not questionary.confirm(
-                    ".env already exists. Overwrite?", default=False
-                ).ask():
+            if os.path.lexists(env_path):
+                if (
+                    not _q()
+                    .confirm(".env already exists. Overwrite?", default=False)
+                    .ask()
+                ):
                     console.print("[yellow]⚠[/yellow] Skipped .env creation")
                     return True
 
-            env_content = self._format_env_content(show_values=True)
             env_path.write_text(env_content)
             console.print(f"[green]✓[/green] Created .env")
 
@@ -214,50 +296,65 @@ class EnvGenerator:
             console.print(f"[red]✗[/red] Failed to create env files: {e}")
             return False
 
-    def _format_env_content(self, show_values: bool = True) -> str:
-        """Format environment variables as file content"""
-        lines = [
-            "# Environment Configuration",
-            f"# Project: {self.project_name}",
-            "# Generated by Scaffold CLI",
-            "",
-        ]
-
-        # Group by category
+    def _env_rows(self) -> List[Tuple[Optional[str], str]]:
+        """Sorted keys, each paired with the section header that starts before it"""
+        rows = []
         current_category = None
-        for key in sorted(self.env_vars.keys()):
-            # Detect category from key prefix
-            if key.startswith(("DATABASE", "DB_", "MONGO", "POSTGRES", "MYSQL")):
-                category = "Database"
-            elif key.startswith(("EMAIL", "SENDGRID", "SMTP")):
-                category = "Email"
-            elif key.startswith(("MPESA", "STRIPE")):
-                category = "Payment"
-            elif key.startswith(("AWS", "S3")):
-                category = "Storage"
-            else:
-                category = "Application"
-
+        for key in sorted(self.env_vars):
+            category = _CATEGORY_INDEX.get(key) or _classify_env_key(key)
             if category != current_category:
-                lines.append(f"\n# {category}")
+                rows.append((category, key))
                 current_category = category
+            else:
+                rows.append((None, key))
+        return rows
+
+    def _format_both(self) -> Tuple[str, str]:
+        """Render the .env content and its valueless .env.example in one pass"""
+        header = _ENV_HEADER_TEMPLATE.format(name=self.project_name)
+        values = io.StringIO(header)
+        values.seek(0, io.SEEK_END)
+        example = io.StringIO(header)
+        example.seek(0, io.SEEK_END)
+
+        for category, key in self._env_rows():
+            if category is not None:
+                section = f"\n# {category}\n"
+                values.write(section)
+                example.write(section)
 
-            value = self.env_vars[key] if show_values else ""
-            lines.append(f"{key}={value}")
+            values.write(f"{key}={self.env_vars[key]}\n")
+            example.write(f"{key}=\n")
 
-        return "\n".join(lines) + "\n"
+        return values.getvalue(), example.getvalue()
+
+    def _format_env_content(self, show_values: bool = True) -> str:
+        """Format environment variables as file content"""
+        env_content, example_content = self._format_both()
+        return env_content if show_values else example_content
 
     def get_summary(self) -> Dict[str, any]:
         """Get summary of configured environment"""
-        categories = set()
-        for key in self.env_vars.keys():
-            if key.startswith(("DATABASE", "DB_")):
-                categories.add("Database")
-            elif key.startswith("EMAIL"):
-                categories.add("Email")
-            elif key.startswith(("MPESA", "STRIPE")):
-                categories.add("Payment")
-            elif key.startswith("AWS"):
-                categories.add("Storage")
-
-        return {"total_vars": len(self.env_vars), "categories": list(categories)}
+        return {
+            "total_vars": len(self.env_vars),
+            "categories": list(self._categories),
+        }
+
+
+# Section of every variable the generator knows about, classified once
+_CATEGORY_INDEX = {
+    key: _classify_env_key(key)
+    for variables in (
+        *EnvGenerator.SERVICES_FLAT.values(),
+        *EnvGenerator.BASE_VARS.values(),
+    )
+    for key in variables
+}
+
+# Base variables per project type, flagged once for the {project_name} placeholder
+_BASE_VARS_COMPILED = {
+    project_type: tuple(
+        (key, "{project_name}" in value, value) for key, value in variables.items()
+    )
+    for project_type, variables in EnvGenerator.BASE_VARS.items()
+}
@@ -2,25 +2,72 @@
 Command execution utilities
 """
 
+import os
+import shlex
+import shutil
 import subprocess
 import sys
+import threading
+from collections import deque
 from pathlib import Path
-from typing import Optional, List
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from typing import Callable, Optional, List, Sequence, Tuple, Union
+from .._console import get_console
 
-console = Console()
+console = get_console()
+
+COMMAND_TIMEOUT = 300  # 5 minutes
+OUTPUT_TAIL_LINES = 200
+PIPE_READ_SIZE = 1 << 17  # 128 KiB per read from the child's output
+PIPE_KERNEL_SIZE = 1 << 20  # requested kernel pipe buffer on Linux
+
+# Characters that need a shell: operators, expansions, globs and comments
+SHELL_METACHARACTERS = frozenset("|&;<>()$`\\*?[]{}~#=%!\n")
+
+Command = Union[str, Sequence[str]]
+
+
+def _grow_pipe(pipe):
+    """Ask the kernel for a larger pipe buffer where supported (Linux)"""
+    try:
+        import fcntl
+
+        fcntl.fcntl(pipe.fileno(), fcntl.F_SETPIPE_SZ, PIPE_KERNEL_SIZE)
+    except (ImportError, AttributeError, OSError):
+        pass
+
+
+def _prepare(command: Command) -> Tuple[Union[str, List[str]], bool]:
+    """
+    Work out how to launch a command, returning (args, shell)
+
+    Argument lists and plain "program arg ..." strings are exec'd directly,
+    skipping the /bin/sh process. Strings that use shell syntax or start with
+    a builtin such as `source` still go through the shell.
+    """
+    if not isinstance(command, str):
+        return list(command), False
+    if os.name != "posix" or SHELL_METACHARACTERS.intersection(command):
+        return command, True
+    try:
+        argv = shlex.split(command)
+    except ValueError:
+        return command, True
+    if not argv or shutil.which(argv[0]) is None:
+        return command, True
+    return argv, False
 
 
 class CommandRunner:
     """Handles running shell commands with nice output"""
 
+    _spinner_lock = threading.Lock()
+
     def __init__(self):
         self.console = console
 
     def run(
         self,
-        command: str,
+        command: Command,
         cwd: Optional[Path] = None,
         description: str = "Running command",
         show_output: bool = False,
@@ -29,7 +76,7 @@ class CommandRunner:
         Run a shell command with progress indication
 
         Args:
-            command: Command to run
+            command: Command line, or an argument list to run without a shell
             cwd: Working directory
             description: Description to show user
             show_output: Whether to show command output in real-time
@@ -43,21 +90,24 @@ class CommandRunner:
             return self._run_with_spinner(command, cwd, description)
 
     def _run_interactive(
-        self, command: str, cwd: Optional[Path], description: str
+        self, command: Command, cwd: Optional[Path], description: str
     ) -> bool:
         """Run command and show output in real-time with proper TTY"""
         console.print(f"\n[cyan]→ {description}...[/cyan]")
-        console.print(f"[dim]$ {command}[/dim]\n")
+        args, shell = _prepare(command)
+        shown = command if isinstance(command, str) else shlex.join(command)
+        console.print(f"[dim]$ {shown}[/dim]\n")
 
         try:
-            # Run with shell and inherit stdin/stdout/stderr for full interactivity
+            # Inherit stdin/stdout/stderr for full interactivity
             process = subprocess.run(
-                command,
-                shell=True,
+                args,
+                shell=shell,
                 cwd=cwd,
                 stdin=sys.stdin,
                 stdout=sys.stdout,
                 stderr=sys.stderr,
+                close_fds=False,
             )
 
             if process.returncode == 0:
@@ -74,46 +124,113 @@ class CommandRunner:
             return False
 
     def _run_with_spinner(
-        self, command: str, cwd: Optional[Path], description: str
+        self, command: Command, cwd: Optional[Path], description: str
     ) -> bool:
         """Run command with a spinner (hides output)"""
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-            transient=True,
-        ) as progress:
-            task = progress.add_task(description, total=None)
-
-            try:
-                result = subprocess.run(
-                    command,
-                    shell=True,
-                    cwd=cwd,
-                    capture_output=True,
-                    text=True,
-                    timeout=300,  # 5 minute timeout
-                )
+        # Rich allows one live display at a time, so concurrent runs go without
+        if not self._spinner_lock.acquire(blocking=False):
+            return self._run_captured(command, cwd, description)
+
+        from rich.markup import escape
+        from rich.progress import Progress, SpinnerColumn, TextColumn
 
-                if result.returncode == 0:
-                    console.print(f"[green]✓ {description}[/green]")
-                    return True
+        try:
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=console,
+                transient=True,
+            ) as progress:
+                task = progress.add_task(description, total=None)
+
+                def show_line(line: str):
+                    progress.update(
+                        task,
+                        description=f"{description} [dim]{escape(line[:60])}[/dim]",
+                    )
+
+                return self._run_captured(command, cwd, description, show_line)
+        finally:
+            self._spinner_lock.release()
+
+    def _run_captured(
+        self,
+        command: Command,
+        cwd: Optional[Path],
+        description: str,
+        on_line: Optional[Callable[[str], None]] = None,
+    ) -> bool:
+        """
+        Run command with its output captured and report the result
+
+        Output is drained in large chunks as it arrives and split into
+        lines; only the last OUTPUT_TAIL_LINES are kept to show on failure,
+        and on_line sees the newest line of each chunk.
+        """
+        args, shell = _prepare(command)
+        try:
+            process = subprocess.Popen(
+                args,
+                shell=shell,
+                cwd=cwd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                bufsize=PIPE_READ_SIZE,
+                close_fds=False,
+            )
+        except Exception as e:
+            console.print(f"[red]✗ Error: {e}[/red]")
+            return False
+
+        _grow_pipe(process.stdout)
+
+        timer = threading.Timer(COMMAND_TIMEOUT, process.kill)
+        timer.start()
+        tail = deque(maxlen=OUTPUT_TAIL_LINES)
+
+        try:
+            pending = b""
+            while True:
+                chunk = process.stdout.read1(PIPE_READ_SIZE)
+                if chunk:
+                    # Progress bars redraw with \r, so treat it as a line break
+                    *lines, pending = (
+                        (pending + chunk).replace(b"\r", b"\n").split(b"\n")
+                    )
                 else:
-                    console.print(f"[red]✗ {description} failed[/red]")
-                    if result.stderr:
-                        console.print(f"[dim]{result.stderr[:500]}[/dim]")
-                    return False
+                    lines, pending = [pending], b""
+
+                decoded = (line.decode(errors="replace").rstrip() for line in lines)
+                lines = [line for line in decoded if line]
+                if lines:
+                    tail.extend(lines)
+                    if on_line:
+                        on_line(lines[-1])
+
+                if not chunk:
+                    break
+            returncode = process.wait()
+        finally:
+            timed_out = not timer.is_alive()
+            timer.cancel()
+            process.stdout.close()
+
+        if returncode == 0:
+            console.print(f"[green]✓ {description}[/green]")
+            return True
+
+        if timed_out:
+            console.print(f"[red]✗ {description} timed out[/red]")
+            return False
 
-            except subprocess.TimeoutExpired:
-                console.print(f"[red]✗ {description} timed out[/red]")
-                return False
-            except Exception as e:
-                console.print(f"[red]✗ Error: {e}[/red]")
-                return False
+        console.print(f"[red]✗ {description} failed[/red]")
+        if tail:
+            console.print("\n".join(tail)[-500:], style="dim", markup=False)
+        return False
 
     def run_multiple(
         self,
-        commands: List[str],
+        commands: List[Command],
         cwd: Optional[Path] = None,
         descriptions: Optional[List[str]] = None,
         show_output: bool = False,
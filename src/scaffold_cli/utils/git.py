@@ -2,12 +2,48 @@
 Git operations and repository initialization
 """
 
+import os
+import shutil
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
-from rich.console import Console
+from .._console import get_console
 
-console = Console()
+console = get_console()
+
+# Fallback .gitignore for projects whose template did not ship one
+_GITIGNORE_BYTES = b"""# Dependencies
+node_modules/
+venv/
+__pycache__/
+*.pyc
+
+# Environment
+.env
+.env.local
+
+# IDE
+.vscode/
+.idea/
+*.swp
+*.swo
+
+# OS
+.DS_Store
+Thumbs.db
+
+# Build outputs
+dist/
+build/
+*.egg-info/
+"""
+
+
+@lru_cache(maxsize=1)
+def _git_available() -> bool:
+    """Whether a git executable is on PATH, looked up once per process"""
+    return shutil.which("git") is not None
 
 
 class GitManager:
@@ -18,13 +54,7 @@ class GitManager:
 
     def is_git_available(self) -> bool:
         """Check if git is installed"""
-        try:
-            result = subprocess.run(
-                ["git", "--version"], capture_output=True, timeout=5
-            )
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            return False
+        return _git_available()
 
     def init_repository(
         self,
@@ -50,75 +80,79 @@ class GitManager:
 
         try:
             # Check if already a git repo
-            git_dir = project_path / ".git"
-            if git_dir.exists():
+            if os.path.isdir(os.path.join(project_path, ".git")):
                 self.console.print("\n[dim]Git repository already initialized[/dim]")
                 return True
 
             self.console.print("\n[cyan]→ Initializing git repository...[/cyan]")
 
-            # Initialize repo
+            # Initialize repo straight onto master (git >= 2.28), falling back
+            # to pointing HEAD at master on older versions
             result = subprocess.run(
-                ["git", "init"],
+                ["git", "init", "--quiet", "--initial-branch=master"],
                 cwd=project_path,
                 capture_output=True,
+                close_fds=False,
                 text=True,
-                check=True,
             )
+            if result.returncode != 0:
+                subprocess.run(
+                    ["git", "init", "--quiet"],
+                    cwd=project_path,
+                    capture_output=True,
+                    close_fds=False,
+                    text=True,
+                    check=True,
+                )
+                subprocess.run(
+                    ["git", "symbolic-ref", "HEAD", "refs/heads/master"],
+                    cwd=project_path,
+                    capture_output=True,
+                    close_fds=False,
+                    text=True,
+                    check=True,
+                )
 
-            # Create/update .gitignore if needed
-            self._ensure_gitignore(project_path)
+            # Configure git to avoid warnings about line endings; the repo
+            # config is plain INI, so append instead of spawning `git config`
+            with open(project_path / ".git" / "config", "a") as config:
+                config.write("[core]\n\tautocrlf = input\n")
 
-            # Configure git to avoid warnings about line endings
-            subprocess.run(
-                ["git", "config", "core.autocrlf", "input"],
-                cwd=project_path,
-                capture_output=True,
-            )
+            # Fall back to a minimal .gitignore unless the template made one
+            if not os.path.lexists(os.path.join(project_path, ".gitignore")):
+                self._ensure_gitignore(project_path)
 
             # Stage all files
-            result = subprocess.run(
+            subprocess.run(
                 ["git", "add", "-A"],
                 cwd=project_path,
                 capture_output=True,
+                close_fds=False,
                 text=True,
                 check=True,
             )
 
-            # Check if there are files to commit
-            status_result = subprocess.run(
-                ["git", "status", "--porcelain"],
+            # Initial commit; git itself reports when nothing was staged
+            result = subprocess.run(
+                ["git", "commit", "--quiet", "-m", initial_message],
                 cwd=project_path,
                 capture_output=True,
+                close_fds=False,
                 text=True,
             )
 
-            if status_result.stdout.strip():
-                # Initial commit
-                result = subprocess.run(
-                    ["git", "commit", "-m", initial_message],
-                    cwd=project_path,
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
-
-                # Set default branch to master
-                subprocess.run(
-                    ["git", "branch", "-M", "master"],
-                    cwd=project_path,
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
-
+            if result.returncode == 0:
                 self.console.print(
                     "[green]✓ Git repository initialized successfully[/green]"
                 )
                 self.console.print("[dim]  → Branch: master[/dim]")
                 self.console.print("[dim]  → Initial commit created[/dim]")
-            else:
+            elif "nothing to commit" in result.stdout:
                 self.console.print("[yellow]⚠  No files to commit[/yellow]")
+            else:
+                raise subprocess.CalledProcessError(
+                    result.returncode, result.args, result.stdout, result.stderr
+                )
 
             return True
 
@@ -132,40 +166,8 @@ class GitManager:
             return False
 
     def _ensure_gitignore(self, project_path: Path):
-        """Ensure a basic .gitignore exists"""
-        gitignore_path = project_path / ".gitignore"
-
-        # Don't overwrite existing .gitignore
-        if gitignore_path.exists():
-            return
-
-        # Create a minimal .gitignore
-        basic_gitignore = """# Dependencies
-node_modules/
-venv/
-__pycache__/
-*.pyc
-
-# Environment
-.env
-.env.local
-
-# IDE
-.vscode/
-.idea/
-*.swp
-*.swo
-
-# OS
-.DS_Store
-Thumbs.db
-
-# Build outputs
-dist/
-build/
-*.egg-info/
-"""
-        gitignore_path.write_text(basic_gitignore)
+        """Write a minimal .gitignore"""
+        (project_path / ".gitignore").write_bytes(_GITIGNORE_BYTES)
 
     def get_remote_instructions(self, project_name: str) -> str:
         """Get instructions for adding a remote"""
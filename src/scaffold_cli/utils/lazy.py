@@ -0,0 +1,36 @@
+"""
+Lazy loading of module attributes
+"""
+
+import importlib
+import sys
+from typing import Callable, Dict, Tuple
+
+
+def lazy_attrs(
+    module_name: str, attrs: Dict[str, str]
+) -> Tuple[Callable[[str], object], Callable[[str], object]]:
+    """Build a module __getattr__ and loader for attributes imported on first use
+
+    attrs maps each attribute name to the (possibly relative) module it lives in.
+    Loaded values are stored in the module globals, so later lookups - and
+    anything patched onto the module - win over a fresh import.
+    """
+    module_globals = sys.modules[module_name].__dict__
+
+    def load(name: str):
+        try:
+            return module_globals[name]
+        except KeyError:
+            pass
+        module = importlib.import_module(attrs[name], module_globals["__package__"])
+        value = getattr(module, name)
+        module_globals[name] = value
+        return value
+
+    def __getattr__(name: str):
+        if name in attrs:
+            return load(name)
+        raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+
+    return __getattr__, load
@@ -2,14 +2,75 @@
 Dependency validation - checks if required tools are installed
 """
 
+import hashlib
+import json
+import os
 import shutil
-import subprocess
-import re
-from typing import Dict, List, Optional, Tuple
-from rich.console import Console
-from rich.table import Table
-
-console = Console()
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+from .._console import get_console
+
+console = get_console()
+
+_DIGITS = frozenset("0123456789")
+# Tools print their version up front; later output is banners and warnings
+VERSION_SCAN_CHARS = 256
+# How long a persisted probe result is trusted, even if PATH looks unchanged
+PROBE_CACHE_TTL = 24 * 60 * 60
+
+
+def _digit_run(text: str, start: int, end: int) -> int:
+    """Index just past the run of digits starting at start"""
+    while start < end and text[start] in _DIGITS:
+        start += 1
+    return start
+
+
+def _answers(result: Optional[Sequence], need_version: bool) -> bool:
+    """Whether a cached (available, version) result answers a check"""
+    if result is None:
+        return False
+    # Presence-only results of tools without a min_version carry no version
+    return not (need_version and result[0] and result[1] is None)
+
+
+def _js_package_version(tool_path: str, name: str) -> Optional[str]:
+    """Version from the package.json of the npm package a CLI script lives in"""
+    manifest = Path(os.path.realpath(tool_path)).parent.parent / "package.json"
+    try:
+        data = json.loads(manifest.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("name") != name:
+        return None
+    version = data.get("version")
+    return version if isinstance(version, str) else None
+
+
+def _probe_cache_file() -> Path:
+    """Location of the persisted tool probe results"""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "scaffold-cli" / "deps.json"
+
+
+def _path_fingerprint() -> str:
+    """
+    Fingerprint of PATH and the directories on it
+
+    Installing, removing or upgrading a tool touches its PATH directory, so a
+    changed fingerprint means the persisted probe results may be stale.
+    """
+    path = os.environ.get("PATH", "")
+    parts = [path]
+    for directory in path.split(os.pathsep):
+        try:
+            parts.append(str(os.stat(directory).st_mtime_ns))
+        except OSError:
+            parts.append("-")
+    return hashlib.blake2b("|".join(parts).encode(), digest_size=16).hexdigest()
 
 
 class DependencyValidator:
@@ -18,91 +79,101 @@ class DependencyValidator:
     # Tool configurations
     TOOLS = {
         "node": {
-            "check": "node --version",
+            "check": ["node", "--version"],
             "install_hint": "https://nodejs.org/",
             "min_version": "18.0.0",
             "description": "Node.js runtime",
         },
         "npm": {
-            "check": "npm --version",
+            "check": ["npm", "--version"],
             "install_hint": "https://nodejs.org/ (comes with Node.js)",
             "min_version": "9.0.0",
             "description": "Node package manager",
+            "js_package": "npm",
         },
         "python3": {
-            "check": "python3 --version",
+            "check": ["python3", "--version"],
             "install_hint": "https://python.org/",
             "min_version": "3.10.0",
             "description": "Python 3 runtime",
         },
         "pip": {
-            "check": "pip --version",
+            "check": ["pip", "--version"],
             "install_hint": "python3 -m ensurepip",
             "min_version": "20.0.0",
             "description": "Python package manager",
+            "py_module": "pip",
         },
         "django-admin": {
-            "check": "django-admin --version",
+            "check": ["django-admin", "--version"],
             "install_hint": "pip install django",
             "min_version": None,
             "description": "Django CLI",
+            "py_module": "django",
         },
         "composer": {
-            "check": "composer --version",
+            "check": ["composer", "--version"],
             "install_hint": "https://getcomposer.org/",
             "min_version": None,
             "description": "PHP dependency manager",
         },
         "git": {
-            "check": "git --version",
+            "check": ["git", "--version"],
             "install_hint": "https://git-scm.com/",
             "min_version": None,
             "description": "Git version control",
         },
         "php": {
-            "check": "php --version",
+            "check": ["php", "--version"],
             "install_hint": "https://php.net/",
             "min_version": "8.1.0",
             "description": "PHP runtime",
         },
         "go": {
-            "check": "go version",
+            "check": ["go", "version"],
             "install_hint": "https://go.dev/doc/install",
             "min_version": "1.20.0",
             "description": "Go",
         },
         "cargo": {
-            "check": "cargo --version",
+            "check": ["cargo", "--version"],
             "install_hint": "https://rustup.rs/",
             "min_version": None,
             "description": "Rust/Cargo",
         },
         "ruby": {
-            "check": "ruby --version",
+            "check": ["ruby", "--version"],
             "install_hint": "https://ruby-lang.org/",
             "min_version": "3.0.0",
             "description": "Ruby",
         },
         "rails": {
-            "check": "rails --version",
+            "check": ["rails", "--version"],
             "install_hint": "gem install rails",
             "min_version": None,
             "description": "Rails",
         },
         "flutter": {
-            "check": "flutter --version",
+            "check": ["flutter", "--version"],
             "install_hint": "https://docs.flutter.dev/",
             "min_version": None,
             "description": "Flutter",
         },
     }
+    # Names of the tools above, for membership tests
+    _KNOWN = frozenset(TOOLS)
 
-    def validate(self, required: List[str]) -> Tuple[bool, Dict[str, Dict]]:
+    def validate(
+        self, required: List[str], need_versions: bool = False
+    ) -> Tuple[bool, Dict[str, Dict]]:
         """
         Validate all required tools are available
 
         Args:
             required: List of required tool names
+            need_versions: Read every tool's version, even for tools whose
+                version is not checked and would otherwise only be looked up
+                on PATH
 
         Returns:
             Tuple of (all_valid, results_dict)
@@ -110,12 +181,35 @@ class DependencyValidator:
         results = {}
         all_valid = True
 
+        # Let a background prefetch finish rather than probe alongside it
+        if self._prefetching is not None:
+            self._prefetching.join()
+
+        tools = []
         for tool in required:
-            if tool not in self.TOOLS:
+            if tool not in self._KNOWN:
                 console.print(f"[yellow]⚠ Unknown tool: {tool}[/yellow]")
                 continue
-
-            is_available, version = self._check_tool(tool)
+            tools.append(tool)
+
+        # Each check spawns a subprocess, so run them side by side under one
+        # spinner; tools probed in this process or an earlier run are cached
+        pending = self._uncached(tools, need_versions)
+        if len(pending) > 1:
+            with console.status("[dim]Checking tools...[/dim]"):
+                self._check_tools_concurrently(pending, need_versions)
+        checks = [self._check_tool(tool, need_versions) for tool in tools]
+
+        # Probe errors are held back from the probing threads and shown here
+        for tool in tools:
+            error = self._probe_errors.pop(tool, None)
+            if error is not None:
+                console.print(f"[dim]Error checking {tool}: {error}[/dim]")
+
+        if self._dirty:
+            self._save_probe_cache()
+
+        for tool, (is_available, version) in zip(tools, checks):
             results[tool] = {
                 "available": is_available,
                 "version": version,
@@ -127,70 +221,256 @@ class DependencyValidator:
 
         return all_valid, results
 
-    def _check_tool(self, tool: str) -> Tuple[bool, Optional[str]]:
-        """Check if a single tool is available"""
-        # First check if command exists
-        tool_cmd = tool.split()[0]
-        if not shutil.which(tool_cmd):
-            return False, None
+    def prefetch(self, tools: Sequence[str]):
+        """
+        Start probing tools in the background
+
+        Meant to run while the user answers prompts, so the validate() that
+        follows finds the results already cached. Nothing is printed; probe
+        errors are kept for validate() to report.
+        """
+        pending = self._uncached([t for t in tools if t in self._KNOWN])
+        if not pending:
+            return
+
+        thread = threading.Thread(
+            target=self._check_tools_concurrently, args=(pending,), daemon=True
+        )
+        DependencyValidator._prefetching = thread
+        thread.start()
+
+    def _uncached(self, tools: List[str], need_versions: bool = False) -> List[str]:
+        """Tools with no usable result in memory or in the persisted cache"""
+        persisted = self._load_probe_cache()
+        return [
+            tool
+            for tool in tools
+            if not _answers(
+                self._checked.get(tool) or persisted.get(tool), need_versions
+            )
+        ]
+
+    def _check_tools_concurrently(self, tools: List[str], need_versions: bool = False):
+        """Check several tools side by side, filling the shared cache"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(8, len(tools))) as executor:
+            list(executor.map(self._check_tool, tools, [need_versions] * len(tools)))
+
+    # Probe results shared by every validator in this process, keyed by tool
+    _checked: Dict[str, Tuple[bool, Optional[str]]] = {}
+    # When each result in _checked was probed, possibly by an earlier run
+    _checked_at: Dict[str, float] = {}
+    # Results persisted by earlier runs, loaded on first use
+    _persisted: Optional[Dict[str, List]] = None
+    # PATH fingerprint the persisted results were loaded under
+    _persisted_path: Optional[str] = None
+    # Whether _checked holds probes that are not persisted yet
+    _dirty = False
+    # Background probe started by prefetch(), if any
+    _prefetching: Optional[threading.Thread] = None
+    # Errors from probes not yet reported by validate(), keyed by tool
+    _probe_errors: Dict[str, str] = {}
+
+    def _check_tool(
+        self, tool: str, need_version: bool = False
+    ) -> Tuple[bool, Optional[str]]:
+        """Check if a single tool is available, probing it at most once"""
+        result = self._checked.get(tool)
+        if result is None:
+            persisted = self._load_probe_cache().get(tool)
+            if persisted is not None:
+                *result, self._checked_at[tool] = persisted
+                result = self._checked[tool] = tuple(result)
+
+        # A presence-only result is probed again when its version is wanted
+        if not _answers(result, need_version):
+            result = self._checked[tool] = self._probe_tool(tool, need_version)
+            self._checked_at[tool] = time.time()
+            DependencyValidator._dirty = True
+        return result
+
+    @classmethod
+    def _load_probe_cache(cls) -> Dict[str, List]:
+        """
+        Probe results from earlier runs, if PATH has not changed since
+
+        Each entry is [available, version, checked_at]; entries older than
+        PROBE_CACHE_TTL are dropped so they get probed again.
+        """
+        if cls._persisted is None:
+            cls._persisted_path = _path_fingerprint()
+            try:
+                data = json.loads(_probe_cache_file().read_bytes())
+                valid = data.get("path") == cls._persisted_path
+                tools = data.get("tools", {}) if valid else {}
+                oldest = time.time() - PROBE_CACHE_TTL
+                cls._persisted = {
+                    tool: entry
+                    for tool, entry in tools.items()
+                    if isinstance(entry, list)
+                    and len(entry) == 3
+                    and isinstance(entry[2], (int, float))
+                    and entry[2] > oldest
+                }
+            except (OSError, ValueError, AttributeError):
+                cls._persisted = {}
+        return cls._persisted
+
+    @classmethod
+    def _save_probe_cache(cls):
+        """
+        Persist this process's probe results for later runs
+
+        Results loaded from earlier runs but not used by this one are kept,
+        as long as PATH has not changed since they were loaded.
+        """
+        cls._dirty = False
+        now = time.time()
+        persisted = cls._load_probe_cache()
+        fingerprint = _path_fingerprint()
+        tools = dict(persisted) if fingerprint == cls._persisted_path else {}
+        tools.update(
+            (tool, [*result, cls._checked_at.get(tool, now)])
+            for tool, result in cls._checked.items()
+        )
+        data = {"path": fingerprint, "tools": tools}
+        cache_file = _probe_cache_file()
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            tmp_file.write_text(json.dumps(data))
+            tmp_file.replace(cache_file)
+        except OSError:
+            pass
+
+    def _probe_tool(
+        self, tool: str, need_version: bool = False
+    ) -> Tuple[bool, Optional[str]]:
+        """Run the availability and version check for a single tool"""
+        config = self.TOOLS[tool]
+        py_module = config.get("py_module")
+        js_package = config.get("js_package")
+
+        # Only the checks that avoid spawning the tool need its path; when it
+        # is run anyway, exec does the PATH lookup itself
+        if py_module or js_package or config["min_version"] is None:
+            tool_path = shutil.which(config["check"][0])
+            if not tool_path:
+                return False, None
+
+            # Python tools installed next to this interpreter belong to its
+            # environment, so their version can be read without spawning them
+            if py_module and os.path.dirname(tool_path) == os.path.dirname(
+                sys.executable
+            ):
+                from importlib import metadata
+
+                try:
+                    return True, metadata.version(py_module)
+                except metadata.PackageNotFoundError:
+                    pass
+
+            # Node CLIs such as npm are scripts inside their package, and its
+            # package.json records the version that --version would print
+            if js_package:
+                version = _js_package_version(tool_path, js_package)
+                if version:
+                    return True, version
+
+            # Without a minimum version to meet, being on PATH is enough
+            if config["min_version"] is None and not need_version:
+                return True, None
 
         # Get version
+        import subprocess
+
         try:
-            check_cmd = self.TOOLS[tool]["check"]
             result = subprocess.run(
-                check_cmd.split(), capture_output=True, text=True, timeout=5
+                config["check"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                timeout=5,
+                close_fds=False,
             )
 
             if result.returncode != 0:
                 return False, None
 
             # Extract version from output
-            version = self._extract_version(result.stdout + result.stderr)
+            version = self._extract_version(result.stdout)
             return True, version
 
+        except FileNotFoundError:
+            return False, None
         except (subprocess.TimeoutExpired, Exception) as e:
-            console.print(f"[dim]Error checking {tool}: {e}[/dim]")
+            # Probes may run under a prompt, so leave printing to validate()
+            self._probe_errors[tool] = str(e)
             return False, None
 
     def _extract_version(self, output: str) -> str:
-        """Extract version number from command output"""
-        # Common version patterns
-        patterns = [
-            r"v?(\d+\.\d+\.\d+)",  # 1.2.3 or v1.2.3
-            r"version\s+(\d+\.\d+\.\d+)",  # version 1.2.3
-            r"(\d+\.\d+)",  # 1.2
-        ]
+        """
+        Extract version number from command output
+
+        Returns the first 1.2 or 1.2.3 version whose parts are whole digit
+        runs of at most 3, 3 and 4 digits, so a version on the first line
+        wins and long numbers are never cut down into one.
+        """
+        end = min(len(output), VERSION_SCAN_CHARS)
+        i = 0
+        while i < end:
+            if output[i] not in _DIGITS:
+                i += 1
+                continue
 
-        for pattern in patterns:
-            match = re.search(pattern, output, re.IGNORECASE)
-            if match:
-                return match.group(1)
+            major_end = _digit_run(output, i, end)
+            if major_end - i <= 3 and major_end < end and output[major_end] == ".":
+                minor_end = _digit_run(output, major_end + 1, end)
+                if 1 <= minor_end - major_end - 1 <= 3:
+                    version_end = minor_end
+                    if minor_end < end and output[minor_end] == ".":
+                        patch_end = _digit_run(output, minor_end + 1, end)
+                        if 1 <= patch_end - minor_end - 1 <= 4:
+                            version_end = patch_end
+                    return output[i:version_end]
+
+            i = major_end
 
         return "unknown"
 
     def display_results(self, results: Dict[str, Dict], show_all: bool = True):
-        """Display validation results in a nice table"""
+        """Display validation results as aligned columns"""
         if not results:
             return
 
-        table = Table(title="Dependency Check", show_header=True, header_style="bold")
-        table.add_column("Tool", style="cyan", no_wrap=True)
-        table.add_column("Status", style="white", no_wrap=True)
-        table.add_column("Version", style="dim")
-        table.add_column("Description", style="dim")
-
+        # Pad the plain text before wrapping it in markup, so columns line up
+        tool_width = max(len("Tool"), *(len(tool) for tool in results))
+        versions = {
+            tool: (info["version"] or "-") if info["available"] else "-"
+            for tool, info in results.items()
+        }
+        version_width = max(len("Version"), *(len(v) for v in versions.values()))
+
+        lines = [
+            "[bold]Dependency Check[/bold]",
+            f"[bold]{'Tool':<{tool_width}}  {'Status':<11}  "
+            f"{'Version':<{version_width}}  Description[/bold]",
+        ]
         for tool, info in results.items():
             if info["available"]:
-                status = "[green]✓ Installed[/green]"
-                version = info["version"]
+                status = f"[green]{'✓ Installed':<11}[/green]"
             else:
-                status = "[red]✗ Missing[/red]"
-                version = "-"
+                status = f"[red]{'✗ Missing':<11}[/red]"
 
             # Always show all results during validation
-            table.add_row(tool, status, version, info["config"]["description"])
+            lines.append(
+                f"[cyan]{tool:<{tool_width}}[/cyan]  {status}  "
+                f"[dim]{versions[tool]:<{version_width}}  "
+                f"{info['config']['description']}[/dim]"
+            )
 
-        console.print(table)
+        console.print("\n".join(lines))
 
     def show_installation_hints(self, results: Dict[str, Dict]):
         """Show how to install missing dependencies"""
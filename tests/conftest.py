@@ -0,0 +1,29 @@
+"""
+Shared test fixtures
+"""
+import pytest
+
+from scaffold_cli.validators.dependencies import DependencyValidator
+
+
+@pytest.fixture
+def restart_process(monkeypatch, tmp_path):
+    """
+    Start with empty in-process and on-disk probe caches
+
+    Returns a callable that drops the in-process state again, as if the next
+    scaffold run had started, while keeping the on-disk cache.
+    """
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    def restart():
+        monkeypatch.setattr(DependencyValidator, "_checked", {})
+        monkeypatch.setattr(DependencyValidator, "_checked_at", {})
+        monkeypatch.setattr(DependencyValidator, "_persisted", None)
+        monkeypatch.setattr(DependencyValidator, "_persisted_path", None)
+        monkeypatch.setattr(DependencyValidator, "_dirty", False)
+        monkeypatch.setattr(DependencyValidator, "_prefetching", None)
+        monkeypatch.setattr(DependencyValidator, "_probe_errors", {})
+
+    restart()
+    return restart
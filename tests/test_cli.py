@@ -3,6 +3,7 @@ Tests for CLI commands
 """
 from typer.testing import CliRunner
 from scaffold_cli.cli import app
+import os
 import re
 
 runner = CliRunner()
@@ -39,3 +40,26 @@ def test_new_command_help():
     assert result.exit_code == 0
     assert "Create a new project" in result.stdout
     assert "--monorepo" in output
+
+
+def test_version_picks_up_path_changes(monkeypatch, tmp_path, restart_process):
+    """Test that a tool installed onto PATH shows up on the next version run"""
+    empty_bin = tmp_path / "empty"
+    empty_bin.mkdir()
+    node_bin = tmp_path / "node-bin"
+    node_bin.mkdir()
+    node = node_bin / "node"
+    node.write_text("#!/bin/sh\necho v99.1.0\n")
+    node.chmod(0o755)
+
+    monkeypatch.setenv("PATH", str(empty_bin))
+    before = runner.invoke(app, ["version"])
+
+    monkeypatch.setenv("PATH", f"{node_bin}{os.pathsep}{empty_bin}")
+    restart_process()
+    after = runner.invoke(app, ["version"])
+
+    assert before.exit_code == 0
+    assert after.exit_code == 0
+    assert re.search(r"node\s+not found", strip_ansi(before.stdout))
+    assert re.search(r"node\s+99\.1\.0", strip_ansi(after.stdout))
@@ -0,0 +1,61 @@
+"""
+Tests for command execution
+"""
+from scaffold_cli.utils import command_runner
+from scaffold_cli.utils.command_runner import CommandRunner
+
+
+def test_run_captured_success(tmp_path):
+    """Test that a successful command reports success"""
+    runner = CommandRunner()
+
+    assert runner.run("echo hello", cwd=tmp_path, description="Echo") is True
+
+
+def test_run_captured_keeps_only_output_tail(tmp_path, monkeypatch, capsys):
+    """Test that a failing command shows the tail of its output"""
+    monkeypatch.setattr(command_runner, "OUTPUT_TAIL_LINES", 2)
+    runner = CommandRunner()
+
+    ok = runner.run(
+        "echo first; echo second; echo third; exit 3",
+        cwd=tmp_path,
+        description="Noisy",
+    )
+    output = capsys.readouterr().out
+
+    assert ok is False
+    assert "second" in output and "third" in output
+    assert "first" not in output
+
+
+def test_run_captured_splits_carriage_return_progress(tmp_path, capsys):
+    """Test that carriage-return progress redraws are kept as separate lines"""
+    runner = CommandRunner()
+
+    ok = runner.run(
+        "printf '10%%\\r100%%\\nfailed'; exit 1",
+        cwd=tmp_path,
+        description="Progress",
+    )
+    output = capsys.readouterr().out
+
+    assert ok is False
+    assert "10%\n100%\nfailed" in output
+
+
+def test_plain_commands_skip_the_shell():
+    """Test that simple command lines are exec'd directly and shell syntax is not"""
+    assert command_runner._prepare("echo hello") == (["echo", "hello"], False)
+    assert command_runner._prepare(["git", "init"]) == (["git", "init"], False)
+    assert command_runner._prepare("echo a && echo b") == ("echo a && echo b", True)
+    # builtins are not programs on PATH
+    assert command_runner._prepare("source venv/bin/activate")[1] is True
+
+
+def test_run_accepts_an_argument_list(tmp_path):
+    """Test that argv lists run without shell quoting"""
+    runner = CommandRunner()
+
+    assert runner.run(["touch", "a b.txt"], cwd=tmp_path, description="Touch")
+    assert (tmp_path / "a b.txt").exists()
@@ -40,6 +40,13 @@ def test_version_extraction():
     assert validator._extract_version("Node.js v20.0.0") == "20.0.0"
     assert validator._extract_version("version 3.10.5") == "3.10.5"
     assert validator._extract_version("9.5") == "9.5"
+    assert validator._extract_version("go version go1.21.5 linux/amd64") == "1.21.5"
+    assert validator._extract_version(
+        "pip 24.0 from /opt/lib/python3.12/site-packages/pip (python 3.12)"
+    ) == "24.0"
+    assert validator._extract_version("build 12345678.9") == "unknown"
+    assert validator._extract_version("1.2345") == "unknown"
+    assert validator._extract_version("3.12.123456") == "3.12"
 
 
 @pytest.mark.skipif(True, reason="Requires actual system tools")
@@ -51,3 +58,247 @@ def test_check_node():
     # This will depend on whether node is actually installed
     assert 'node' in results
     assert 'available' in results['node']
+
+
+def test_validate_checks_tools_concurrently(monkeypatch):
+    """Test that results keep the requested order when checked in parallel"""
+    validator = DependencyValidator()
+    monkeypatch.setattr(
+        validator, "_check_tool", lambda tool, *_: (tool != "git", "1.0.0")
+    )
+
+    all_valid, results = validator.validate(['node', 'npm', 'git'])
+
+    assert all_valid is False
+    assert list(results) == ['node', 'npm', 'git']
+    assert results['node']['available'] is True
+    assert results['git']['available'] is False
+
+
+def test_tool_checks_are_cached(monkeypatch, restart_process):
+    """Test that each tool is probed once across validators"""
+    probed = []
+    monkeypatch.setattr(
+        DependencyValidator,
+        "_probe_tool",
+        lambda self, tool, *_: probed.append(tool) or (True, "1.0.0"),
+    )
+
+    DependencyValidator().validate(['node', 'git'])
+    DependencyValidator().validate(['git'])
+
+    assert sorted(probed) == ['git', 'node']
+
+
+def test_probe_results_persist_until_path_changes(monkeypatch, restart_process):
+    """Test that a later run reuses saved probes unless PATH has changed"""
+    probed = []
+    monkeypatch.setattr(
+        DependencyValidator,
+        "_probe_tool",
+        lambda self, tool, *_: probed.append(tool) or (True, "1.0.0"),
+    )
+
+    DependencyValidator().validate(['git'])
+
+    # A new process: nothing probed in memory yet
+    restart_process()
+    all_valid, results = DependencyValidator().validate(['git'])
+
+    assert probed == ['git']
+    assert results['git']['version'] == "1.0.0"
+
+    monkeypatch.setenv("PATH", "/nonexistent")
+    restart_process()
+    DependencyValidator().validate(['git'])
+
+    assert probed == ['git', 'git']
+
+
+def test_validate_reuses_prefetched_probes(monkeypatch, restart_process):
+    """Test that validate waits for a prefetch instead of probing again"""
+    probed = []
+    monkeypatch.setattr(
+        DependencyValidator,
+        "_probe_tool",
+        lambda self, tool, *_: probed.append(tool) or (True, "1.0.0"),
+    )
+
+    DependencyValidator().prefetch(['node', 'npm', 'totally-fake-tool'])
+    all_valid, results = DependencyValidator().validate(['node', 'npm'])
+
+    assert all_valid is True
+    assert sorted(probed) == ['node', 'npm']
+
+
+def test_python_tools_next_to_interpreter_use_package_metadata(monkeypatch):
+    """Test that pip in this interpreter's environment is not spawned"""
+    import os
+    import subprocess
+    import sys
+    from importlib import metadata
+
+    monkeypatch.setattr(
+        "shutil.which",
+        lambda cmd: os.path.join(os.path.dirname(sys.executable), cmd),
+    )
+
+    def no_spawn(*args, **kwargs):
+        raise AssertionError("subprocess should not be used")
+
+    monkeypatch.setattr(subprocess, "run", no_spawn)
+
+    assert DependencyValidator()._probe_tool('pip') == (True, metadata.version('pip'))
+
+
+def test_tools_without_min_version_are_not_spawned(monkeypatch):
+    """Test that a PATH lookup is enough when no version has to be met"""
+    import subprocess
+
+    monkeypatch.setattr("shutil.which", lambda cmd: f"/usr/bin/{cmd}")
+
+    def no_spawn(*args, **kwargs):
+        raise AssertionError("subprocess should not be used")
+
+    monkeypatch.setattr(subprocess, "run", no_spawn)
+
+    assert DependencyValidator()._probe_tool('composer') == (True, None)
+
+
+def test_need_versions_reprobes_presence_only_results(monkeypatch, restart_process):
+    """Test that asking for versions runs tools the shortcut only located"""
+    import subprocess
+
+    monkeypatch.setattr("shutil.which", lambda cmd: f"/usr/bin/{cmd}")
+    monkeypatch.setattr(
+        subprocess,
+        "run",
+        lambda *args, **kwargs: subprocess.CompletedProcess(
+            args[0], 0, stdout="git version 2.43.0\n"
+        ),
+    )
+
+    _, results = DependencyValidator().validate(['git'])
+    assert results['git']['version'] is None
+
+    _, results = DependencyValidator().validate(['git'], need_versions=True)
+    assert results['git']['version'] == "2.43.0"
+
+
+def test_npm_version_is_read_from_its_package_json(monkeypatch, tmp_path):
+    """Test that npm's version comes from the package its script lives in"""
+    import subprocess
+
+    package = tmp_path / "lib" / "node_modules" / "npm"
+    (package / "bin").mkdir(parents=True)
+    (package / "bin" / "npm-cli.js").write_text("")
+    (package / "package.json").write_text('{"name": "npm", "version": "10.8.2"}')
+    (tmp_path / "npm").symlink_to(package / "bin" / "npm-cli.js")
+
+    monkeypatch.setattr("shutil.which", lambda cmd: str(tmp_path / cmd))
+
+    def no_spawn(*args, **kwargs):
+        raise AssertionError("subprocess should not be used")
+
+    monkeypatch.setattr(subprocess, "run", no_spawn)
+
+    assert DependencyValidator()._probe_tool('npm') == (True, "10.8.2")
+
+
+def test_persisted_probes_expire(monkeypatch, restart_process):
+    """Test that saved probes older than the TTL are probed again"""
+    from scaffold_cli.validators import dependencies
+
+    probed = []
+    monkeypatch.setattr(
+        DependencyValidator,
+        "_probe_tool",
+        lambda self, tool, *_: probed.append(tool) or (True, "1.0.0"),
+    )
+
+    DependencyValidator().validate(['git'])
+
+    monkeypatch.setattr(dependencies, "PROBE_CACHE_TTL", 0)
+    restart_process()
+    DependencyValidator().validate(['git'])
+
+    assert probed == ['git', 'git']
+
+
+def test_missing_tool_is_found_missing_by_running_it(monkeypatch):
+    """Test that tools which get spawned anyway skip the PATH lookup"""
+    import subprocess
+
+    def no_which(cmd):
+        raise AssertionError("shutil.which should not be used")
+
+    def not_found(*args, **kwargs):
+        raise FileNotFoundError(args[0][0])
+
+    monkeypatch.setattr("shutil.which", no_which)
+    monkeypatch.setattr(subprocess, "run", not_found)
+
+    assert DependencyValidator()._probe_tool('node') == (False, None)
+
+
+def test_saving_keeps_persisted_probes_this_run_did_not_use(
+    monkeypatch, restart_process
+):
+    """Test that runs checking disjoint tools do not evict each other"""
+    probed = []
+    monkeypatch.setattr(
+        DependencyValidator,
+        "_probe_tool",
+        lambda self, tool, *_: probed.append(tool) or (True, "1.0.0"),
+    )
+
+    DependencyValidator().validate(['git', 'python3'])
+
+    restart_process()
+    DependencyValidator().validate(['pip'])
+
+    restart_process()
+    DependencyValidator().validate(['git', 'python3', 'pip'])
+
+    assert sorted(probed) == ['git', 'pip', 'python3']
+
+
+def test_warm_disk_cache_skips_the_probe_pool(monkeypatch, restart_process):
+    """Test that tools cached by an earlier run are not sent to the pool"""
+    monkeypatch.setattr(
+        DependencyValidator, "_probe_tool", lambda self, tool, *_: (True, "1.0.0")
+    )
+    DependencyValidator().validate(['git', 'python3'])
+
+    restart_process()
+
+    def no_pool(self, tools):
+        raise AssertionError(f"{tools} should come from the disk cache")
+
+    monkeypatch.setattr(DependencyValidator, "_check_tools_concurrently", no_pool)
+
+    all_valid, results = DependencyValidator().validate(['git', 'python3'])
+
+    assert all_valid is True
+    assert list(results) == ['git', 'python3']
+
+
+def test_prefetch_errors_are_reported_by_validate(
+    monkeypatch, restart_process, capsys
+):
+    """Test that a failing background probe prints nothing until validate"""
+    import subprocess
+
+    def stalled(*args, **kwargs):
+        raise subprocess.TimeoutExpired(args[0], 5)
+
+    monkeypatch.setattr(subprocess, "run", stalled)
+
+    DependencyValidator().prefetch(['node'])
+    DependencyValidator._prefetching.join()
+    assert capsys.readouterr().out == ""
+
+    all_valid, _ = DependencyValidator().validate(['node'])
+
+    assert all_valid is False
+    assert "Error checking node" in capsys.readouterr().out
@@ -0,0 +1,57 @@
+"""
+Tests for environment file generation
+"""
+import questionary
+
+from scaffold_cli.generators.env_generator import EnvGenerator
+
+
+def fake_prompt(replies):
+    """Answer prompt() questions from replies, honouring each question's `when`"""
+
+    def prompt(questions):
+        answers = {}
+        for question in questions:
+            when = question.get("when")
+            if when is None or when(answers):
+                answers[question["name"]] = replies[question["name"]]
+        return answers
+
+    return prompt
+
+
+def test_services_are_asked_up_front_then_applied(tmp_path, monkeypatch):
+    """Test that only checked services are configured, with their providers"""
+    monkeypatch.setattr(
+        questionary,
+        "prompt",
+        fake_prompt(
+            {
+                "services": ["database", "storage"],
+                "database": "PostgreSQL",
+                "email": "SMTP",
+                "payment": "Stripe",
+                "storage": "AWS S3",
+            }
+        ),
+    )
+
+    env_gen = EnvGenerator(tmp_path, "fastapi", "demo")
+    env_gen._configure_services()
+
+    assert env_gen.env_vars["DATABASE_URL"].startswith("postgresql://")
+    assert env_gen.env_vars["AWS_REGION"] == "us-east-1"
+    assert "EMAIL_HOST" not in env_gen.env_vars
+    assert "STRIPE_SECRET_KEY" not in env_gen.env_vars
+    assert sorted(env_gen.get_summary()["categories"]) == ["Database", "Storage"]
+
+
+def test_cancelled_service_prompt_adds_nothing(tmp_path, monkeypatch):
+    """Test that an interrupted prompt (empty answers) leaves variables untouched"""
+    monkeypatch.setattr(questionary, "prompt", lambda questions: {})
+
+    env_gen = EnvGenerator(tmp_path, "fastapi", "demo")
+    env_gen._configure_services()
+
+    assert env_gen.env_vars == {}
+    assert env_gen.get_summary() == {"total_vars": 0, "categories": []}
@@ -0,0 +1,52 @@
+"""
+Tests for git repository initialization
+"""
+import subprocess
+
+import pytest
+
+from scaffold_cli.utils.git import GitManager
+
+pytestmark = pytest.mark.skipif(
+    not GitManager().is_git_available(), reason="Requires git"
+)
+
+
+@pytest.fixture(autouse=True)
+def git_identity(monkeypatch, tmp_path):
+    """Give git an identity and keep user/system config out of the way"""
+    monkeypatch.setenv("GIT_CONFIG_GLOBAL", str(tmp_path / "gitconfig"))
+    monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", "1")
+    for var in ("GIT_AUTHOR", "GIT_COMMITTER"):
+        monkeypatch.setenv(f"{var}_NAME", "Test")
+        monkeypatch.setenv(f"{var}_EMAIL", "test@example.com")
+
+
+def git(project, *args):
+    return subprocess.run(
+        ["git", *args], cwd=project, capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+def test_init_repository_commits_on_master(tmp_path):
+    """Test that the first commit lands on master with autocrlf configured"""
+    project = tmp_path / "demo"
+    project.mkdir()
+    (project / "main.py").write_text("print('hi')\n")
+
+    assert GitManager().init_repository(project, "Initial commit - demo") is True
+
+    assert git(project, "branch", "--show-current") == "master"
+    assert git(project, "log", "--format=%s") == "Initial commit - demo"
+    assert git(project, "config", "core.autocrlf") == "input"
+    assert ".gitignore" in git(project, "ls-files")
+
+
+def test_init_repository_without_files_to_commit(tmp_path, capsys):
+    """Test that an empty, fully ignored project still initializes"""
+    project = tmp_path / "empty"
+    project.mkdir()
+    (project / ".gitignore").write_text("*\n")
+
+    assert GitManager().init_repository(project) is True
+    assert "No files to commit" in capsys.readouterr().out
@@ -145,11 +145,16 @@ def test_full_run_flow_monkeypatched(monkeypatch, tmp_path):
 
     # Monkeypatch detector to return our project
     monkeypatch.setattr(ProjectDetector, "detect", lambda self: project)
+    # keep the tool probe cache out of the real home directory
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / ".cache"))
 
     # monkeypatch questionary.confirm to always return True
     import questionary
     monkeypatch.setattr(questionary, "confirm", lambda *a,
                         **kw: type("A", (), {"ask": lambda self: True})())
+    # and questionary.checkbox to select every offered step
+    monkeypatch.setattr(questionary, "checkbox", lambda *a, choices=(),
+                        **kw: type("A", (), {"ask": lambda self: [c.value for c in choices]})())
 
     # patch CommandRunner and GitManager and generators
     dummy_runner = DummyRunner()
@@ -0,0 +1,110 @@
+"""
+Tests for project installation
+"""
+from scaffold_cli.core.installer import Installer, _TEMPLATE_SPECS
+from scaffold_cli.core.project_types import ProjectConfig
+
+
+def test_parallel_post_install_runs_every_step(tmp_path):
+    """Test that parallel post-install runs all steps and tolerates failures"""
+    config = ProjectConfig(
+        name="demo",
+        display_name="Demo",
+        category="api",
+        command="true",
+        requires=[],
+        post_install=["touch a.txt", "false", "touch b.txt"],
+        post_install_parallel=True,
+    )
+
+    installer = Installer()
+    assert installer._run_post_install(config, tmp_path) is True
+
+    assert (tmp_path / "a.txt").exists()
+    assert (tmp_path / "b.txt").exists()
+
+
+def test_parallel_post_install_kills_a_hung_step(tmp_path, monkeypatch, capsys):
+    """Test that a step running past the timeout is killed and reported"""
+    import time
+
+    from scaffold_cli.core import installer
+
+    monkeypatch.setattr(installer, "COMMAND_TIMEOUT", 0.5)
+    config = ProjectConfig(
+        name="demo",
+        display_name="Demo",
+        category="api",
+        command="true",
+        requires=[],
+        post_install=["sleep 30", "touch done.txt"],
+        post_install_parallel=True,
+    )
+
+    started = time.monotonic()
+    assert Installer()._run_post_install(config, tmp_path) is True
+
+    assert time.monotonic() - started < 10
+    assert (tmp_path / "done.txt").exists()
+    output = capsys.readouterr().out
+    assert "Post-install step failed: sleep 30" in output
+    assert "Timed out" in output
+
+
+def test_custom_template_writes_nested_files(tmp_path):
+    """Test that template files, including ones in subdirectories, are written"""
+    project_path = tmp_path / "demo-api"
+
+    assert Installer()._render_spec(_TEMPLATE_SPECS["express-ts"], project_path)
+
+    assert (project_path / "package.json").read_text().startswith(
+        '{"name": "demo-api",'
+    )
+    assert (project_path / "src" / "index.ts").exists()
+    assert (project_path / "tsconfig.json").exists()
+
+
+def test_rust_project_from_bundled_skeleton(tmp_path):
+    """Test that Rust templates are laid down without running cargo"""
+    project_path = tmp_path / "demo-cli"
+
+    assert Installer()._render_spec(_TEMPLATE_SPECS["rust-cli-clap"], project_path)
+
+    cargo_toml = (project_path / "Cargo.toml").read_text()
+    assert 'name = "demo-cli"' in cargo_toml
+    assert cargo_toml.count("[dependencies]") == 1
+    assert 'clap = { version = "4.4"' in cargo_toml
+    assert (project_path / ".gitignore").read_text() == "/target\n"
+    assert "clap::{Parser, Subcommand}" in (project_path / "src" / "main.rs").read_text()
+    assert not list(project_path.rglob("*.tmpl"))
+
+
+def test_install_many_runs_independent_projects(tmp_path):
+    """Test that several non-interactive projects are created in one batch"""
+    def custom(name):
+        return ProjectConfig(
+            name=name,
+            display_name=name,
+            category="api",
+            command=f"custom:{name}",
+            requires=[],
+            interactive=False,
+        )
+
+    results = Installer().install_many(
+        [(custom("fastapi"), "api"), (custom("flask"), "worker")],
+        parent_dir=tmp_path,
+    )
+
+    assert results == {"api": True, "worker": True}
+    assert (tmp_path / "api" / "main.py").exists()
+    assert (tmp_path / "worker" / "app.py").exists()
+
+
+def test_every_custom_type_has_a_template_spec():
+    """Test that each custom:<type> project maps to a built-in template"""
+    from scaffold_cli.core.project_types import get_all_projects
+
+    for project in get_all_projects():
+        if project.custom_type:
+            assert project.custom_type in _TEMPLATE_SPECS, project.name
@@ -51,15 +51,15 @@ def test_orchestrator_initialization():
 
 @patch("scaffold_cli.core.orchestrator.DependencyValidator")
 @patch("scaffold_cli.core.orchestrator.Installer")
-@patch("scaffold_cli.core.orchestrator.get_projects_by_category")
+@patch("scaffold_cli.core.orchestrator.get_project_display_names")
 @patch("scaffold_cli.core.orchestrator.get_project_categories")
-@patch("scaffold_cli.core.orchestrator.questionary")
+@patch("scaffold_cli.core.orchestrator._questionary")
 @patch("scaffold_cli.core.orchestrator.Path")
 def test_create_single_project_flow(
     mock_path,
     mock_questionary,
     mock_categories,
-    mock_projects_by_cat,
+    mock_display_names,
     mock_installer,
     mock_validator,
     mock_single_project_config
@@ -76,7 +76,7 @@ def test_create_single_project_flow(
 
     # Fake project types
     mock_categories.return_value = ["frontend"]
-    mock_projects_by_cat.return_value = [mock_single_project_config]
+    mock_display_names.return_value = (mock_single_project_config.display_name,)
 
     # Dependency validator
     mock_validator.return_value.validate_and_report.return_value = True
@@ -98,13 +98,13 @@ def test_create_single_project_flow(
 
 @patch("scaffold_cli.core.orchestrator.DependencyValidator")
 @patch("scaffold_cli.core.orchestrator.Installer")
-@patch("scaffold_cli.core.orchestrator.get_projects_by_category")
-@patch("scaffold_cli.core.orchestrator.questionary")
+@patch("scaffold_cli.core.orchestrator.get_project_display_names")
+@patch("scaffold_cli.core.orchestrator._questionary")
 @patch("scaffold_cli.core.orchestrator.Path")
 def test_create_monorepo_flow(
     mock_path,
     mock_questionary,
-    mock_projects_by_cat,
+    mock_display_names,
     mock_installer,
     mock_validator,
     mock_single_project_config,
@@ -122,14 +122,15 @@ def test_create_monorepo_flow(
     ]
 
     # Fake category lookups
-    mock_projects_by_cat.side_effect = [
-        [mock_single_project_config],  # frontend list
-        [mock_backend_project_config],  # backend list
+    mock_display_names.side_effect = [
+        (mock_single_project_config.display_name,),  # frontend list
+        (mock_backend_project_config.display_name,),  # backend list
     ]
 
     # Mocks
     mock_validator.return_value.validate_and_report.return_value = True
     mock_installer.return_value.install.return_value = True
+    mock_installer.return_value.install_many.return_value = {"web": True, "api": True}
 
     orchestrator = ProjectOrchestrator()
     result = orchestrator.create_project()
@@ -142,7 +143,7 @@ def test_create_monorepo_flow(
 # CANCEL HANDLING (CTRL+C)
 # ---------------------------------------------------------------------------
 
-@patch("scaffold_cli.core.orchestrator.questionary")
+@patch("scaffold_cli.core.orchestrator._questionary")
 @patch("scaffold_cli.core.orchestrator.Path")
 def test_cancel_on_ctrl_c(mock_path, mock_questionary):
     mock_path.return_value.exists.return_value = False
@@ -158,10 +159,10 @@ def test_cancel_on_ctrl_c(mock_path, mock_questionary):
 # EXISTING DIRECTORY HANDLING
 # ---------------------------------------------------------------------------
 
-@patch("scaffold_cli.core.orchestrator.questionary")
-@patch("scaffold_cli.core.orchestrator.Path")
-def test_existing_directory_overwrite_declined(mock_path, mock_questionary):
-    mock_path.return_value.exists.return_value = True
+@patch("scaffold_cli.core.orchestrator._questionary")
+def test_existing_directory_overwrite_declined(mock_questionary, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "existing-project").mkdir()
     mock_questionary.text.return_value.ask.return_value = "existing-project"
     mock_questionary.confirm.return_value.ask.return_value = False  # decline overwrite
 
@@ -169,3 +170,49 @@ def test_existing_directory_overwrite_declined(mock_path, mock_questionary):
     result = orchestrator.create_project(name="existing-project")
 
     assert result is False
+
+
+# ---------------------------------------------------------------------------
+# TEMPLATE ENVIRONMENT SETUP
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize(
+    "choice, url",
+    [
+        ("PostgreSQL", "DATABASE_URL=postgresql://"),
+        ("MySQL", "DATABASE_URL=mysql://"),
+        ("MongoDB", "MONGODB_URL=mongodb://"),
+    ],
+)
+@patch("scaffold_cli.core.orchestrator._questionary")
+def test_monorepo_environment_maps_database_choice(
+    mock_questionary, choice, url, tmp_path
+):
+    (tmp_path / "web").mkdir()
+    (tmp_path / "api").mkdir()
+    mock_questionary.confirm.return_value.ask.return_value = True
+    mock_questionary.select.return_value.ask.return_value = choice
+
+    ProjectOrchestrator()._setup_monorepo_environment(tmp_path, "demo", None)
+
+    assert url in (tmp_path / "api" / ".env").read_text()
+
+
+@pytest.mark.parametrize("choice", ["PostgreSQL", "MySQL", "SQLite"])
+@patch("scaffold_cli.core.orchestrator._questionary")
+def test_template_environment_maps_sql_database_choice(
+    mock_questionary, choice, tmp_path
+):
+    from scaffold_cli.core.quick_templates import QUICK_TEMPLATES
+
+    template = next(
+        t for t in QUICK_TEMPLATES.values() if "database" in t.recommended_services
+    )
+    mock_questionary.confirm.return_value.ask.return_value = True
+    mock_questionary.select.return_value.ask.return_value = choice
+
+    ProjectOrchestrator()._setup_template_environment(
+        tmp_path, "demo", "python", template
+    )
+
+    assert "DATABASE_URL=" in (tmp_path / ".env").read_text()
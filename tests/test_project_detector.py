@@ -0,0 +1,90 @@
+"""
+Tests for project detection
+"""
+from scaffold_cli.detectors.project_detector import ProjectDetector
+
+
+def test_detects_node_project_from_package_json(tmp_path):
+    """Test that type, package manager and frameworks come from package.json"""
+    (tmp_path / "package.json").write_text(
+        '{"packageManager": "pnpm@8.0.0",'
+        ' "dependencies": {"next": "14", "react": "18"},'
+        ' "devDependencies": {"typescript": "5"}}'
+    )
+
+    project = ProjectDetector(tmp_path).detect()
+
+    assert project.type == "nextjs"
+    assert project.package_manager == "pnpm"
+    assert project.frameworks == ["React", "Next.js", "TypeScript"]
+
+
+def test_unparsable_package_json_is_still_a_node_project(tmp_path):
+    """Test that a broken package.json falls back to a plain npm project"""
+    (tmp_path / "package.json").write_text("{not json")
+
+    project = ProjectDetector(tmp_path).detect()
+
+    assert project.type == "nodejs"
+    assert project.package_manager == "npm"
+    assert project.frameworks == []
+
+
+def test_react_dom_alone_marks_a_react_project(tmp_path):
+    """Test that react-dom decides the type without being listed as a framework"""
+    (tmp_path / "package.json").write_text(
+        '{"dependencies": {"react-dom": "18", "express": "4"}}'
+    )
+
+    project = ProjectDetector(tmp_path).detect()
+
+    assert project.type == "react"
+    assert project.frameworks == ["Express.js"]
+
+
+def test_detects_fastapi_from_requirements(tmp_path):
+    """Test that requirements.txt drives both the type and the frameworks"""
+    (tmp_path / "main.py").write_text("")
+    (tmp_path / "requirements.txt").write_text("FastAPI==0.110\nuvicorn\n")
+
+    project = ProjectDetector(tmp_path).detect()
+
+    assert project.type == "fastapi"
+    assert project.package_manager == "pip"
+    assert project.frameworks == ["FastAPI"]
+
+
+def test_malformed_dependency_sections_fall_back_to_nodejs(tmp_path):
+    """Test that non-object dependency sections do not break detection"""
+    (tmp_path / "package.json").write_text('{"dependencies": ["react"]}')
+
+    project = ProjectDetector(tmp_path).detect()
+
+    assert project.type == "nodejs"
+    assert project.frameworks == []
+
+
+def test_requirements_are_matched_by_package_name(tmp_path):
+    """Test that comments and look-alike packages are not taken as frameworks"""
+    (tmp_path / "requirements.txt").write_text(
+        "# not using flask here\n"
+        "-r base.txt\n"
+        "Django[argon2]>=5.0 ; python_version >= '3.10'\n"
+        "fastapi-users==13.0\n"
+    )
+
+    project = ProjectDetector(tmp_path).detect()
+
+    assert project.type == "python"
+    assert project.frameworks == ["Django"]
+
+
+def test_missing_files_reflect_the_current_directory(tmp_path):
+    """Test that files created after detect() are no longer reported missing"""
+    detector = ProjectDetector(tmp_path)
+    detector.detect()
+
+    (tmp_path / "README.md").write_text("# demo\n")
+    (tmp_path / ".github" / "workflows").mkdir(parents=True)
+
+    assert detector.get_missing_files() == [".gitignore", ".env.example", "Dockerfile"]
@@ -1,13 +1,16 @@
 """
 Tests for project_types module
 """
+import dataclasses
+
 import pytest
 from scaffold_cli.core.project_types import (
     ProjectConfig,
     PROJECTS,
     get_project_categories,
     get_projects_by_category,
-    get_project_by_name
+    get_project_by_name,
+    get_project_by_display_name,
 )
 
 
@@ -25,7 +28,14 @@ def test_project_config_creation():
     assert config.display_name == 'Test React'
     assert config.category == 'frontend'
     assert config.interactive is True
-    assert config.post_install == []
+    assert config.post_install == ()
+    assert config.requires == ('node', 'npm')
+    assert config.needs_name_format is True
+    assert config.has_post_install is False
+    assert config.custom_type is None
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.name = 'renamed'
+    assert not hasattr(config, '__dict__')
 
 
 def test_projects_registry_structure():
@@ -60,7 +70,7 @@ def test_get_projects_by_category():
 def test_get_projects_by_invalid_category():
     """Test getting projects from non-existent category"""
     projects = get_projects_by_category('invalid')
-    assert projects == []
+    assert projects == ()
 
 
 def test_get_project_by_name():
@@ -78,6 +88,15 @@ def test_get_project_by_invalid_name():
     assert project is None
 
 
+def test_get_project_by_display_name():
+    """Test finding a project within a category by its display name"""
+    project = get_project_by_display_name('frontend', 'React (Vite)')
+
+    assert project is not None
+    assert project.name == 'react-vite'
+    assert get_project_by_display_name('api', 'React (Vite)') is None
+
+
 def test_all_projects_have_required_fields():
     """Test that all projects have required fields"""
     for category, projects in PROJECTS.items():
@@ -87,7 +106,7 @@ def test_all_projects_have_required_fields():
             assert project.category == category
             assert project.command
             assert project.requires
-            assert isinstance(project.requires, list)
+            assert isinstance(project.requires, tuple)
 
 
 def test_command_has_name_placeholder():
@@ -0,0 +1,25 @@
+"""
+Tests for quick_templates module
+"""
+from scaffold_cli.core.quick_templates import (
+    QUICK_TEMPLATES,
+    get_template_choices,
+    get_template_from_choice,
+)
+
+
+def test_every_choice_maps_back_to_its_template():
+    """Test that each template choice resolves to the template it was built from"""
+    for template in QUICK_TEMPLATES.values():
+        choice = f"{template.emoji} {template.name}"
+        assert choice in get_template_choices()
+        assert get_template_from_choice(choice) is template
+
+
+def test_category_headers_and_unknown_choices_resolve_to_none():
+    """Test that headers and unknown strings do not match any template"""
+    headers = [c for c in get_template_choices() if "─────" in c]
+
+    assert headers
+    assert all(get_template_from_choice(h) is None for h in headers)
+    assert get_template_from_choice("React") is None